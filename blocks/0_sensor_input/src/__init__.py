@@ -2,6 +2,6 @@
 # Monocular camera capture and health monitoring
 
 from .sensor import SensorManager
-from .interfaces import FrameMetadata, HealthState
+from .interfaces import FrameMetadata, HealthState, SensorInput, SensorIssue
 
-__all__ = ['SensorManager', 'FrameMetadata', 'HealthState']
+__all__ = ['SensorManager', 'FrameMetadata', 'HealthState', 'SensorInput', 'SensorIssue']
@@ -1,8 +1,71 @@
 # Block 0: Primary Camera Interface
 # Sony IMX490 HDR camera
 
+import threading
+import time
+from typing import Callable, Optional
 import numpy as np
 from ..config import SENSOR_PARAMS
+from .v4l2 import V4L2Capture
+
+# capture() waits at most this many frame periods for the first frame
+CAPTURE_TIMEOUT_FRAMES = 3
+
+# Shared read-only placeholder frame until the real driver lands
+_W, _H = SENSOR_PARAMS['primary_camera']['resolution']
+_PLACEHOLDER = np.zeros((_H, _W, 3), dtype=np.uint8)
+_PLACEHOLDER.setflags(write=False)
+
+
+class _CaptureThread(threading.Thread):
+    """
+    Producer thread that continuously pulls frames from the driver.
+    
+    Only the most recent frame is kept; consumers never block on the
+    driver, they just take a reference to the latest buffer. A driver
+    error stops the loop and is re-raised to consumers by latest().
+    """
+    
+    def __init__(self, read_frame: Callable[[], np.ndarray], name: str):
+        super().__init__(name=name, daemon=True)
+        self._read_frame = read_frame
+        self._lock = threading.Lock()
+        self._latest: Optional[np.ndarray] = None
+        self._error: Optional[BaseException] = None
+        self._ready = threading.Event()
+        self._stop_event = threading.Event()
+    
+    def run(self):
+        try:
+            while not self._stop_event.is_set():
+                buf = self._read_frame()
+                with self._lock:
+                    self._latest = buf
+                self._ready.set()
+        except Exception as e:
+            # Wake waiting consumers; latest() reports the failure
+            self._error = e
+            self._ready.set()
+    
+    def latest(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        Most recent frame (waits only until the first one arrives).
+        
+        Returns None if no frame arrived within `timeout`; raises
+        RuntimeError if the driver read failed (stale frames are never
+        served after a failure).
+        """
+        if not self._ready.wait(timeout):
+            return None
+        if self._error is not None:
+            raise RuntimeError(f"{self.name}: frame read failed") from self._error
+        with self._lock:
+            return self._latest
+    
+    def stop(self, timeout: Optional[float] = None):
+        """Signal shutdown and wait for the loop to exit."""
+        self._stop_event.set()
+        self.join(timeout)
 
 
 class PrimaryCamera:
@@ -16,32 +79,59 @@ class PrimaryCamera:
     - FoV: 90° wide angle
     """
     
+    __slots__ = ('config', 'resolution', 'fps', 'hdr_enabled', '_initialized',
+                 '_thread', '_v4l2')
+    
     def __init__(self):
         self.config = SENSOR_PARAMS['primary_camera']
         self.resolution = self.config['resolution']
         self.fps = self.config['fps']
         self.hdr_enabled = self.config['hdr_enabled']
         self._initialized = False
+        self._thread = None
+        self._v4l2 = None
     
     def initialize(self):
         """Initialize camera hardware."""
         # TODO: GMSL2 initialization
+        if self.config.get('device'):
+            # Zero-copy: frames are views into the driver's DMA buffers
+            self._v4l2 = V4L2Capture(self.config['device'], self.resolution).open()
         self._initialized = True
     
-    def capture(self) -> np.ndarray:
+    def start(self):
+        """Start the background capture thread."""
+        if self._thread is not None:
+            return
+        if not self._initialized:
+            self.initialize()
+        self._thread = _CaptureThread(self._read_frame, name='primary-capture')
+        self._thread.start()
+    
+    def capture(self) -> Optional[np.ndarray]:
         """
-        Capture single frame.
+        Get the most recent frame (non-blocking once streaming).
         
         Returns:
-            RGB frame [H, W, 3] uint8
+            RGB frame [H, W, 3] uint8, or None if no frame arrived within
+            CAPTURE_TIMEOUT_FRAMES frame periods
+        
+        Raises:
+            RuntimeError: if the capture thread's driver read failed
         """
-        if not self._initialized:
-            self.initialize()
+        if self._thread is None:
+            self.start()
+        return self._thread.latest(timeout=CAPTURE_TIMEOUT_FRAMES / self.fps)
+    
+    def _read_frame(self) -> np.ndarray:
+        """Blocking driver read. (capture thread)"""
+        if self._v4l2 is not None:
+            return self._v4l2.read()
         
-        # TODO: Actual camera capture
-        # For now, return placeholder
-        h, w = self.resolution[1], self.resolution[0]
-        return np.zeros((h, w, 3), dtype=np.uint8)
+        # TODO: replace with real GMSL2 DMA buffers
+        # For now, pace at the sensor rate and return the shared placeholder
+        time.sleep(1.0 / self.fps)
+        return _PLACEHOLDER
     
     def set_exposure(self, exposure_ms: float):
         """Set exposure time."""
@@ -57,4 +147,10 @@ class PrimaryCamera:
     
     def shutdown(self):
         """Clean shutdown."""
+        if self._thread is not None:
+            self._thread.stop(timeout=1.0)
+            self._thread = None
+        if self._v4l2 is not None:
+            self._v4l2.close()
+            self._v4l2 = None
         self._initialized = False
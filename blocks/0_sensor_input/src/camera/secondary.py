@@ -1,8 +1,17 @@
 # Block 0: Secondary Camera Interface
 # Optional telephoto camera for long-range detection
 
+import time
+from typing import Optional
 import numpy as np
 from ..config import SENSOR_PARAMS
+from .primary import CAPTURE_TIMEOUT_FRAMES, _CaptureThread
+from .v4l2 import V4L2Capture
+
+# Shared read-only placeholder frame until the real driver lands
+_W, _H = SENSOR_PARAMS['secondary_camera']['resolution']
+_PLACEHOLDER = np.zeros((_H, _W, 3), dtype=np.uint8)
+_PLACEHOLDER.setflags(write=False)
 
 
 class SecondaryCamera:
@@ -15,37 +24,70 @@ class SecondaryCamera:
     - FoV: 15° telephoto
     """
     
+    __slots__ = ('config', 'enabled', 'resolution', 'fps', '_initialized',
+                 '_thread', '_v4l2')
+    
     def __init__(self):
         self.config = SENSOR_PARAMS['secondary_camera']
         self.enabled = self.config['enabled']
         self.resolution = self.config['resolution']
         self.fps = self.config['fps']
         self._initialized = False
+        self._thread = None
+        self._v4l2 = None
     
     def initialize(self):
         """Initialize camera hardware."""
         if not self.enabled:
             return
         # TODO: Secondary camera initialization
+        if self.config.get('device'):
+            # Zero-copy: frames are views into the driver's DMA buffers
+            self._v4l2 = V4L2Capture(self.config['device'], self.resolution).open()
         self._initialized = True
     
-    def capture(self) -> np.ndarray:
+    def start(self):
+        """Start the background capture thread."""
+        if not self.enabled or self._thread is not None:
+            return
+        if not self._initialized:
+            self.initialize()
+        self._thread = _CaptureThread(self._read_frame, name='secondary-capture')
+        self._thread.start()
+    
+    def capture(self) -> Optional[np.ndarray]:
         """
-        Capture single frame.
+        Get the most recent frame (non-blocking once streaming).
         
         Returns:
-            RGB frame [H, W, 3] uint8 or None if disabled
+            RGB frame [H, W, 3] uint8, or None if disabled or no frame
+            arrived within CAPTURE_TIMEOUT_FRAMES frame periods
+        
+        Raises:
+            RuntimeError: if the capture thread's driver read failed
         """
         if not self.enabled:
             return None
         
-        if not self._initialized:
-            self.initialize()
+        if self._thread is None:
+            self.start()
+        return self._thread.latest(timeout=CAPTURE_TIMEOUT_FRAMES / self.fps)
+    
+    def _read_frame(self) -> np.ndarray:
+        """Blocking driver read. (capture thread)"""
+        if self._v4l2 is not None:
+            return self._v4l2.read()
         
-        # TODO: Actual camera capture
-        h, w = self.resolution[1], self.resolution[0]
-        return np.zeros((h, w, 3), dtype=np.uint8)
+        # TODO: replace with real driver DMA buffers
+        time.sleep(1.0 / self.fps)
+        return _PLACEHOLDER
     
     def shutdown(self):
         """Clean shutdown."""
+        if self._thread is not None:
+            self._thread.stop(timeout=1.0)
+            self._thread = None
+        if self._v4l2 is not None:
+            self._v4l2.close()
+            self._v4l2 = None
         self._initialized = False
@@ -0,0 +1,206 @@
+# Block 0: V4L2 Zero-Copy Capture
+# Memory-mapped driver buffers exposed as NumPy views (no memcpy per frame)
+
+import ctypes
+import fcntl
+import mmap
+import os
+from collections import deque
+from typing import List, Tuple
+import numpy as np
+
+
+# --- ioctl encoding (linux/ioctl.h) ---
+def _ioc(direction: int, nr: int, size: int) -> int:
+    return (direction << 30) | (size << 16) | (ord('V') << 8) | nr
+
+
+def _iow(nr: int, struct) -> int:
+    return _ioc(1, nr, ctypes.sizeof(struct))
+
+
+def _iowr(nr: int, struct) -> int:
+    return _ioc(3, nr, ctypes.sizeof(struct))
+
+
+# --- linux/videodev2.h subset ---
+V4L2_BUF_TYPE_VIDEO_CAPTURE = 1
+V4L2_MEMORY_MMAP = 1
+V4L2_FIELD_NONE = 1
+V4L2_PIX_FMT_RGB24 = int.from_bytes(b'RGB3', 'little')
+
+
+class _Timeval(ctypes.Structure):
+    _fields_ = [('tv_sec', ctypes.c_long), ('tv_usec', ctypes.c_long)]
+
+
+class _Timecode(ctypes.Structure):
+    _fields_ = [
+        ('type', ctypes.c_uint32), ('flags', ctypes.c_uint32),
+        ('frames', ctypes.c_uint8), ('seconds', ctypes.c_uint8),
+        ('minutes', ctypes.c_uint8), ('hours', ctypes.c_uint8),
+        ('userbits', ctypes.c_uint8 * 4),
+    ]
+
+
+class _BufferM(ctypes.Union):
+    _fields_ = [
+        ('offset', ctypes.c_uint32), ('userptr', ctypes.c_ulong),
+        ('planes', ctypes.c_void_p), ('fd', ctypes.c_int32),
+    ]
+
+
+class _Buffer(ctypes.Structure):
+    _fields_ = [
+        ('index', ctypes.c_uint32), ('type', ctypes.c_uint32),
+        ('bytesused', ctypes.c_uint32), ('flags', ctypes.c_uint32),
+        ('field', ctypes.c_uint32), ('timestamp', _Timeval),
+        ('timecode', _Timecode), ('sequence', ctypes.c_uint32),
+        ('memory', ctypes.c_uint32), ('m', _BufferM),
+        ('length', ctypes.c_uint32), ('reserved2', ctypes.c_uint32),
+        ('request_fd', ctypes.c_int32),
+    ]
+
+
+class _RequestBuffers(ctypes.Structure):
+    _fields_ = [
+        ('count', ctypes.c_uint32), ('type', ctypes.c_uint32),
+        ('memory', ctypes.c_uint32), ('capabilities', ctypes.c_uint32),
+        ('flags', ctypes.c_uint8), ('reserved', ctypes.c_uint8 * 3),
+    ]
+
+
+class _PixFormat(ctypes.Structure):
+    _fields_ = [
+        ('width', ctypes.c_uint32), ('height', ctypes.c_uint32),
+        ('pixelformat', ctypes.c_uint32), ('field', ctypes.c_uint32),
+        ('bytesperline', ctypes.c_uint32), ('sizeimage', ctypes.c_uint32),
+        ('colorspace', ctypes.c_uint32), ('priv', ctypes.c_uint32),
+        ('flags', ctypes.c_uint32), ('ycbcr_enc', ctypes.c_uint32),
+        ('quantization', ctypes.c_uint32), ('xfer_func', ctypes.c_uint32),
+    ]
+
+
+class _FormatUnion(ctypes.Union):
+    _fields_ = [
+        ('pix', _PixFormat), ('raw_data', ctypes.c_uint8 * 200),
+        ('_align', ctypes.c_void_p),
+    ]
+
+
+class _Format(ctypes.Structure):
+    _fields_ = [('type', ctypes.c_uint32), ('fmt', _FormatUnion)]
+
+
+VIDIOC_S_FMT = _iowr(5, _Format)
+VIDIOC_REQBUFS = _iowr(8, _RequestBuffers)
+VIDIOC_QUERYBUF = _iowr(9, _Buffer)
+VIDIOC_QBUF = _iowr(15, _Buffer)
+VIDIOC_DQBUF = _iowr(17, _Buffer)
+VIDIOC_STREAMON = _iow(18, ctypes.c_int)
+VIDIOC_STREAMOFF = _iow(19, ctypes.c_int)
+
+
+class V4L2Capture:
+    """
+    Zero-copy V4L2 capture using driver-allocated MMAP buffers.
+    
+    Each driver buffer is mapped once and wrapped as an [H, W, 3] uint8
+    view. read() dequeues the next filled buffer and returns its view
+    directly; the most recent `hold` buffers stay out of the driver
+    queue so consumers can keep reading them while the next frames
+    are DMA'd into the remaining buffers.
+    
+    Consumers must be done with a frame within `hold` frame periods.
+    """
+    
+    def __init__(
+        self,
+        device: str,
+        resolution: Tuple[int, int],
+        num_buffers: int = 4,
+        hold: int = 2
+    ):
+        self.device = device
+        self.width, self.height = resolution
+        self.num_buffers = num_buffers
+        self.hold = hold
+        self._fd = -1
+        self._maps: List[mmap.mmap] = []
+        self._views: List[np.ndarray] = []
+        self._held = deque()
+    
+    def open(self) -> 'V4L2Capture':
+        """Negotiate RGB24, map driver buffers and start streaming."""
+        self._fd = os.open(self.device, os.O_RDWR)
+        
+        fmt = _Format(type=V4L2_BUF_TYPE_VIDEO_CAPTURE)
+        fmt.fmt.pix.width = self.width
+        fmt.fmt.pix.height = self.height
+        fmt.fmt.pix.pixelformat = V4L2_PIX_FMT_RGB24
+        fmt.fmt.pix.field = V4L2_FIELD_NONE
+        fcntl.ioctl(self._fd, VIDIOC_S_FMT, fmt)
+        bytesperline = fmt.fmt.pix.bytesperline or self.width * 3
+        
+        req = _RequestBuffers(
+            count=self.num_buffers,
+            type=V4L2_BUF_TYPE_VIDEO_CAPTURE,
+            memory=V4L2_MEMORY_MMAP
+        )
+        fcntl.ioctl(self._fd, VIDIOC_REQBUFS, req)
+        
+        for i in range(req.count):
+            buf = self._buffer(i)
+            fcntl.ioctl(self._fd, VIDIOC_QUERYBUF, buf)
+            mm = mmap.mmap(
+                self._fd, buf.length,
+                flags=mmap.MAP_SHARED, prot=mmap.PROT_READ,
+                offset=buf.m.offset
+            )
+            view = np.ndarray(
+                shape=(fmt.fmt.pix.height, fmt.fmt.pix.width, 3),
+                dtype=np.uint8,
+                buffer=mm,
+                strides=(bytesperline, 3, 1)
+            )
+            self._maps.append(mm)
+            self._views.append(view)
+            fcntl.ioctl(self._fd, VIDIOC_QBUF, buf)
+        
+        fcntl.ioctl(self._fd, VIDIOC_STREAMON, ctypes.c_int(V4L2_BUF_TYPE_VIDEO_CAPTURE))
+        return self
+    
+    def read(self) -> np.ndarray:
+        """Block until the next frame; returns a view into the DMA buffer."""
+        buf = self._buffer(0)
+        fcntl.ioctl(self._fd, VIDIOC_DQBUF, buf)
+        
+        self._held.append(buf.index)
+        if len(self._held) > self.hold:
+            fcntl.ioctl(self._fd, VIDIOC_QBUF, self._buffer(self._held.popleft()))
+        
+        return self._views[buf.index]
+    
+    def close(self):
+        """Stop streaming and unmap buffers."""
+        if self._fd < 0:
+            return
+        fcntl.ioctl(self._fd, VIDIOC_STREAMOFF, ctypes.c_int(V4L2_BUF_TYPE_VIDEO_CAPTURE))
+        self._views.clear()
+        self._held.clear()
+        for mm in self._maps:
+            try:
+                mm.close()
+            except BufferError:
+                pass  # A consumer still references the frame; freed with it
+        self._maps.clear()
+        os.close(self._fd)
+        self._fd = -1
+    
+    @staticmethod
+    def _buffer(index: int) -> _Buffer:
+        return _Buffer(
+            index=index,
+            type=V4L2_BUF_TYPE_VIDEO_CAPTURE,
+            memory=V4L2_MEMORY_MMAP
+        )
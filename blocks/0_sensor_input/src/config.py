@@ -9,6 +9,7 @@ SENSOR_PARAMS = {
         'hdr_enabled': True,
         'dynamic_range_db': 120,
         'interface': 'GMSL2',
+        'device': None,  # V4L2 node (e.g. '/dev/video0'); None = placeholder
         'fov': 90  # degrees
     },
     'secondary_camera': {
@@ -16,6 +17,7 @@ SENSOR_PARAMS = {
         'resolution': (1920, 1080),
         'fps': 30,
         'fov': 15,  # Telephoto
+        'device': None,  # V4L2 node; None = placeholder
         'purpose': 'long_range'
     },
     'health': {
@@ -37,6 +39,9 @@ SENSOR_PARAMS = {
 # Expected timing
 EXPECTED_FRAME_DELTA_US = 16667  # 60 fps = 16.67 ms
 
+# Frames of history kept for health checks
+FRAME_HISTORY_LEN = 5
+
 # Timing budget (ms)
 TIMING = {
     'camera_capture': 16.67,
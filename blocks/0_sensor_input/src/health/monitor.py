@@ -1,14 +1,34 @@
 # Block 0: Sensor Health Monitor
 # Continuous sensor quality checks
 
-from typing import List
-from ..interfaces import FrameMetadata, HealthState
+from typing import Optional, Sequence
+import numpy as np
+from ..interfaces import FrameMetadata, HealthState, SensorIssue
 from ..config import SENSOR_PARAMS, EXPECTED_FRAME_DELTA_US
 
+# Health thresholds (resolved once, not per frame)
+_H = SENSOR_PARAMS['health']
+_THERMAL_CRIT = _H['thermal_critical_c']
+_THERMAL_WARN = _H['thermal_warning_c']
+_JITTER_TOL_US = int(_H['fps_jitter_tolerance_ms'] * 1000)
+_MIN_BRIGHTNESS = _H['min_brightness_threshold']
+_MAX_BRIGHTNESS = _H['max_brightness_threshold']
+
+# Issues that force FAULT
+_CRITICAL = (
+    SensorIssue.THERMAL_CRITICAL
+    | SensorIssue.LENS_BLOCKED
+    | SensorIssue.NO_SIGNAL
+)
+
+# Fraction of pixels that must fall outside the threshold
+_UNIFORM_FRACTION = 0.98
+
 
 def check_sensor_health(
     metadata: FrameMetadata,
-    prev_frames: List[FrameMetadata]
+    prev_frames: Sequence[FrameMetadata],
+    ts_history: Optional[np.ndarray] = None
 ) -> HealthState:
     """
     Continuous sensor health monitoring.
@@ -21,32 +41,32 @@ def check_sensor_health(
     Args:
         metadata: Current frame metadata
         prev_frames: Previous frame metadata list
+        ts_history: Optional timestamps [N] (µs), oldest to newest,
+            ending with the current frame
         
     Returns:
         HealthState: OK | DEGRADED | FAULT
     """
-    health_params = SENSOR_PARAMS['health']
-    issues = []
+    issues = SensorIssue.NONE
     
     # Temperature check
-    if metadata.temperature_c > health_params['thermal_critical_c']:
-        issues.append('THERMAL_CRITICAL')
-    elif metadata.temperature_c > health_params['thermal_warning_c']:
-        issues.append('THERMAL_WARNING')
+    if metadata.temperature_c > _THERMAL_CRIT:
+        issues |= SensorIssue.THERMAL_CRITICAL
+    elif metadata.temperature_c > _THERMAL_WARN:
+        issues |= SensorIssue.THERMAL_WARNING
     
-    # FPS jitter check
-    if prev_frames:
+    # FPS jitter check (integer µs throughout)
+    if ts_history is not None:
+        if len(ts_history) >= 2:
+            if frame_jitter_us(ts_history)[-1] > _JITTER_TOL_US:
+                issues |= SensorIssue.FPS_JITTER
+    elif prev_frames:
         frame_delta = metadata.timestamp - prev_frames[-1].timestamp
-        expected_delta = EXPECTED_FRAME_DELTA_US
-        jitter_ms = abs(frame_delta - expected_delta) / 1000
-        
-        if jitter_ms > health_params['fps_jitter_tolerance_ms']:
-            issues.append('FPS_JITTER')
+        if abs(frame_delta - EXPECTED_FRAME_DELTA_US) > _JITTER_TOL_US:
+            issues |= SensorIssue.FPS_JITTER
     
     # Determine health state
-    critical_issues = ['THERMAL_CRITICAL', 'LENS_BLOCKED', 'NO_SIGNAL']
-    
-    if any(issue in critical_issues for issue in issues):
+    if issues & _CRITICAL:
         return HealthState.FAULT
     elif issues:
         return HealthState.DEGRADED
@@ -54,6 +74,19 @@ def check_sensor_health(
     return HealthState.OK
 
 
+def frame_jitter_us(ts_history: np.ndarray) -> np.ndarray:
+    """
+    Per-interval deviation from the nominal frame period.
+    
+    Args:
+        ts_history: Timestamps [N] (µs, int64), oldest to newest
+        
+    Returns:
+        Jitter [N-1] in µs (int64)
+    """
+    return np.abs(np.diff(ts_history) - EXPECTED_FRAME_DELTA_US)
+
+
 def is_uniformly_dark(frame) -> bool:
     """
     Check if frame is uniformly dark (lens blocked).
@@ -67,8 +100,8 @@ def is_uniformly_dark(frame) -> bool:
     if frame is None:
         return True
     
-    # TODO: Implement brightness analysis
-    return False
+    hist = _luma_histogram(frame)
+    return hist[:_MIN_BRIGHTNESS].sum() > _UNIFORM_FRACTION * hist.sum()
 
 
 def is_uniformly_bright(frame) -> bool:
@@ -84,5 +117,20 @@ def is_uniformly_bright(frame) -> bool:
     if frame is None:
         return False
     
-    # TODO: Implement brightness analysis
-    return False
+    hist = _luma_histogram(frame)
+    return hist[_MAX_BRIGHTNESS:].sum() > _UNIFORM_FRACTION * hist.sum()
+
+
+def _luma_histogram(frame: np.ndarray) -> np.ndarray:
+    """
+    256-bin luma histogram in a single vectorized pass.
+    
+    Uses the integer approximation (R + 2G + B) / 4 to avoid
+    float conversion of the full frame.
+    """
+    gray = (
+        frame[..., 0].astype(np.uint16)
+        + (frame[..., 1].astype(np.uint16) << 1)
+        + frame[..., 2]
+    ) >> 2
+    return np.bincount(gray.ravel(), minlength=256)
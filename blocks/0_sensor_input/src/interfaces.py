@@ -2,7 +2,7 @@
 # FrameMetadata, HealthState, and related structures
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntFlag
 from typing import Optional
 import numpy as np
 
@@ -14,12 +14,22 @@ class HealthState(Enum):
     FAULT = 'FAULT'         # Critical failure (no signal, lens blocked)
 
 
-@dataclass
+class SensorIssue(IntFlag):
+    """Health check findings (bitmask)."""
+    NONE = 0
+    THERMAL_CRITICAL = 1
+    THERMAL_WARNING = 2
+    FPS_JITTER = 4
+    LENS_BLOCKED = 8
+    NO_SIGNAL = 16
+
+
+@dataclass(slots=True, frozen=True)
 class FrameMetadata:
     """
     Metadata for captured frame.
     """
-    timestamp: float        # Capture time (µs precision)
+    timestamp: int          # Capture time (µs, monotonic clock)
     frame_id: int           # Sequential counter
     exposure_ms: float      # Current exposure
     gain_db: float          # Current gain
@@ -27,7 +37,7 @@ class FrameMetadata:
     hdr_enabled: bool       # HDR mode active
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CameraSpec:
     """Camera hardware specification."""
     resolution: tuple       # (width, height)
@@ -37,7 +47,7 @@ class CameraSpec:
     fov: float              # Field of view (degrees)
 
 
-@dataclass
+@dataclass(slots=True)
 class SensorInput:
     """Complete sensor input package."""
     frame: np.ndarray       # [H, W, 3] RGB frame
@@ -45,7 +55,7 @@ class SensorInput:
     health_status: HealthState
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SecondaryFrame:
     """Optional secondary camera frame."""
     frame: np.ndarray
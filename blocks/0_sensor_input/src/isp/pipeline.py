@@ -17,8 +17,19 @@ class ISPPipeline:
     5. GAMMA CORRECTION: sRGB curve
     """
     
+    __slots__ = ('config', '_gamma_lut', '_wb_gains', '_lut')
+    
     def __init__(self):
         self.config = SENSOR_PARAMS['isp']
+        
+        # sRGB gamma curve as an 8-bit LUT (pow evaluated once, not per frame)
+        g = self.config['gamma']
+        self._gamma_lut = np.clip(
+            np.round((np.arange(256) / 255.0) ** (1.0 / g) * 255.0), 0, 255
+        ).astype(np.uint8)
+        
+        self._wb_gains = np.ones(3, dtype=np.float64)
+        self._lut = self._build_lut(self._wb_gains)
     
     def process(self, raw_frame: np.ndarray) -> np.ndarray:
         """
@@ -38,16 +49,18 @@ class ISPPipeline:
         # 2. Denoise
         rgb = self._denoise(rgb)
         
-        # 3. HDR Tone Mapping
-        rgb = self._tone_map(rgb)
-        
-        # 4. White Balance
-        rgb = self._white_balance(rgb)
-        
-        # 5. Gamma Correction
-        rgb = self._gamma_correct(rgb)
+        # 3-5. Tone mapping + white balance + gamma (single fused pass)
+        return self._fuse_tm_wb_gamma(rgb)
+    
+    def set_white_balance(self, gains: np.ndarray):
+        """
+        Update per-channel white balance gains (from AWB statistics).
         
-        return rgb
+        Args:
+            gains: [3] RGB gains
+        """
+        self._wb_gains = np.asarray(gains, dtype=np.float64)
+        self._lut = self._build_lut(self._wb_gains)
     
     def _demosaic(self, raw: np.ndarray) -> np.ndarray:
         """Bayer to RGB conversion."""
@@ -59,18 +72,44 @@ class ISPPipeline:
         # TODO: Implement denoising
         return rgb
     
-    def _tone_map(self, rgb: np.ndarray) -> np.ndarray:
-        """HDR tone mapping (120dB → 8-bit)."""
-        # TODO: Implement Reinhard tone mapping
-        return rgb
+    def _fuse_tm_wb_gamma(self, rgb: np.ndarray) -> np.ndarray:
+        """
+        Apply tone map, white balance and gamma in one pass.
+        
+        All three stages are per-channel point operations on 8-bit
+        values, so they collapse into a single [3, 256] table lookup
+        (each pixel is read and written exactly once).
+        
+        Args:
+            rgb: [H, W, 3] uint8
+            
+        Returns:
+            [H, W, 3] uint8
+        """
+        out = np.empty_like(rgb)
+        for c in range(3):
+            out[..., c] = np.take(self._lut[c], rgb[..., c])
+        return out
     
-    def _white_balance(self, rgb: np.ndarray) -> np.ndarray:
-        """Auto white balance."""
-        # TODO: Implement AWB
-        return rgb
+    def _build_lut(self, wb_gains: np.ndarray) -> np.ndarray:
+        """Compose tone map → white balance → gamma into a [3, 256] LUT."""
+        x = np.arange(256, dtype=np.float64) / 255.0
+        
+        # 3. HDR Tone Mapping
+        x = self._tone_curve(x)
+        
+        # 4. White Balance
+        x = np.clip(wb_gains[:, None] * x[None, :], 0.0, 1.0)
+        x = np.round(x * 255.0).astype(np.uint8)
+        
+        # 5. Gamma Correction
+        return self._gamma_correct(x)
     
     def _gamma_correct(self, rgb: np.ndarray) -> np.ndarray:
-        """sRGB gamma correction."""
-        gamma = self.config['gamma']
-        # TODO: Apply gamma curve
-        return rgb
+        """sRGB gamma correction (8-bit LUT)."""
+        return self._gamma_lut[rgb]
+    
+    def _tone_curve(self, x: np.ndarray) -> np.ndarray:
+        """HDR tone mapping curve (120dB → 8-bit) on normalized values."""
+        # TODO: Implement Reinhard tone mapping (needs >8-bit sensor input)
+        return x
@@ -1,12 +1,19 @@
 # Block 0: Sensor Input - Entry Point
 # Camera capture and health monitoring
 
+import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from typing import Optional, Tuple
 import numpy as np
 
-from .interfaces import FrameMetadata, HealthState
-from .config import SENSOR_PARAMS
+from .interfaces import FrameMetadata, HealthState, SensorInput
+from .config import SENSOR_PARAMS, FRAME_HISTORY_LEN
+from .camera.primary import PrimaryCamera
+from .camera.secondary import SecondaryCamera
+from .health.monitor import check_sensor_health
+
+_monotonic_ns = time.monotonic_ns
 
 
 class SensorManager:
@@ -22,66 +29,72 @@ class SensorManager:
     Timing: 16 ms per frame (60 fps)
     """
     
+    __slots__ = ('params', 'frame_counter', 'prev_frames', '_ts_history', '_ts_head',
+                 '_primary_camera', '_secondary_camera', '_health_monitor')
+    
     def __init__(self):
         self.params = SENSOR_PARAMS
         self.frame_counter = 0
-        self.prev_frames = []
+        self.prev_frames = deque(maxlen=FRAME_HISTORY_LEN)
+        
+        # Timestamp ring (SoA view of prev_frames for vectorized jitter stats)
+        self._ts_history = np.zeros(FRAME_HISTORY_LEN, dtype=np.int64)
+        self._ts_head = 0
         
         # Components
         self._primary_camera = None
         self._secondary_camera = None
         self._health_monitor = None
     
-    def capture(self) -> Dict:
+    def capture(self) -> SensorInput:
         """
         Capture frame from primary camera.
         
         Returns:
-            Dict with 'frame', 'metadata', 'health_status'
+            SensorInput with frame, metadata, health_status
         """
         # 1. Capture from camera
         frame = self._capture_primary()
         
         # 2. Generate metadata
         metadata = self._generate_metadata()
+        self._ts_history[self._ts_head] = metadata.timestamp
+        self._ts_head = (self._ts_head + 1) % FRAME_HISTORY_LEN
         
         # 3. Check sensor health
         health_status = self._check_health(metadata)
         
-        # 4. Store for history
+        # 4. Store for history (bounded, oldest evicted)
         self.prev_frames.append(metadata)
-        if len(self.prev_frames) > 5:
-            self.prev_frames.pop(0)
         
         self.frame_counter += 1
         
-        return {
-            'frame': frame,
-            'metadata': metadata,
-            'health_status': health_status
-        }
+        return SensorInput(
+            frame=frame,
+            metadata=metadata,
+            health_status=health_status
+        )
     
-    def _capture_primary(self) -> np.ndarray:
-        """Capture from primary HDR camera. (16 ms @ 60fps)"""
-        from .camera.primary import PrimaryCamera
+    def _capture_primary(self) -> Optional[np.ndarray]:
+        """Latest frame from primary HDR camera (capture runs on its own thread)."""
         if self._primary_camera is None:
             self._primary_camera = PrimaryCamera()
+            self._primary_camera.start()
         return self._primary_camera.capture()
     
     def _capture_secondary(self) -> Optional[np.ndarray]:
         """Capture from secondary telephoto camera (optional)."""
         if not self.params['secondary_camera']['enabled']:
             return None
-        from .camera.secondary import SecondaryCamera
         if self._secondary_camera is None:
             self._secondary_camera = SecondaryCamera()
+            self._secondary_camera.start()
         return self._secondary_camera.capture()
     
     def _generate_metadata(self) -> FrameMetadata:
         """Generate frame metadata."""
-        import time
         return FrameMetadata(
-            timestamp=time.time() * 1e6,  # microseconds
+            timestamp=_monotonic_ns() // 1000,  # microseconds (monotonic)
             frame_id=self.frame_counter,
             exposure_ms=16.0,
             gain_db=0.0,
@@ -91,8 +104,14 @@ class SensorManager:
     
     def _check_health(self, metadata: FrameMetadata) -> HealthState:
         """Check sensor health status. (<1 ms)"""
-        from .health.monitor import check_sensor_health
-        return check_sensor_health(metadata, self.prev_frames)
+        return check_sensor_health(
+            metadata, self.prev_frames, ts_history=self._timestamp_window()
+        )
+    
+    def _timestamp_window(self) -> np.ndarray:
+        """Recorded timestamps, oldest to newest (includes current frame)."""
+        n = min(self.frame_counter + 1, FRAME_HISTORY_LEN)
+        return np.roll(self._ts_history, -self._ts_head)[FRAME_HISTORY_LEN - n:]
     
     def initialize(self):
         """Initialize camera and ISP."""
@@ -100,4 +119,8 @@ class SensorManager:
     
     def shutdown(self):
         """Clean shutdown of sensors."""
-        pass
+        for camera in (self._primary_camera, self._secondary_camera):
+            if camera is not None:
+                camera.shutdown()
+        self._primary_camera = None
+        self._secondary_camera = None
@@ -1,5 +1,6 @@
 # Block 1: Calibration - System Mode and Degraded Detection
 
+from collections import deque
 from enum import Enum
 from dataclasses import dataclass
 from typing import Optional
@@ -30,7 +31,7 @@ class DegradedReason(Enum):
     CALIBRATION_DRIFT = "calibration_drift"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModeStatus:
     """Current system mode status with probabilities."""
     mode: SystemMode
@@ -44,7 +45,25 @@ class ModeStatus:
     # Recommendation for operator
     recommendation: str = "NORMAL_OPERATION"
     
+    # Serialized field names, in to_tuple() order
+    KEYS = (
+        "mode", "confidence_score", "degraded_reason",
+        "P_alert_correct", "P_miss", "recommendation"
+    )
+    
+    def to_tuple(self) -> tuple:
+        """Allocation-light telemetry row (values in KEYS order)."""
+        return (
+            self.mode.value,
+            self.confidence_score,
+            self.degraded_reason.value,
+            self.p_alert_correct,
+            self.p_miss,
+            self.recommendation
+        )
+    
     def to_dict(self) -> dict:
+        # Literal keys compile to a constant-key map (faster than dict(zip(...)))
         return {
             "mode": self.mode.value,
             "confidence_score": self.confidence_score,
@@ -69,9 +88,18 @@ class DegradedModeDetector:
     - Missed obstacles (false negative rate) - CRITICAL
     """
     
+    # Candidate reasons, in tie-break order (see _infer_reason)
+    _REASONS = (
+        DegradedReason.RAIL_OCCLUSION,
+        DegradedReason.CALIBRATION_DRIFT,
+        DegradedReason.LOW_CONTRAST,
+        DegradedReason.TUNNEL_DARK,
+    )
+    
     def __init__(self):
-        self.confidence_history = []
         self.max_history = 30  # ~1 second at 30 FPS
+        self.confidence_history = deque(maxlen=self.max_history)
+        self._confidence_sum = 0.0  # Running sum of confidence_history
         
         # Thresholds
         self.nominal_threshold = 0.80
@@ -104,13 +132,14 @@ class DegradedModeDetector:
             detection_confidence * 0.20
         )
         
-        # Track history for smoothing
+        # Track history for smoothing (O(1) running sum)
+        if len(self.confidence_history) == self.max_history:
+            self._confidence_sum -= self.confidence_history[0]
         self.confidence_history.append(overall_confidence)
-        if len(self.confidence_history) > self.max_history:
-            self.confidence_history.pop(0)
+        self._confidence_sum += overall_confidence
         
         # Smoothed confidence
-        avg_confidence = sum(self.confidence_history) / len(self.confidence_history)
+        avg_confidence = self._confidence_sum / len(self.confidence_history)
         
         # Determine mode
         if avg_confidence >= self.nominal_threshold:
@@ -157,16 +186,17 @@ class DegradedModeDetector:
     ) -> DegradedReason:
         """Infer the most likely reason for degraded mode."""
         
-        # Find the lowest confidence factor
-        factors = {
-            DegradedReason.RAIL_OCCLUSION: rail_visibility,
-            DegradedReason.CALIBRATION_DRIFT: calibration_confidence,
-            DegradedReason.LOW_CONTRAST: depth_confidence,
-            DegradedReason.TUNNEL_DARK: min(rail_visibility, depth_confidence)
-        }
+        # Find the lowest confidence factor (first wins on ties)
+        scores = (
+            rail_visibility,
+            calibration_confidence,
+            depth_confidence,
+            min(rail_visibility, depth_confidence)
+        )
         
-        return min(factors, key=factors.get)
+        return self._REASONS[min(range(4), key=scores.__getitem__)]
     
     def reset(self):
         """Reset history (e.g., after operator override)."""
         self.confidence_history.clear()
+        self._confidence_sum = 0.0
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Tuple, Optional
 import numpy as np
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CalibrationResult:
     intrinsics: np.ndarray      # [3, 3] camera matrix K
     extrinsics: Tuple           # (R, t) Rotation, translation
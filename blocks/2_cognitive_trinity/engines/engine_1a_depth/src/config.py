@@ -12,6 +12,7 @@ DEPTH_PARAMS = {
     
     # Inference
     'input_size': (518, 518),      # DepthAnything-v2 input resolution
+    'device': 'cuda:0',            # Steps 2-9 stay on this device
     
     # Outlier detection (Step 5)
     'outlier_kernel_size': 3,      # Median filter kernel
@@ -24,6 +25,11 @@ DEPTH_PARAMS = {
     # Temporal smoothing (Step 7)
     'temporal_alpha': 0.7,         # EMA weight (favor current frame)
     
+    # Temporal coherence (model runs every N frames, warp in between)
+    'coherence_interval': 3,       # Frames per full inference
+    'coherence_alpha': 0.7,        # Fresh vs. warped weight on refresh
+    'coherence_max_invalid': 0.05, # Force refresh above this uncovered fraction
+    
     # Confidence weights (Step 10)
     'confidence_weights': {
         'range': 0.4,
@@ -9,13 +9,14 @@ TRACEABILITY:
 
 from .interfaces import DepthInput, DepthOutput, CalibrationInput
 from .config import DEPTH_PARAMS
+from .preprocessing import resize_for_depth, resize_to_original
+from .refinement import detect_outliers, temporal_smooth, compact_history
+from .output import generate_point_cloud
 
 # TODO: Import submodules when implemented
-# from .preprocessing import resize_for_depth, resize_to_original
 # from .inference import DepthAnythingV2
 # from .calibration import apply_metric_scale
-# from .refinement import detect_outliers, guided_filter, temporal_smooth
-# from .output import generate_point_cloud
+# from .refinement import guided_filter
 # from .confidence import compute_confidence
 
 
@@ -42,7 +43,10 @@ class Engine1ADepth:
     def __init__(self, config: dict = None):
         """Initialize engine with configuration."""
         self.config = config or DEPTH_PARAMS
-        self.prev_depth = None
+        self.prev_depth = None  # Half precision (see refinement/temporal_ema.py)
+        
+        # Steps 2-9 stay on-device when CUDA is available
+        self.device = self.config.get('device', 'cpu')
         
         # TODO: Initialize model
         # self.depth_model = DepthAnythingV2(...)
@@ -62,10 +66,13 @@ class Engine1ADepth:
         """
         # Step 1: Receive frame
         frame = input_data.frame
-        prev_depth = input_data.prev_depth or self.prev_depth
+        prev_depth = (
+            input_data.prev_depth if input_data.prev_depth is not None
+            else self.prev_depth
+        )
         
-        # Step 2: Resize (2ms)
-        # resized = resize_for_depth(frame)
+        # Step 2: Resize (2ms) - pinned H2D + on-device resize/normalize
+        # resized = resize_for_depth(frame, self.config['input_size'], self.device)
         
         # Step 3: Inference (18ms)
         # relative_depth = self.depth_model.infer(resized)
@@ -82,17 +89,17 @@ class Engine1ADepth:
         # Step 7: Temporal EMA (1ms)
         # depth_smooth = temporal_smooth(depth_guided, prev_depth, self.config['temporal_alpha'])
         
-        # Step 8: Upscale
+        # Step 8: Upscale (on-device)
         # depth_full = resize_to_original(depth_smooth, frame.shape[:2])
         
-        # Step 9: Point cloud (2ms)
+        # Step 9: Point cloud (2ms, on-device; single D2H at Step 11)
         # point_cloud = generate_point_cloud(depth_full, calibration.intrinsics)
         
         # Step 10: Confidence (<1ms)
         # confidence = compute_confidence(depth_full, frame, prev_depth)
         
-        # Update state
-        # self.prev_depth = depth_full
+        # Update state (half precision, model resolution)
+        # self.prev_depth = compact_history(depth_smooth)
         
         # Step 11: Output
         # return DepthOutput(
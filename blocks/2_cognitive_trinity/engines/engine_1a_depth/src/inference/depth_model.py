@@ -1,13 +1,24 @@
 # Engine 1A: Depth Model - DepthAnything-v2
 # Supports PyTorch (dev) and TensorRT (production)
 
-from typing import Optional, Tuple
+from functools import partial
+from typing import Iterable, Optional, Tuple, Union
 import numpy as np
+import cv2
 
-# Import shared inference backend
-import sys
-sys.path.insert(0, '../../../shared')
-from blocks.cognitive_trinity.shared.inference import InferenceBackend
+try:
+    import torch
+except ImportError:
+    torch = None
+
+# Shared inference backend
+from blocks.cognitive_trinity.shared.inference import (
+    InferenceBackend, BackendType, get_or_build_engine
+)
+
+from ..config import DEPTH_PARAMS
+from ..preprocessing.resize import resize_for_depth, resize_to_original, cuda_available
+from ..refinement.reprojection import warp_depth
 
 
 class DepthAnythingV2:
@@ -37,61 +48,149 @@ class DepthAnythingV2:
         model_path: str = None,
         backend: str = 'auto',
         device: str = 'cuda:0',
-        fp16: bool = True
+        fp16: bool = True,
+        precision: Optional[str] = None
     ):
         self.model_path = model_path
         self.device = device
         self.fp16 = fp16
         
+        # Engine build precision: 'fp32' | 'fp16' | 'int8' (INT8 keeps FP16
+        # as fallback for layers without INT8 kernels)
+        self.precision = precision or ('fp16' if fp16 else 'fp32')
+        
         self._backend: Optional[InferenceBackend] = None
         self._input_size = (518, 518)  # DepthAnything-v2 input size
         
+        # Preprocess buffers (reused every frame)
+        w, h = self._input_size
+        self._resize_buf = np.empty((h, w, 3), dtype=np.uint8)
+        self._pre_buf = np.empty((1, 3, h, w), dtype=np.float32)
+        self._out_dev = None  # Device output [1, 1, h, w] (TensorRT path)
+        self._run = None      # Shape-specialized engine call (TensorRT path)
+        
+        # ImageNet normalization as a per-channel LUT over the 256 uint8
+        # levels: lut[c][x] = (x / 255 - mean[c]) / std[c]
+        mean = np.array([0.485, 0.456, 0.406], dtype=np.float32)
+        std = np.array([0.229, 0.224, 0.225], dtype=np.float32)
+        levels = np.arange(256, dtype=np.float32) / 255.0
+        self._norm_lut = ((levels[None, :] - mean[:, None]) / std[:, None]).astype(np.float32)
+        
         if model_path:
             self.load(model_path, backend)
     
-    def load(self, model_path: str, backend: str = 'auto') -> bool:
+    def load(
+        self,
+        model_path: str,
+        backend: str = 'auto',
+        calibration_frames: Optional[Iterable[np.ndarray]] = None
+    ) -> bool:
         """
         Load model with specified backend.
         
+        An .onnx model is compiled once to a TensorRT engine (at
+        `precision`) cached per GPU / TensorRT version; later loads
+        deserialize the cache.
+        
         Args:
-            model_path: Path to .pt or .trt file
+            model_path: Path to .pt, .trt or .onnx file
             backend: 'pytorch', 'tensorrt', or 'auto'
+            calibration_frames: RGB frames for INT8 calibration (~500
+                representative frames); only read on the first INT8 build
         """
+        if model_path.endswith('.onnx') and backend in ('auto', 'tensorrt'):
+            w, h = self._input_size
+            int8 = self.precision == 'int8'
+            calibration = None
+            if int8 and calibration_frames is not None:
+                calibration = (self.preprocess(f) for f in calibration_frames)
+            engine_path = get_or_build_engine(
+                model_path, self.device,
+                fp16=self.precision in ('fp16', 'int8'),
+                int8=int8,
+                tag=f"{w}x{h}",
+                input_shape=(1, 3, h, w),
+                calibration_batches=calibration
+            )
+            if engine_path is not None:
+                model_path, backend = engine_path, 'tensorrt'
+        
         self._backend = InferenceBackend(
             model_path=model_path,
             backend_type=backend,
             device=self.device,
             fp16=self.fp16
         )
-        return self._backend.load()
+        if not self._backend.load():
+            return False
+        
+        # Bind a fixed-shape engine call once (input is read from _pre_buf)
+        self._run = None
+        if self._alloc_buffers():
+            w, h = self._input_size
+            self._run = self._backend.specialize((1, 3, h, w), (1, 1, h, w))
+        return True
+    
+    def _alloc_buffers(self) -> bool:
+        """
+        Preprocess straight into the backend's page-locked input, if any.
+        
+        Removes the per-frame staging copy and keeps the H2D transfer on
+        pinned memory (TensorRT).
+        
+        Returns:
+            True if `_pre_buf` is now the backend's input buffer
+        """
+        pinned = self._backend.input_buffer()
+        if (
+            pinned is not None
+            and pinned.shape == self._pre_buf.shape
+            and pinned.dtype == self._pre_buf.dtype
+        ):
+            self._pre_buf = pinned
+            return True
+        return False
     
     def preprocess(self, frame: np.ndarray) -> np.ndarray:
         """
         Preprocess frame for inference.
         
+        Resize into a reused buffer, then normalize each plane with a
+        single LUT gather written straight into the NCHW output. The
+        returned array is overwritten on the next call.
+        
         Args:
             frame: RGB frame [H, W, 3] uint8
             
         Returns:
             Preprocessed tensor [1, 3, 518, 518] float32
         """
-        import cv2
-        
         # Resize to model input size
-        resized = cv2.resize(frame, self._input_size)
+        resized = cv2.resize(frame, self._input_size, dst=self._resize_buf)
         
-        # Normalize to [0, 1]
-        normalized = resized.astype(np.float32) / 255.0
+        # Normalize + ImageNet standardize via LUT, one plane at a time
+        out = self._pre_buf[0]
+        for c, plane in enumerate(cv2.split(resized)):
+            cv2.LUT(plane, self._norm_lut[c], dst=out[c])
         
-        # ImageNet normalization
-        mean = np.array([0.485, 0.456, 0.406], dtype=np.float32)
-        std = np.array([0.229, 0.224, 0.225], dtype=np.float32)
-        normalized = (normalized - mean) / std
+        return self._pre_buf
+    
+    def preprocess_gpu(self, frame: np.ndarray) -> 'torch.Tensor':
+        """
+        Preprocess on-device (TensorRT path).
         
-        # HWC -> CHW -> NCHW
-        tensor = normalized.transpose(2, 0, 1)[np.newaxis, ...]
+        Uploads the uint8 frame (~4x fewer bytes than the float32 tensor)
+        and resizes/normalizes on the GPU; the result is left in device
+        memory for the engine to read directly.
         
-        return tensor.astype(np.float32)
+        Args:
+            frame: RGB frame [H, W, 3] uint8
+            
+        Returns:
+            CUDA tensor [1, 3, 518, 518] float32 (contiguous)
+        """
+        tensor = resize_for_depth(frame, self._input_size, self.device)
+        return tensor.contiguous()
     
     def postprocess(
         self,
@@ -108,8 +207,6 @@ class DepthAnythingV2:
         Returns:
             Depth map [H, W] in relative units
         """
-        import cv2
-        
         # Remove batch and channel dims
         depth = output.squeeze()
         
@@ -118,15 +215,20 @@ class DepthAnythingV2:
         
         return depth
     
-    def infer(self, frame: np.ndarray) -> np.ndarray:
+    def infer(self, frame: np.ndarray) -> Union[np.ndarray, 'torch.Tensor']:
         """
         Run depth inference.
         
+        On the TensorRT path the depth never leaves the GPU: the engine
+        writes into a device buffer and the upscale runs on-device. Use
+        `to_numpy()` where a CPU consumer needs the map.
+        
         Args:
             frame: RGB frame [H, W, 3] uint8
             
         Returns:
-            Relative depth map [H, W] float32
+            Relative depth map [H, W] float32 (CUDA tensor on the
+            TensorRT path, numpy otherwise)
             
         Timing: ~18ms (TensorRT FP16)
         """
@@ -135,25 +237,146 @@ class DepthAnythingV2:
         
         original_size = (frame.shape[1], frame.shape[0])
         
+        if self._gpu_preprocess():
+            # Preprocess on-device; TensorRT reads the tensor in place
+            # and writes its output to device memory
+            tensor = self.preprocess_gpu(frame)
+            torch.cuda.current_stream().synchronize()
+            out = self._device_output()
+            self._backend.infer_device(tensor.data_ptr(), output_ptr=out.data_ptr())
+            return resize_to_original(out[0, 0], (frame.shape[0], frame.shape[1]))
+        
         # Preprocess
         tensor = self.preprocess(frame)
         
-        # Inference
-        output = self._backend.infer(tensor)
+        # Inference (TensorRT output stays a view of its pinned buffer;
+        # postprocess resizes into a fresh array anyway)
+        if self._run is not None:
+            output = self._run()
+        elif self._backend.backend_type == BackendType.TENSORRT:
+            output = self._backend.infer(tensor, copy=False)
+        else:
+            output = self._backend.infer(tensor)
         
         # Postprocess
         depth = self.postprocess(output, original_size)
         
         return depth
     
+    def infer_coherent(
+        self,
+        frame: np.ndarray,
+        prev_depth: Optional[Union[np.ndarray, 'torch.Tensor']],
+        ego_motion: Optional[np.ndarray],
+        frame_id: int
+    ) -> Union[np.ndarray, 'torch.Tensor']:
+        """
+        Temporally coherent depth: full inference every N frames only.
+        
+        In between, `prev_depth` is warped by the egomotion homography.
+        On refresh frames the fresh map is blended with the warp where it
+        is valid. A refresh is forced when too much of the warped map has
+        no source pixel (large motion / scene cut).
+        
+        Args:
+            frame: RGB frame [H, W, 3] uint8
+            prev_depth: Depth returned for the previous frame, or None
+            ego_motion: [3, 3] image homography previous -> current frame,
+                or None (no motion estimate: always infer)
+            frame_id: Monotonic frame counter
+            
+        Returns:
+            Relative depth map [H, W] float32 (same device as `infer`)
+        """
+        if prev_depth is None or ego_motion is None:
+            return self.infer(frame)
+        
+        warped, valid = warp_depth(prev_depth, ego_motion)
+        if torch is not None and isinstance(valid, torch.Tensor):
+            coverage = float(valid.float().mean())
+        else:
+            coverage = float(valid.mean())
+        
+        refresh = frame_id % DEPTH_PARAMS['coherence_interval'] == 0
+        if not refresh and 1.0 - coverage <= DEPTH_PARAMS['coherence_max_invalid']:
+            return warped
+        
+        depth = self.infer(frame)
+        if type(depth) is not type(warped) or depth.shape != warped.shape:
+            return depth
+        
+        alpha = DEPTH_PARAMS['coherence_alpha']
+        blended = alpha * depth + (1.0 - alpha) * warped
+        if torch is not None and isinstance(depth, torch.Tensor):
+            return torch.where(valid, blended, depth)
+        return np.where(valid, blended, depth)
+    
+    def _device_output(self) -> 'torch.Tensor':
+        """Reused device buffer the engine writes depth into."""
+        if self._out_dev is None:
+            w, h = self._input_size
+            self._out_dev = torch.empty(
+                (1, 1, h, w), dtype=torch.float32, device=self.device
+            )
+        return self._out_dev
+    
+    @staticmethod
+    def to_numpy(depth: Union[np.ndarray, 'torch.Tensor']) -> np.ndarray:
+        """D2H copy of a depth map, only when a CPU consumer needs it."""
+        if isinstance(depth, np.ndarray):
+            return depth
+        return depth.detach().cpu().numpy()
+    
+    def _gpu_preprocess(self) -> bool:
+        """On-device preprocessing applies to the TensorRT backend on CUDA."""
+        return (
+            self._backend.backend_type == BackendType.TENSORRT
+            and cuda_available(self.device)
+        )
+    
     def get_latency_stats(self) -> dict:
         """Get inference latency statistics in ms."""
         if self._backend:
             return self._backend.get_latency_stats()
         return {}
     
-    def warmup(self, frame_shape: Tuple[int, int, int] = (1080, 1920, 3)):
-        """Warmup model for consistent timing."""
-        dummy = np.zeros(frame_shape, dtype=np.uint8)
-        for _ in range(10):
-            self.infer(dummy)
+    def warmup(self, iterations: int = 20, discard: int = 5):
+        """
+        Warmup model for consistent timing.
+        
+        Pushes pre-normalized zeros straight through the engine (no Python
+        preprocess; on device for TensorRT) so tactic selection and
+        allocations settle. Timings of the first `discard` runs are
+        dropped; the rest remain as the warm baseline in
+        get_latency_stats(). The preprocess path is then exercised once
+        with a full-size random frame.
+        """
+        if self._backend is None:
+            raise RuntimeError("Model not loaded. Call load() first.")
+        
+        w, h = self._input_size
+        if self._gpu_preprocess():
+            dummy = torch.zeros((1, 3, h, w), dtype=torch.float32, device=self.device)
+            torch.cuda.synchronize()
+            run = partial(self._backend.infer_device, dummy.data_ptr(), copy=False)
+        elif self._run is not None:
+            self._pre_buf.fill(0.0)
+            run = self._run
+        else:
+            dummy = np.zeros((1, 3, h, w), dtype=np.float32)
+            run = partial(self._backend.infer, dummy)
+        
+        for i in range(iterations):
+            if i == discard:
+                self._backend.reset_latency_stats()
+            run()
+        if self._gpu_preprocess():
+            torch.cuda.synchronize()
+        
+        # Exercise preprocessing once (buffers, OpenCV / CUDA kernels)
+        frame = np.random.randint(0, 256, (1080, 1920, 3), dtype=np.uint8)
+        if self._gpu_preprocess():
+            self.preprocess_gpu(frame)
+            torch.cuda.synchronize()
+        else:
+            self.preprocess(frame)
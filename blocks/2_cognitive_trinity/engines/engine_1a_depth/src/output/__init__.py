@@ -5,3 +5,6 @@ TRACEABILITY:
   - Architecture: engine_1a_depth/arquitectura.svg (POINT CLOUD box)
   - Flow: engine_1a_depth/flujo.svg Step 9
 """
+from .point_cloud import generate_point_cloud
+
+__all__ = ['generate_point_cloud']
@@ -0,0 +1,47 @@
+"""
+Engine 1A: Point Cloud Generation (Step 9)
+
+TRACEABILITY:
+  - Architecture: engine_1a_depth/arquitectura.svg (POINT CLOUD box)
+  - Flow: engine_1a_depth/flujo.svg Step 9
+"""
+
+from typing import Union
+import numpy as np
+
+try:
+    import torch
+except ImportError:
+    torch = None
+
+
+def generate_point_cloud(
+    depth: Union[np.ndarray, 'torch.Tensor'],
+    intrinsics: np.ndarray
+) -> Union[np.ndarray, 'torch.Tensor']:
+    """
+    Inverse projection: xyz[v, u] = depth[v, u] * K^-1 @ [u, v, 1].
+    
+    Runs on whichever device holds `depth` (no host round-trip).
+    
+    Args:
+        depth: [H, W] metric depth
+        intrinsics: [3, 3] camera matrix K
+        
+    Returns:
+        [H, W, 3] XYZ in camera frame (meters)
+    """
+    fx, fy = float(intrinsics[0, 0]), float(intrinsics[1, 1])
+    cx, cy = float(intrinsics[0, 2]), float(intrinsics[1, 2])
+    h, w = depth.shape[-2:]
+    
+    if torch is not None and isinstance(depth, torch.Tensor):
+        u = torch.arange(w, device=depth.device, dtype=depth.dtype)
+        v = torch.arange(h, device=depth.device, dtype=depth.dtype)
+        x = ((u - cx) / fx)[None, :] * depth
+        y = ((v - cy) / fy)[:, None] * depth
+        return torch.stack((x, y, depth), dim=-1)
+    
+    u = (np.arange(w, dtype=np.float32) - cx) / fx
+    v = (np.arange(h, dtype=np.float32) - cy) / fy
+    return np.stack((u[None, :] * depth, v[:, None] * depth, depth), axis=-1)
@@ -5,3 +5,6 @@ TRACEABILITY:
   - Architecture: engine_1a_depth/arquitectura.svg#comp_resize
   - Flow: engine_1a_depth/flujo.svg Step 2, Step 8
 """
+from .resize import resize_for_depth, resize_to_original
+
+__all__ = ['resize_for_depth', 'resize_to_original']
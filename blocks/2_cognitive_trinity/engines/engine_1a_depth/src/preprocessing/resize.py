@@ -0,0 +1,128 @@
+"""
+Engine 1A: Resize (Steps 2, 8)
+
+TRACEABILITY:
+  - Architecture: engine_1a_depth/arquitectura.svg#comp_resize
+  - Flow: engine_1a_depth/flujo.svg Step 2 (resize input), Step 8 (upscale)
+
+When CUDA is available the frame is uploaded once from a pinned host
+buffer and resize + normalization run on-device; the result stays on the
+GPU for inference, refinement and point cloud generation. Without CUDA
+the same steps run on CPU with OpenCV.
+"""
+
+from typing import Dict, Tuple, Union
+import numpy as np
+import cv2
+
+try:
+    import torch
+    import torch.nn.functional as F
+except ImportError:
+    torch = None
+
+from ..config import DEPTH_PARAMS
+
+# ImageNet normalization (DepthAnything-v2)
+IMAGENET_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32)
+IMAGENET_STD = np.array([0.229, 0.224, 0.225], dtype=np.float32)
+
+# Reused per frame shape / device (avoids per-frame pinned allocation);
+# each pinned frame carries the event of its last H2D copy
+_pinned_frames: Dict[Tuple[int, ...], Tuple['torch.Tensor', 'torch.cuda.Event']] = {}
+_norm_consts: Dict[str, Tuple['torch.Tensor', 'torch.Tensor']] = {}
+
+
+def cuda_available(device: str) -> bool:
+    """True if `device` is a CUDA device usable through torch."""
+    return (
+        torch is not None
+        and device.startswith('cuda')
+        and torch.cuda.is_available()
+    )
+
+
+def resize_for_depth(
+    frame: np.ndarray,
+    input_size: Tuple[int, int] = DEPTH_PARAMS['input_size'],
+    device: str = DEPTH_PARAMS['device']
+) -> Union[np.ndarray, 'torch.Tensor']:
+    """
+    Resize and normalize frame for DepthAnything-v2. (Step 2)
+    
+    Args:
+        frame: RGB frame [H, W, 3] uint8
+        input_size: (width, height) model input
+        device: Target device ('cuda:N' keeps the tensor on GPU)
+        
+    Returns:
+        [1, 3, h, w] float32 (torch tensor on device, or numpy on CPU)
+    """
+    if cuda_available(device):
+        return _resize_for_depth_gpu(frame, input_size, device)
+    
+    resized = cv2.resize(frame, input_size, interpolation=cv2.INTER_LINEAR)
+    normalized = (resized.astype(np.float32) / 255.0 - IMAGENET_MEAN) / IMAGENET_STD
+    return np.ascontiguousarray(normalized.transpose(2, 0, 1)[np.newaxis])
+
+
+def _resize_for_depth_gpu(
+    frame: np.ndarray,
+    input_size: Tuple[int, int],
+    device: str
+) -> 'torch.Tensor':
+    """Pinned H2D upload, then resize + normalize on-device."""
+    entry = _pinned_frames.get(frame.shape)
+    if entry is None:
+        entry = (torch.empty(frame.shape, dtype=torch.uint8).pin_memory(), torch.cuda.Event())
+        _pinned_frames[frame.shape] = entry
+    host, uploaded = entry
+    
+    # The previous frame's non-blocking upload may still be reading the buffer
+    uploaded.synchronize()
+    host.numpy()[...] = frame
+    
+    mean, std = _norm_consts.get(device) or _make_norm_consts(device)
+    
+    x = host.to(device, non_blocking=True)
+    uploaded.record(torch.cuda.current_stream(device))
+    x = x.permute(2, 0, 1).unsqueeze(0).float()
+    x = F.interpolate(
+        x, size=(input_size[1], input_size[0]),
+        mode='bilinear', align_corners=False, antialias=False
+    )
+    return (x - mean) / std
+
+
+def _make_norm_consts(device: str) -> Tuple['torch.Tensor', 'torch.Tensor']:
+    """Mean/std on device, pre-scaled for uint8 input."""
+    mean = torch.from_numpy(IMAGENET_MEAN * 255.0).view(1, 3, 1, 1).to(device)
+    std = torch.from_numpy(IMAGENET_STD * 255.0).view(1, 3, 1, 1).to(device)
+    _norm_consts[device] = (mean, std)
+    return mean, std
+
+
+def resize_to_original(
+    depth: Union[np.ndarray, 'torch.Tensor'],
+    original_shape: Tuple[int, int]
+) -> Union[np.ndarray, 'torch.Tensor']:
+    """
+    Upscale depth back to frame resolution. (Step 8)
+    
+    Stays on the same device as the input.
+    
+    Args:
+        depth: [h, w] depth map
+        original_shape: (height, width) of the source frame
+        
+    Returns:
+        [H, W] depth map
+    """
+    if torch is not None and isinstance(depth, torch.Tensor):
+        return F.interpolate(
+            depth[None, None], size=tuple(original_shape),
+            mode='bilinear', align_corners=False
+        )[0, 0]
+    
+    h, w = original_shape
+    return cv2.resize(depth, (w, h), interpolation=cv2.INTER_LINEAR)
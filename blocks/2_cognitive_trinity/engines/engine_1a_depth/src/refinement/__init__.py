@@ -9,4 +9,10 @@ Contains:
   - outlier.py: Outlier detection (Step 5)
   - guided_filter.py: Edge-aware refinement (Step 6)
   - temporal_ema.py: Temporal smoothing (Step 7)
+  - reprojection.py: Egomotion warp of the previous depth (Step 7)
 """
+from .outlier import detect_outliers
+from .temporal_ema import temporal_smooth, compact_history
+from .reprojection import warp_depth
+
+__all__ = ['detect_outliers', 'temporal_smooth', 'compact_history', 'warp_depth']
@@ -0,0 +1,55 @@
+"""
+Engine 1A: Outlier Detection (Step 5)
+
+TRACEABILITY:
+  - Architecture: engine_1a_depth/arquitectura.svg#comp_refinement (Outlier Detect)
+  - Flow: engine_1a_depth/flujo.svg Step 5
+
+Pixels deviating more than `outlier_threshold` from their local median
+are replaced by that median. The median runs in OpenCV (SIMD) on CPU or
+as an unfold-median on GPU tensors; the repair is a single masked select.
+"""
+
+from typing import Union
+import numpy as np
+import cv2
+
+try:
+    import torch
+    import torch.nn.functional as F
+except ImportError:
+    torch = None
+
+from ..config import DEPTH_PARAMS
+
+
+def detect_outliers(
+    depth: Union[np.ndarray, 'torch.Tensor'],
+    kernel_size: int = DEPTH_PARAMS['outlier_kernel_size'],
+    threshold: float = DEPTH_PARAMS['outlier_threshold']
+) -> Union[np.ndarray, 'torch.Tensor']:
+    """
+    Replace depth outliers with the local median.
+    
+    Args:
+        depth: [H, W] float32 metric depth
+        kernel_size: Median window (3 or 5 for float input on CPU)
+        threshold: Relative deviation that marks an outlier
+        
+    Returns:
+        [H, W] cleaned depth (same type/device as input)
+    """
+    if torch is not None and isinstance(depth, torch.Tensor):
+        pad = kernel_size // 2
+        patches = F.unfold(
+            F.pad(depth[None, None], (pad, pad, pad, pad), mode='replicate'),
+            kernel_size
+        )
+        median = patches.median(dim=1).values.view_as(depth)
+        mask = (depth - median).abs() > threshold * median
+        return torch.where(mask, median, depth)
+    
+    depth = np.ascontiguousarray(depth, dtype=np.float32)
+    median = cv2.medianBlur(depth, kernel_size)
+    mask = np.abs(depth - median) > threshold * median
+    return np.where(mask, median, depth)
@@ -0,0 +1,74 @@
+"""
+Engine 1A: Depth Reprojection (temporal coherence)
+
+TRACEABILITY:
+  - Architecture: engine_1a_depth/arquitectura.svg#comp_refinement (Temporal EMA)
+  - Flow: engine_1a_depth/flujo.svg Step 7
+
+At 60 fps consecutive depth maps differ mostly by camera egomotion, so the
+previous map warped by the image-space homography of that motion is a
+good estimate for the current frame. The model then only needs to run
+every few frames (see DepthAnythingV2.infer_coherent).
+"""
+
+from typing import Tuple, Union
+import numpy as np
+import cv2
+
+try:
+    import torch
+    import torch.nn.functional as F
+except ImportError:
+    torch = None
+
+
+def warp_depth(
+    depth: Union[np.ndarray, 'torch.Tensor'],
+    homography: np.ndarray
+) -> Tuple[Union[np.ndarray, 'torch.Tensor'], Union[np.ndarray, 'torch.Tensor']]:
+    """
+    Warp a depth map by a 3x3 homography (previous -> current frame).
+    
+    Stays on the same device as the input.
+    
+    Args:
+        depth: [H, W] previous depth
+        homography: [3, 3] maps previous pixel coords to current ones
+        
+    Returns:
+        (warped [H, W] float32, valid [H, W] bool) - pixels with no source
+        in the previous frame are invalid (and 0)
+    """
+    h, w = depth.shape[-2:]
+    
+    if torch is not None and isinstance(depth, torch.Tensor):
+        # Inverse map: sample the previous frame at H^-1 * (x, y, 1)
+        H_inv = torch.as_tensor(
+            np.linalg.inv(homography), dtype=torch.float32, device=depth.device
+        )
+        ys, xs = torch.meshgrid(
+            torch.arange(h, device=depth.device, dtype=torch.float32),
+            torch.arange(w, device=depth.device, dtype=torch.float32),
+            indexing='ij'
+        )
+        pts = torch.stack((xs, ys, torch.ones_like(xs)), dim=-1) @ H_inv.T
+        src = pts[..., :2] / pts[..., 2:3]
+        
+        grid = torch.empty_like(src)
+        grid[..., 0] = src[..., 0] * (2.0 / (w - 1)) - 1.0
+        grid[..., 1] = src[..., 1] * (2.0 / (h - 1)) - 1.0
+        
+        warped = F.grid_sample(
+            depth.float()[None, None], grid[None],
+            mode='bilinear', padding_mode='zeros', align_corners=True
+        )[0, 0]
+        valid = (grid.abs() <= 1.0).all(dim=-1)
+        return warped, valid
+    
+    warped = cv2.warpPerspective(
+        depth.astype(np.float32, copy=False), homography, (w, h),
+        flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_CONSTANT, borderValue=np.nan
+    )
+    valid = ~np.isnan(warped)
+    warped[~valid] = 0.0
+    return warped, valid
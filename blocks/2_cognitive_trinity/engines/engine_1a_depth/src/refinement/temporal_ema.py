@@ -0,0 +1,56 @@
+"""
+Engine 1A: Temporal EMA (Step 7)
+
+TRACEABILITY:
+  - Architecture: engine_1a_depth/arquitectura.svg#comp_refinement (Temporal EMA)
+  - Flow: engine_1a_depth/flujo.svg Step 7
+
+The previous depth is held in half precision (FP16 on CPU, BF16 on GPU)
+to halve the memory traffic of the EMA; the blend itself is computed in
+FP32. BF16 keeps the FP32 exponent range, FP16 resolves ~0.1 m at 200 m.
+"""
+
+from typing import Optional, Union
+import numpy as np
+
+try:
+    import torch
+except ImportError:
+    torch = None
+
+
+def temporal_smooth(
+    depth: Union[np.ndarray, 'torch.Tensor'],
+    prev_depth: Optional[Union[np.ndarray, 'torch.Tensor']],
+    alpha: float
+) -> Union[np.ndarray, 'torch.Tensor']:
+    """
+    Exponential moving average over frames.
+    
+    Args:
+        depth: Current depth (FP32)
+        prev_depth: Previous smoothed depth (half precision) or None
+        alpha: Weight of the current frame
+        
+    Returns:
+        Smoothed depth (FP32)
+    """
+    if prev_depth is None or prev_depth.shape != depth.shape:
+        return depth
+    
+    if torch is not None and isinstance(depth, torch.Tensor):
+        return torch.lerp(prev_depth.float(), depth, alpha)
+    
+    smoothed = prev_depth.astype(np.float32)
+    smoothed *= (1.0 - alpha)
+    smoothed += alpha * depth
+    return smoothed
+
+
+def compact_history(
+    depth: Union[np.ndarray, 'torch.Tensor']
+) -> Union[np.ndarray, 'torch.Tensor']:
+    """Store smoothed depth for the next frame in half precision."""
+    if torch is not None and isinstance(depth, torch.Tensor):
+        return depth.to(torch.bfloat16)
+    return depth.astype(np.float16)
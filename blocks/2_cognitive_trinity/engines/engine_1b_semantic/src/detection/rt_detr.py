@@ -3,10 +3,9 @@
 
 from typing import List, Tuple, Optional
 import numpy as np
+import cv2
 
-# Import shared inference backend
-import sys
-sys.path.insert(0, '../../../../shared')
+# Shared inference backend
 try:
     from blocks.cognitive_trinity.shared.inference import InferenceBackend
 except ImportError:
@@ -44,6 +43,12 @@ class RTDETR:
         self._backend: Optional[InferenceBackend] = None
         self._input_size = (640, 640)
         
+        # Preprocess buffers (reused every frame)
+        w, h = self._input_size
+        self._resize_buf = np.empty((h, w, 3), dtype=np.uint8)
+        self._pre_buf = np.empty((1, 3, h, w), dtype=np.float32)
+        self._scale_lut = np.arange(256, dtype=np.float32) / 255.0
+        
         self.class_names = ['person', 'bicycle', 'car', 'motorcycle', 'bus', 
                            'truck', 'cat', 'dog', 'horse', 'cow']
         
@@ -62,7 +67,20 @@ class RTDETR:
             device=self.device,
             fp16=True
         )
-        return self._backend.load()
+        if not self._backend.load():
+            return False
+        
+        # Preprocess straight into the backend's pinned input, if any. The
+        # float32 LUT cannot write into an FP16 input, so a dtype mismatch
+        # keeps the private buffer and the backend copies it as before.
+        pinned = self._backend.input_buffer()
+        if (
+            pinned is not None
+            and pinned.shape == self._pre_buf.shape
+            and pinned.dtype == self._pre_buf.dtype
+        ):
+            self._pre_buf = pinned
+        return True
     
     def infer(self, frame: np.ndarray) -> List[dict]:
         """
@@ -91,18 +109,70 @@ class RTDETR:
         return detections
     
     def _preprocess(self, frame: np.ndarray) -> np.ndarray:
-        """Preprocess frame for RT-DETR."""
-        import cv2
-        resized = cv2.resize(frame, self._input_size)
-        normalized = resized.astype(np.float32) / 255.0
-        tensor = normalized.transpose(2, 0, 1)[np.newaxis, ...]
-        return tensor
+        """
+        Preprocess frame for RT-DETR.
+        
+        Resize into a reused buffer, then scale each plane to [0, 1] with a
+        LUT written straight into the NCHW output (one pass, no float HWC
+        temporary). The returned array is overwritten on the next call.
+        """
+        resized = cv2.resize(frame, self._input_size, dst=self._resize_buf)
+        out = self._pre_buf[0]
+        for c, plane in enumerate(cv2.split(resized)):
+            cv2.LUT(plane, self._scale_lut, dst=out[c])
+        return self._pre_buf
     
     def _postprocess(self, output: np.ndarray, original_size: Tuple[int, int]) -> List[dict]:
-        """Postprocess RT-DETR output to detections."""
-        detections = []
-        # TODO: Parse actual RT-DETR output format
-        return detections
+        """
+        Postprocess RT-DETR output to detections.
+        
+        Fully vectorized: score/label reduction, confidence filtering and
+        box conversion are single NumPy passes over all queries; class-aware
+        NMS runs in OpenCV.
+        
+        Args:
+            output: Raw output [1, N, 4 + C] - normalized (cx, cy, w, h)
+                followed by per-class scores
+            original_size: (height, width) of the source frame
+        """
+        preds = output.reshape(-1, output.shape[-1])
+        scores_all = preds[:, 4:]
+        
+        # Best class per query, then drop low-confidence queries
+        labels = scores_all.argmax(-1)
+        scores = np.take_along_axis(scores_all, labels[:, None], axis=-1)[:, 0]
+        keep = scores > self.conf_threshold
+        if not keep.any():
+            return []
+        
+        labels = labels[keep]
+        scores = scores[keep].astype(np.float32)
+        
+        # Normalized cxcywh -> pixel xywh (top-left) / xyxy
+        h, w = original_size
+        cxcywh = preds[keep, :4] * np.array([w, h, w, h], dtype=np.float32)
+        xywh = cxcywh.copy()
+        xywh[:, :2] -= cxcywh[:, 2:] * 0.5
+        xyxy = xywh.copy()
+        xyxy[:, 2:] += xywh[:, :2]
+        
+        # Class-aware NMS
+        idx = cv2.dnn.NMSBoxesBatched(
+            xywh.tolist(), scores.tolist(), labels.tolist(),
+            self.conf_threshold, self.nms_threshold
+        )
+        idx = np.asarray(idx, dtype=np.int64).reshape(-1)
+        
+        names = self.class_names
+        return [
+            {
+                'bbox': xyxy[i].tolist(),
+                'class': names[labels[i]] if labels[i] < len(names) else str(labels[i]),
+                'class_id': int(labels[i]),
+                'conf': float(scores[i])
+            }
+            for i in idx
+        ]
     
     def get_latency_stats(self) -> dict:
         """Get inference latency statistics."""
@@ -1,6 +1,15 @@
 # Engine 2: Persistence - Multi-Object Tracking
 # Provides temporal persistence via BotSORT + OSNet ReID
 
+from importlib import import_module
+
+# Shared inference backend, resolved once per process (submodules import
+# it from here; None when the shared package is not installed)
+try:
+    InferenceBackend = import_module('blocks.cognitive_trinity.shared.inference').InferenceBackend
+except ImportError:
+    InferenceBackend = None
+
 from .engine import Engine2Persistence
 from .interfaces import Track, TrackState
 
@@ -5,8 +5,11 @@ from dataclasses import dataclass
 from typing import List, Dict, Optional
 import numpy as np
 
-from .interfaces import Track, TrackState
+from .interfaces import Track, TrackState, EMBEDDING_DTYPE, EMPTY_EMBEDDING
 from .config import PERSISTENCE_PARAMS
+from .kalman import BatchedKalman
+from .tracking.association import associate_detections
+from .kernels import age_tracks, compute_quality
 
 
 class Engine2Persistence:
@@ -26,12 +29,28 @@ class Engine2Persistence:
         self.tracks: Dict[int, Track] = {}
         self.next_track_id = 0
         self.params = PERSISTENCE_PARAMS
+        n = self.params['max_tracks']
         
         # Components initialized lazily
         self._tracker = None
         self._reid = None
-        self._kalman = None
         self._memory = None
+        
+        # All track motion states, predicted in one batched pass; its slots
+        # also index the lifecycle arrays below
+        self._kalman = BatchedKalman(n)
+        
+        # Track lifecycle as struct-of-arrays (one row per slot), so
+        # per-frame state transitions are a few vectorized ops. Track
+        # objects in self.tracks are refreshed from these on output.
+        self.slot_track_id = np.full(n, -1, dtype=np.int64)
+        self.state = np.full(n, TrackState.DELETED.value, dtype=np.int8)
+        self.time_since_update = np.zeros(n, dtype=np.int16)
+        self.age = np.zeros(n, dtype=np.int32)
+        self.match_frequency = np.zeros(n, dtype=np.float32)
+        self.quality_score = np.zeros(n, dtype=np.float32)
+        self.boxes = np.zeros((n, 4), dtype=np.float32)  # Last bbox2d (x1, y1, x2, y2)
+        self.confidence = self._kalman.confidence  # Shared: drives process noise
     
     def process(self, detections: List, frame: np.ndarray) -> Dict:
         """
@@ -62,55 +81,153 @@ class Engine2Persistence:
         # 6. Manage ghost/deleted tracks
         self._manage_tracks()
         
+        # 7. Quality metrics for all tracks at once
+        self._update_quality()
+        
         return {
-            'tracks': list(self.tracks.values()),
+            'tracks': self._export_tracks(),
             'assignments': assignments
         }
     
     def _extract_features(self, frame: np.ndarray, detections: List) -> List[np.ndarray]:
-        """Extract ReID features for each detection. (2 ms)"""
-        # TODO: Implement OSNet ReID
-        return [np.zeros(512) for _ in detections]
+        """
+        Extract ReID features for each detection. (2 ms)
+        
+        All crops go through OSNet in batches of `batch_size_reid`
+        (one forward pass per batch, not per detection).
+        """
+        if self._reid is None or not detections:
+            return [EMPTY_EMBEDDING] * len(detections)
+        
+        crops = self._reid.crop_detections(frame, [d.bbox2d for d in detections])
+        embeddings = self._reid.extract_batch(crops, self.params['batch_size_reid'])
+        return list(embeddings.astype(EMBEDDING_DTYPE))
     
     def _predict_tracks(self):
         """Predict track positions using Kalman filter. (<1 ms)"""
-        for track in self.tracks.values():
-            if track.state != TrackState.DELETED:
-                # TODO: Implement Kalman prediction
-                pass
+        if self.tracks:
+            self._kalman.predict_all()
     
     def _associate(self, detections: List, features: List) -> Dict[int, int]:
-        """Associate detections to tracks. (<1 ms)"""
-        # TODO: Implement Hungarian algorithm
-        return {}
+        """
+        Associate detections to tracks. (<1 ms)
+        
+        Vectorized IoU / cosine cost matrices + Hungarian assignment
+        (see tracking.association).
+        
+        Returns:
+            Dict det_idx -> track_id
+        """
+        slots = np.flatnonzero(self._kalman.active)
+        if len(slots) == 0 or not detections:
+            return {}
+        
+        track_ids = self.slot_track_id[slots]
+        track_features = np.stack([self.tracks[int(t)].features for t in track_ids])
+        
+        matched, _, _ = associate_detections(
+            _detection_boxes(detections),
+            self.boxes[slots],
+            np.asarray(features),
+            track_features,
+            iou_threshold=self.params['iou_threshold'],
+            reid_threshold=self.params['match_threshold']
+        )
+        return {det_idx: int(track_ids[t]) for det_idx, t in matched.items()}
     
     def _update_matched(self, detections: List, features: List, assignments: Dict):
         """Update matched tracks with new observations. (<1 ms)"""
-        for det_idx, track_id in assignments.items():
-            if track_id in self.tracks:
-                track = self.tracks[track_id]
-                track.time_since_update = 0
-                track.state = TrackState.ACTIVE
-                # TODO: Update track with detection
+        slots = [self.tracks[track_id].slot for track_id in assignments.values()]
+        self.time_since_update[slots] = 0
+        self.state[slots] = TrackState.ACTIVE.value
+        if slots:
+            self.boxes[slots] = _detection_boxes([detections[i] for i in assignments])
+        # TODO: Update track with detection (self._kalman.update(slot, z))
     
     def _create_new_tracks(self, detections: List, features: List, assignments: Dict):
         """Create new tracks for unmatched detections."""
         matched_dets = set(assignments.keys())
         for i, det in enumerate(detections):
             if i not in matched_dets:
-                # TODO: Create new Track
+                # TODO: Create new Track (self._spawn_track(z, confidence))
                 pass
     
+    def _spawn_track(
+        self,
+        measurement: np.ndarray,
+        confidence: float,
+        box: Optional[np.ndarray] = None
+    ) -> Track:
+        """
+        Allocate a slot and register a new TENTATIVE track.
+        
+        Args:
+            measurement: [x, y, z, w, h]
+            confidence: Detection confidence
+            box: 2D box (x1, y1, x2, y2) used for IoU association
+        """
+        slot = self._kalman.allocate(measurement)
+        track = Track(track_id=self.next_track_id, slot=slot)
+        self.next_track_id += 1
+        
+        self.slot_track_id[slot] = track.track_id
+        self.state[slot] = TrackState.TENTATIVE.value
+        self.time_since_update[slot] = 0
+        self.age[slot] = 0
+        self.match_frequency[slot] = 0.0
+        self.confidence[slot] = confidence
+        self.boxes[slot] = 0.0 if box is None else box
+        
+        self.tracks[track.track_id] = track
+        return track
+    
     def _manage_tracks(self):
         """Manage ghost states and delete old tracks. (<1 ms)"""
-        max_age = self.params['ghost_max_age']
+        live = self._kalman.active
+        if not live.any():
+            return
         
-        for track_id, track in list(self.tracks.items()):
-            track.time_since_update += 1
-            
-            if track.state == TrackState.ACTIVE and track.time_since_update > 0:
-                track.state = TrackState.GHOST
-            
-            if track.time_since_update > max_age:
-                track.state = TrackState.DELETED
-                del self.tracks[track_id]
+        dead = age_tracks(
+            self.state, self.time_since_update, live, self.params['ghost_max_age']
+        )
+        for slot in np.flatnonzero(dead).tolist():
+            del self.tracks[int(self.slot_track_id[slot])]
+            self.slot_track_id[slot] = -1
+            self._kalman.release(slot)
+    
+    def _update_quality(self):
+        """
+        Vectorized Track.compute_quality_score over every slot.
+        
+        Free slots get a value too; it is overwritten before they are reused.
+        """
+        compute_quality(
+            self.age, self.match_frequency, self.confidence,
+            self.time_since_update, self.quality_score
+        )
+    
+    def _export_tracks(self) -> List[Track]:
+        """Refresh Track objects from the SoA arrays for external consumers."""
+        for track in self.tracks.values():
+            slot = track.slot
+            track.state = _STATES[self.state[slot]]
+            track.time_since_update = int(self.time_since_update[slot])
+            track.age = int(self.age[slot])
+            track.match_frequency = float(self.match_frequency[slot])
+            track.confidence = float(self.confidence[slot])
+            track.quality_score = float(self.quality_score[slot])
+        return list(self.tracks.values())
+
+
+# TrackState by value (SoA arrays store the int code)
+_STATES = {state.value: state for state in TrackState}
+
+
+def _detection_boxes(detections: List) -> np.ndarray:
+    """Detection bbox2d (x, y, width, height) -> [N, 4] (x1, y1, x2, y2)."""
+    boxes = np.array(
+        [(d.bbox2d.x, d.bbox2d.y, d.bbox2d.width, d.bbox2d.height) for d in detections],
+        dtype=np.float32
+    ).reshape(-1, 4)
+    boxes[:, 2:] += boxes[:, :2]
+    return boxes
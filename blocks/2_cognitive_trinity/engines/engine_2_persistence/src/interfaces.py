@@ -7,6 +7,21 @@ from typing import Tuple, Optional, List
 import numpy as np
 
 
+# ReID embeddings are stored in half precision (cosine similarity is
+# insensitive to it; halves memory traffic)
+EMBEDDING_DTYPE = np.float16
+
+# Shared placeholder for tracks/detections without an embedding yet.
+# Read-only: EMA updates always produce a new array.
+EMPTY_EMBEDDING = np.zeros(512, dtype=EMBEDDING_DTYPE)
+EMPTY_EMBEDDING.setflags(write=False)
+
+# Association copy of an embedding: int8 symmetric, q = round(e * 127).
+# Valid because embeddings are L2-normalized (components in [-1, 1]);
+# dot(q_a, q_b) * EMBEDDING_Q_SCALE**2 approximates cosine similarity.
+EMBEDDING_Q_SCALE = 1.0 / 127.0
+
+
 class TrackState(Enum):
     """Track lifecycle states."""
     TENTATIVE = 0    # New, unconfirmed (< 3 matches)
@@ -54,13 +69,17 @@ class Track:
     time_since_update: int = 0
     
     # Appearance (EMA updated)
-    features: np.ndarray = field(default_factory=lambda: np.zeros(512))
+    features: np.ndarray = field(default_factory=lambda: EMPTY_EMBEDDING)
+    features_q: Optional[np.ndarray] = None  # int8 copy (EMBEDDING_Q_SCALE)
     
     # Quality Metrics
     quality_score: float = 0.0
     match_frequency: float = 0.0
     confidence: float = 0.0
     
+    # Engine storage slot (row in its SoA arrays / BatchedKalman)
+    slot: Optional[int] = None
+    
     # Cache References
     smpl_ref: Optional[int] = None      # Cache key for Engine 1B (PERSON)
     ply_ref: Optional[str] = None       # PLY template reference (KNOWN)
@@ -72,6 +91,9 @@ class Track:
         """
         Compute quality score: weighted combination of reliability metrics.
         Range: 0.0 (poor) to 1.0 (excellent)
+        
+        Engine2Persistence computes this for all tracks at once
+        (`_update_quality`); keep the two formulas in sync.
         """
         age_factor = min(self.age / 30, 1.0)
         match_factor = self.match_frequency
@@ -1,4 +1,4 @@
 # Engine 2: Kalman Filter Module
-from .filter import AdaptiveKalman
+from .filter import AdaptiveKalman, BatchedKalman
 
-__all__ = ['AdaptiveKalman']
+__all__ = ['AdaptiveKalman', 'BatchedKalman']
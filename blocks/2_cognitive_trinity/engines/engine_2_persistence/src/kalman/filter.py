@@ -1,9 +1,11 @@
 # Engine 2: Adaptive Kalman Filter
 # Position/velocity prediction with adaptive noise
 
-from typing import Tuple
+from typing import List, Tuple
 import numpy as np
 
+from ..kernels import kalman_predict
+
 
 class AdaptiveKalman:
     """
@@ -42,6 +44,10 @@ class AdaptiveKalman:
         self.H[3, 6] = 1  # w
         self.H[4, 7] = 1  # h
         
+        # H only selects state entries: H @ P == P[_z_idx], so the update
+        # uses indexing instead of matmuls against H
+        self._z_idx = np.array([0, 1, 2, 6, 7])
+        
         # Process noise (base)
         self.Q_base = np.eye(self.dim_x) * 0.01
         self.Q = self.Q_base.copy()
@@ -97,14 +103,19 @@ class AdaptiveKalman:
         Returns:
             Updated state
         """
-        # Kalman gain
-        S = self.H @ self.P @ self.H.T + self.R
-        K = self.P @ self.H.T @ np.linalg.inv(S)
+        idx = self._z_idx
+        
+        # Innovation covariance S = H P H^T + R (SPD)
+        HP = self.P[idx]                  # H @ P
+        S = HP[:, idx] + self.R
+        
+        # Kalman gain K = P H^T S^-1 = (S^-1 H P)^T, solved (no explicit inverse)
+        K = np.linalg.solve(S, HP).T
         
         # Update
-        y = measurement - self.H @ self.x
+        y = measurement - self.x[idx]
         self.x = self.x + K @ y
-        self.P = (np.eye(self.dim_x) - K @ self.H) @ self.P
+        self.P = self.P - K @ HP
         
         return self.x.copy()
     
@@ -123,3 +134,104 @@ class AdaptiveKalman:
         """
         # TODO: Implement acceleration estimation
         return np.zeros(3)
+
+
+class BatchedKalman:
+    """
+    Bank of AdaptiveKalman filters stored as struct-of-arrays.
+    
+    State X [N, 8] and covariance P [N, 8, 8] for every slot live in
+    contiguous arrays, so predicting all tracks is one batched matmul
+    instead of N Python calls. Slots are handed out from a free list;
+    a track keeps its slot index for its lifetime.
+    
+    Same model (F, H, Q, R) as AdaptiveKalman.
+    """
+    
+    def __init__(self, max_tracks: int = 50):
+        model = AdaptiveKalman()
+        self.dim_x = model.dim_x
+        self.dim_z = model.dim_z
+        self.F = model.F
+        self.H = model.H
+        self.Q_base = model.Q_base
+        self.R = model.R
+        self._z_idx = model._z_idx
+        self._P0 = model.P
+        
+        self.max_tracks = max_tracks
+        self.X = np.zeros((max_tracks, self.dim_x))
+        self.P = np.tile(self._P0, (max_tracks, 1, 1))
+        self.confidence = np.ones(max_tracks)
+        self.active = np.zeros(max_tracks, dtype=bool)
+        
+        # Free slots (pop() hands out the lowest index first)
+        self._free: List[int] = list(range(max_tracks - 1, -1, -1))
+    
+    def allocate(self, measurement: np.ndarray) -> int:
+        """
+        Claim a slot and initialize it from a first measurement.
+        
+        Args:
+            measurement: [x, y, z, w, h]
+            
+        Returns:
+            Slot index
+        """
+        if not self._free:
+            raise RuntimeError(f"BatchedKalman full ({self.max_tracks} slots)")
+        
+        slot = self._free.pop()
+        self.X[slot] = 0.0
+        self.X[slot, self._z_idx] = measurement
+        self.P[slot] = self._P0
+        self.confidence[slot] = 1.0
+        self.active[slot] = True
+        return slot
+    
+    def release(self, slot: int):
+        """Return a slot to the free list."""
+        if self.active[slot]:
+            self.active[slot] = False
+            self._free.append(slot)
+    
+    def predict_all(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Predict every slot in one pass.
+        
+        Process noise is scaled per slot by 1 / max(confidence, 0.1).
+        Free slots are predicted too (cheaper than masking); they are
+        re-initialized on allocate().
+        
+        Returns:
+            (positions [N, 3], uncertainty [N, 3])
+        """
+        kalman_predict(self.F, self.Q_base, self.X, self.P, self.confidence)
+        
+        positions = self.X[:, :3]
+        uncertainty = np.sqrt(self.P[:, [0, 1, 2], [0, 1, 2]])
+        return positions, uncertainty
+    
+    def update(self, slot: int, measurement: np.ndarray) -> np.ndarray:
+        """
+        Update one slot with a measurement (see AdaptiveKalman.update).
+        
+        Args:
+            slot: Slot index
+            measurement: [x, y, z, w, h]
+            
+        Returns:
+            Updated state
+        """
+        idx = self._z_idx
+        P = self.P[slot]
+        
+        HP = P[idx]
+        S = HP[:, idx] + self.R
+        K = np.linalg.solve(S, HP).T
+        
+        y = measurement - self.X[slot, idx]
+        self.X[slot] += K @ y
+        self.P[slot] = P - K @ HP
+        
+        return self.X[slot].copy()
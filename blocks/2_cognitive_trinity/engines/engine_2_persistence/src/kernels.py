@@ -0,0 +1,237 @@
+# Engine 2: Numeric Kernels
+# Per-frame SoA track updates, JIT-compiled with Numba when available
+#
+# Each kernel has a vectorized NumPy version and a Numba loop version with
+# the same signature; the public name binds to Numba when it is installed.
+#   age_tracks(state, tsu, live, max_age) -> dead      (in place)
+#   compute_quality(age, match_frequency, confidence, tsu, out)
+#   kalman_predict(F, Q_base, X, P, confidence)         (in place)
+#   ema_normalize(current, new, alpha)                   (in place on current)
+#   ema_normalize_row(current, new, alpha, tol)          (1-D, in place)
+#   iou_matrix(a, b, out)                                (xyxy float32 boxes)
+#   filter_matches(rows, cols, cost, thr, n, m) -> rows, cols, free_rows, free_cols
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# TrackState codes (see interfaces.TrackState)
+_ACTIVE = 1
+_GHOST = 2
+_DELETED = 3
+
+
+def _age_tracks_np(state, tsu, live, max_age):
+    """Lifecycle step: age live slots, ACTIVE -> GHOST, expire -> DELETED."""
+    tsu[live] += 1
+    state[live & (state == _ACTIVE) & (tsu > 0)] = _GHOST
+    dead = live & (tsu > max_age)
+    state[dead] = _DELETED
+    return dead
+
+
+def _compute_quality_np(age, match_frequency, confidence, tsu, out):
+    """Track.compute_quality_score over every slot."""
+    age_factor = np.minimum(age / 30, 1.0)
+    recency_factor = np.maximum(1.0 - tsu / 30, 0.0)
+    out[:] = (
+        0.3 * age_factor +
+        0.3 * match_frequency +
+        0.2 * confidence +
+        0.2 * recency_factor
+    )
+
+
+def _kalman_predict_np(F, Q_base, X, P, confidence):
+    """BatchedKalman predict with confidence-scaled process noise."""
+    scale = 1.0 / np.maximum(confidence, 0.1)
+    X[:] = X @ F.T
+    P[:] = F @ P @ F.T + Q_base * scale[:, None, None]
+
+
+def _ema_normalize_np(current, new, alpha):
+    """Row-wise EMA blend followed by L2 normalization."""
+    current *= alpha
+    current += (1 - alpha) * new
+    inv = 1.0 / np.sqrt(np.einsum('ij,ij->i', current, current) + 1e-12)
+    current *= inv[:, None]
+
+
+def _ema_normalize_row_np(current, new, alpha, tol=0.0):
+    """Single-vector EMA blend, L2-normalized unless |norm^2 - 1| < tol."""
+    current *= alpha
+    current += (1 - alpha) * new
+    sq = float(np.dot(current, current))
+    if abs(sq - 1.0) >= tol:
+        current *= 1.0 / np.sqrt(sq + 1e-12)
+
+
+def _iou_matrix_np(a, b, out):
+    """Pairwise IoU of [N, 4] x [M, 4] xyxy boxes, broadcast into out [N, M]."""
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    
+    iw = np.minimum(a[:, None, 2], b[None, :, 2]) - np.maximum(a[:, None, 0], b[None, :, 0])
+    ih = np.minimum(a[:, None, 3], b[None, :, 3]) - np.maximum(a[:, None, 1], b[None, :, 1])
+    np.maximum(iw, 0, out=iw)
+    np.maximum(ih, 0, out=ih)
+    np.multiply(iw, ih, out=out)
+    
+    # Union reuses iw as scratch
+    np.add(area_a[:, None], area_b[None, :], out=iw)
+    iw -= out
+    np.maximum(iw, 1e-9, out=iw)
+    out /= iw
+
+
+def _filter_matches_np(rows, cols, cost, thr, n, m):
+    """Drop assignments above thr; masks mark rows/cols left unassigned."""
+    keep = cost[rows, cols] <= thr
+    rows = rows[keep]
+    cols = cols[keep]
+    free_rows = np.ones(n, dtype=np.bool_)
+    free_cols = np.ones(m, dtype=np.bool_)
+    free_rows[rows] = False
+    free_cols[cols] = False
+    return rows, cols, free_rows, free_cols
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _age_tracks_nb(state, tsu, live, max_age):
+        dead = np.zeros(live.shape[0], dtype=np.bool_)
+        for i in range(live.shape[0]):
+            if not live[i]:
+                continue
+            tsu[i] += 1
+            if state[i] == _ACTIVE and tsu[i] > 0:
+                state[i] = _GHOST
+            if tsu[i] > max_age:
+                state[i] = _DELETED
+                dead[i] = True
+        return dead
+
+    @njit(cache=True, fastmath=True)
+    def _compute_quality_nb(age, match_frequency, confidence, tsu, out):
+        for i in range(out.shape[0]):
+            age_factor = min(age[i] / 30, 1.0)
+            recency_factor = max(1.0 - tsu[i] / 30, 0.0)
+            out[i] = (
+                0.3 * age_factor +
+                0.3 * match_frequency[i] +
+                0.2 * confidence[i] +
+                0.2 * recency_factor
+            )
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _kalman_predict_nb(F, Q_base, X, P, confidence):
+        n, d = X.shape
+        for k in prange(n):
+            scale = 1.0 / max(confidence[k], 0.1)
+
+            # X = F x
+            x = X[k].copy()
+            for i in range(d):
+                acc = 0.0
+                for j in range(d):
+                    acc += F[i, j] * x[j]
+                X[k, i] = acc
+
+            # P = F P F^T + Q
+            FP = np.empty((d, d))
+            for i in range(d):
+                for j in range(d):
+                    acc = 0.0
+                    for m in range(d):
+                        acc += F[i, m] * P[k, m, j]
+                    FP[i, j] = acc
+            for i in range(d):
+                for j in range(d):
+                    acc = 0.0
+                    for m in range(d):
+                        acc += FP[i, m] * F[j, m]
+                    P[k, i, j] = acc + Q_base[i, j] * scale
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _ema_normalize_nb(current, new, alpha):
+        n, d = current.shape
+        beta = 1 - alpha
+        for k in prange(n):
+            sq = 0.0
+            for j in range(d):
+                v = alpha * current[k, j] + beta * new[k, j]
+                current[k, j] = v
+                sq += v * v
+            inv = 1.0 / np.sqrt(sq + 1e-12)
+            for j in range(d):
+                current[k, j] *= inv
+
+    @njit(cache=True, fastmath=True)
+    def _ema_normalize_row_nb(current, new, alpha, tol=0.0):
+        # Serial: one 512-vector is too small to amortize thread dispatch
+        beta = 1 - alpha
+        sq = 0.0
+        for j in range(current.shape[0]):
+            v = alpha * current[j] + beta * new[j]
+            current[j] = v
+            sq += v * v
+        if abs(sq - 1.0) < tol:
+            return
+        inv = 1.0 / np.sqrt(sq + 1e-12)
+        for j in range(current.shape[0]):
+            current[j] *= inv
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _iou_matrix_nb(a, b, out):
+        n = a.shape[0]
+        m = b.shape[0]
+        for i in prange(n):
+            area_a = (a[i, 2] - a[i, 0]) * (a[i, 3] - a[i, 1])
+            for j in range(m):
+                iw = min(a[i, 2], b[j, 2]) - max(a[i, 0], b[j, 0])
+                ih = min(a[i, 3], b[j, 3]) - max(a[i, 1], b[j, 1])
+                if iw <= 0 or ih <= 0:
+                    out[i, j] = 0.0
+                    continue
+                inter = iw * ih
+                area_b = (b[j, 2] - b[j, 0]) * (b[j, 3] - b[j, 1])
+                out[i, j] = inter / max(area_a + area_b - inter, 1e-9)
+
+    @njit(cache=True)
+    def _filter_matches_nb(rows, cols, cost, thr, n, m):
+        k = rows.shape[0]
+        out_rows = np.empty(k, dtype=np.int64)
+        out_cols = np.empty(k, dtype=np.int64)
+        free_rows = np.ones(n, dtype=np.bool_)
+        free_cols = np.ones(m, dtype=np.bool_)
+        count = 0
+        for i in range(k):
+            r = rows[i]
+            c = cols[i]
+            if cost[r, c] <= thr:
+                out_rows[count] = r
+                out_cols[count] = c
+                free_rows[r] = False
+                free_cols[c] = False
+                count += 1
+        return out_rows[:count], out_cols[:count], free_rows, free_cols
+
+    age_tracks = _age_tracks_nb
+    compute_quality = _compute_quality_nb
+    kalman_predict = _kalman_predict_nb
+    ema_normalize = _ema_normalize_nb
+    ema_normalize_row = _ema_normalize_row_nb
+    iou_matrix = _iou_matrix_nb
+    filter_matches = _filter_matches_nb
+else:
+    age_tracks = _age_tracks_np
+    compute_quality = _compute_quality_np
+    kalman_predict = _kalman_predict_np
+    ema_normalize = _ema_normalize_np
+    ema_normalize_row = _ema_normalize_row_np
+    iou_matrix = _iou_matrix_np
+    filter_matches = _filter_matches_np
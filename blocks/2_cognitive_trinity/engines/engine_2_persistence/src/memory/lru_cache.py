@@ -1,7 +1,9 @@
 # Engine 2: LRU Track Memory
 # Least Recently Updated cache for track storage
 
-from typing import Dict, Optional, List
+import heapq
+from itertools import islice
+from typing import Dict, Optional, List, Tuple
 from collections import OrderedDict
 from ..interfaces import Track, TrackState
 
@@ -11,18 +13,31 @@ class TrackMemory:
     LRU cache for track storage with automatic eviction.
     
     Max Size: 50 tracks
-    Eviction Policy: Lowest quality_score among oldest
+    Eviction Policy: Lowest quality_score among the least recently used half
     Memory per Track: ~100KB (history + embeddings)
+    
+    Tracks sit in a min-heap of (quality_score, counter, track_id)
+    maintained on put/update_quality; evicting pops until it reaches a
+    track in the LRU half (by its get/put touch stamp) instead of scanning
+    every score. Outdated entries (track removed, re-put or re-scored) are
+    skipped lazily when popped.
     """
     
     def __init__(self, max_size: int = 50):
         self.max_size = max_size
         self.tracks: OrderedDict[int, Track] = OrderedDict()
+        self._heap: List[Tuple[float, int, int]] = []
+        self._entry: Dict[int, int] = {}  # track_id -> counter of its live heap entry
+        self._counter = 0
+        self._touch: Dict[int, int] = {}  # track_id -> counter at last get/put
     
     def get(self, track_id: int) -> Optional[Track]:
         """
         Get track by ID, marking as recently used.
         
+        The cached Track itself is returned, so changes to it (e.g.
+        track.state = ...) are seen by get_active/get_all.
+        
         Args:
             track_id: Track identifier
             
@@ -32,6 +47,8 @@ class TrackMemory:
         if track_id in self.tracks:
             # Move to end (most recently used)
             self.tracks.move_to_end(track_id)
+            self._counter += 1
+            self._touch[track_id] = self._counter
             return self.tracks[track_id]
         return None
     
@@ -55,38 +72,82 @@ class TrackMemory:
             
             # Add new
             self.tracks[track_id] = track
+        
+        self._push(track_id, track.quality_score)
+        self._touch[track_id] = self._counter
+    
+    def update_quality(self, track_id: int, quality_score: float):
+        """
+        Set a cached track's quality_score and re-key it for eviction.
+        
+        Args:
+            track_id: Track identifier
+            quality_score: New score
+        """
+        track = self.tracks.get(track_id)
+        if track is not None:
+            track.quality_score = quality_score
+            self._push(track_id, quality_score)
     
     def remove(self, track_id: int):
         """Remove track from cache."""
         if track_id in self.tracks:
             del self.tracks[track_id]
+            del self._entry[track_id]
+            del self._touch[track_id]
+    
+    def _push(self, track_id: int, quality_score: float):
+        """Add a fresh heap entry for track_id (older ones become stale)."""
+        self._counter += 1
+        self._entry[track_id] = self._counter
+        heapq.heappush(self._heap, (quality_score, self._counter, track_id))
+        
+        # Bound heap growth from stale entries
+        if len(self._heap) > 4 * max(self.max_size, len(self.tracks)):
+            self._heap = [
+                (self.tracks[tid].quality_score, c, tid)
+                for tid, c in self._entry.items()
+            ]
+            heapq.heapify(self._heap)
     
     def _evict(self):
         """
-        Evict track with lowest quality_score among oldest.
+        Evict track with lowest quality_score among the oldest half.
         """
         if not self.tracks:
             return
         
-        # Find candidates (first half = oldest)
-        candidates = list(self.tracks.items())[:len(self.tracks) // 2 + 1]
-        
-        if not candidates:
-            # Fall back to first item
-            first_key = next(iter(self.tracks))
-            del self.tracks[first_key]
-            return
-        
-        # Find lowest quality
-        min_quality = float('inf')
-        evict_id = candidates[0][0]
+        # Candidates: the len // 2 + 1 least recently used tracks, i.e.
+        # touched no later than the last of them
+        cutoff = self._touch[next(islice(self.tracks, len(self.tracks) // 2, None))]
         
-        for track_id, track in candidates:
-            if track.quality_score < min_quality:
-                min_quality = track.quality_score
-                evict_id = track_id
+        skipped = []
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            quality, counter, track_id = entry
+            
+            # Skip stale entries
+            if self._entry.get(track_id) != counter:
+                continue
+            track = self.tracks[track_id]
+            if track.quality_score != quality:
+                # Score changed without update_quality: re-key, retry
+                self._counter += 1
+                self._entry[track_id] = self._counter
+                heapq.heappush(self._heap, (track.quality_score, self._counter, track_id))
+                continue
+            if self._touch[track_id] > cutoff:
+                # Recently used: keep its entry, look further
+                skipped.append(entry)
+                continue
+            
+            del self.tracks[track_id]
+            del self._entry[track_id]
+            del self._touch[track_id]
+            break
         
-        del self.tracks[evict_id]
+        for entry in skipped:
+            heapq.heappush(self._heap, entry)
     
     def get_all(self) -> List[Track]:
         """Get all tracks."""
@@ -94,8 +155,10 @@ class TrackMemory:
     
     def get_active(self) -> List[Track]:
         """Get only active (non-deleted) tracks."""
-        return [t for t in self.tracks.values() 
-                if t.state != TrackState.DELETED]
+        # Read each track's own state: tracks from get() may be changed
+        # in place, so no side index of deleted ids can stay in sync
+        deleted = TrackState.DELETED
+        return [t for t in self.tracks.values() if t.state is not deleted]
     
     def count(self) -> int:
         """Get number of tracks in cache."""
@@ -104,3 +167,6 @@ class TrackMemory:
     def clear(self):
         """Clear all tracks."""
         self.tracks.clear()
+        self._heap.clear()
+        self._entry.clear()
+        self._touch.clear()
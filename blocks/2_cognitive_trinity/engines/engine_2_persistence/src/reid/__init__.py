@@ -1,5 +1,16 @@
 # Engine 2: ReID Module - OSNet Re-Identification
 from .osnet import OSNetReID
-from .ema import update_embedding
+from .ema import (
+    update_embedding,
+    update_embeddings_batch,
+    quantize_embeddings,
+    dequantize_embeddings,
+)
 
-__all__ = ['OSNetReID', 'update_embedding']
+__all__ = [
+    'OSNetReID',
+    'update_embedding',
+    'update_embeddings_batch',
+    'quantize_embeddings',
+    'dequantize_embeddings',
+]
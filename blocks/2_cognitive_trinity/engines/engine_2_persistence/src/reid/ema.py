@@ -1,13 +1,28 @@
 # Engine 2: EMA Embedding Update
 # Exponential Moving Average for stable appearance model
 
+import threading
+
 import numpy as np
 
+from ..interfaces import EMBEDDING_DTYPE, EMBEDDING_Q_SCALE, EMPTY_EMBEDDING
+from ..kernels import ema_normalize, ema_normalize_row, _ema_normalize_np
+
+# Below this many rows the JIT kernel's thread dispatch costs more than it saves
+_BATCH_JIT_MIN = 32
+
+# Blends of unit vectors with |norm^2 - 1| below this skip re-normalization
+_UNIT_TOL = 1e-3
+
+# Per-thread float32 scratch for update_embedding (one per embedding size)
+_scratch = threading.local()
+
 
 def update_embedding(
     current_embedding: np.ndarray,
     new_embedding: np.ndarray,
-    alpha: float = 0.7
+    alpha: float = 0.7,
+    assume_normalized: bool = True
 ) -> np.ndarray:
     """
     Update embedding with EMA for temporal stability.
@@ -16,22 +31,87 @@ def update_embedding(
         current_embedding: Existing embedding [512]
         new_embedding: New observation embedding [512]
         alpha: Weight for current (0.7 = favor history)
+        assume_normalized: Inputs are unit vectors; a blend whose squared
+            norm is already within _UNIT_TOL of 1 is not rescaled
         
     Returns:
-        Updated embedding [512]
+        Updated embedding [512] (EMBEDDING_DTYPE, new array)
     """
-    if current_embedding is None or len(current_embedding) == 0:
-        return new_embedding.copy()
+    if (
+        current_embedding is None
+        or current_embedding is EMPTY_EMBEDDING
+        or len(current_embedding) == 0
+    ):
+        return new_embedding.astype(EMBEDDING_DTYPE)
     
-    # EMA update
-    updated = alpha * current_embedding + (1 - alpha) * new_embedding
+    # EMA update + re-normalize in one fused pass over float32 scratch
+    # (accumulate in float32, store in half precision)
+    updated = _scratch_buffer(len(current_embedding))
+    np.copyto(updated, current_embedding)
+    ema_normalize_row(
+        updated,
+        np.asarray(new_embedding, dtype=np.float32),
+        alpha,
+        _UNIT_TOL if assume_normalized else 0.0
+    )
     
-    # Re-normalize
-    norm = np.linalg.norm(updated)
-    if norm > 0:
-        updated = updated / norm
+    return updated.astype(EMBEDDING_DTYPE)
+
+
+def _scratch_buffer(size: int) -> np.ndarray:
+    """Thread-local float32 [size] buffer, reused across calls."""
+    buf = getattr(_scratch, 'buf', None)
+    if buf is None or buf.shape[0] != size:
+        buf = _scratch.buf = np.empty(size, dtype=np.float32)
+    return buf
+
+
+def update_embeddings_batch(
+    current: np.ndarray,
+    new: np.ndarray,
+    alpha: float = 0.7
+) -> np.ndarray:
+    """
+    Batched `update_embedding` for all matched tracks in one pass.
     
-    return updated
+    Args:
+        current: Existing embeddings [N, 512]
+        new: New observation embeddings [N, 512]
+        alpha: Weight for current (0.7 = favor history)
+        
+    Returns:
+        Updated, L2-normalized embeddings [N, 512] (EMBEDDING_DTYPE)
+    """
+    # float32 working copy is blended and normalized in place
+    updated = np.array(current, dtype=np.float32)
+    new = np.asarray(new, dtype=np.float32)
+    
+    if len(updated) > _BATCH_JIT_MIN:
+        ema_normalize(updated, new, alpha)
+    else:
+        _ema_normalize_np(updated, new, alpha)
+    
+    return updated.astype(EMBEDDING_DTYPE)
+
+
+def quantize_embeddings(embeddings: np.ndarray) -> np.ndarray:
+    """
+    Quantize L2-normalized embeddings to int8 (scale EMBEDDING_Q_SCALE).
+    
+    Args:
+        embeddings: [..., 512] normalized embeddings
+        
+    Returns:
+        int8 array of the same shape
+    """
+    q = np.multiply(embeddings, 1.0 / EMBEDDING_Q_SCALE, dtype=np.float32)
+    np.rint(q, out=q)
+    return q.astype(np.int8)
+
+
+def dequantize_embeddings(q: np.ndarray) -> np.ndarray:
+    """int8 embeddings -> float32 (inverse of `quantize_embeddings`)."""
+    return np.multiply(q, EMBEDDING_Q_SCALE, dtype=np.float32)
 
 
 def compute_embedding_confidence(
@@ -53,15 +133,15 @@ def compute_embedding_confidence(
     if current is None or new is None:
         return 0.5
     
-    # Cosine similarity
-    dot = np.dot(current, new)
-    norm_c = np.linalg.norm(current)
-    norm_n = np.linalg.norm(new)
+    # Cosine similarity (squared norms via vdot, one sqrt)
+    current = np.asarray(current, dtype=np.float32)
+    new = np.asarray(new, dtype=np.float32)
+    sq = np.vdot(current, current) * np.vdot(new, new)
     
-    if norm_c * norm_n == 0:
+    if sq == 0:
         return 0.5
     
-    similarity = dot / (norm_c * norm_n)
+    similarity = np.vdot(current, new) / np.sqrt(sq)
     
     # Map similarity [-1, 1] to confidence [0, 1]
     confidence = (similarity + 1) / 2
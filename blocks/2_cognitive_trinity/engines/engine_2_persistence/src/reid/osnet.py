@@ -4,14 +4,12 @@
 
 from typing import List, Tuple, Optional
 import numpy as np
+import cv2
 
-# Import shared inference backend
-try:
-    import sys
-    sys.path.insert(0, '../../../../shared')
-    from blocks.cognitive_trinity.shared.inference import InferenceBackend
-except ImportError:
-    InferenceBackend = None
+from ..interfaces import EMBEDDING_Q_SCALE
+
+# Shared inference backend (resolved once in the package __init__)
+from .. import InferenceBackend
 
 
 class OSNetReID:
@@ -45,6 +43,26 @@ class OSNetReID:
         self.embedding_dim = 512
         self._backend: Optional[InferenceBackend] = None
         self._input_size = (256, 128)  # H, W for person crops
+        self.max_batch = 16
+        
+        # Batch buffers (reused every frame; sized for max_batch)
+        h, w = self._input_size
+        self._resize_buf = np.empty((self.max_batch, h, w, 3), dtype=np.uint8)
+        self._pre_buf = np.empty((self.max_batch, 3, h, w), dtype=np.float32)
+        
+        # Embedding pool for extract_batch (grown geometrically, sliced per call)
+        self._embed_pool = np.empty((0, self.embedding_dim), dtype=np.float32)
+        self._max_crops_seen = 0
+        
+        # Normalized gallery for compute_similarity, keyed by
+        # (data pointer, shape, caller version); single entry
+        self._gallery_cache = {}
+        
+        # ImageNet normalization as a per-channel LUT over uint8 levels
+        mean = np.array([0.485, 0.456, 0.406], dtype=np.float32)
+        std = np.array([0.229, 0.224, 0.225], dtype=np.float32)
+        levels = np.arange(256, dtype=np.float32) / 255.0
+        self._norm_lut = ((levels[None, :] - mean[:, None]) / std[:, None]).astype(np.float32)
         
         if model_path:
             self.load(model_path, backend)
@@ -62,31 +80,165 @@ class OSNetReID:
             fp16=True
         )
         return self._backend.load()
-        all_embeddings = []
+    
+    @staticmethod
+    def crop_detections(frame: np.ndarray, bboxes: List) -> List[np.ndarray]:
+        """
+        Crop detections from the frame (views, no copy).
+        
+        Args:
+            frame: RGB frame [H, W, 3]
+            bboxes: Boxes with x, y, width, height (pixels)
+            
+        Returns:
+            List of crops [h, w, 3]
+        """
+        H, W = frame.shape[:2]
+        crops = []
+        for b in bboxes:
+            x1 = min(max(int(b.x), 0), W - 1)
+            y1 = min(max(int(b.y), 0), H - 1)
+            x2 = min(max(int(b.x + b.width), x1 + 1), W)
+            y2 = min(max(int(b.y + b.height), y1 + 1), H)
+            crops.append(frame[y1:y2, x1:x2])
+        return crops
+    
+    def preprocess(self, crops: List[np.ndarray]) -> np.ndarray:
+        """
+        Resize and normalize up to max_batch crops into one NCHW batch.
+        
+        Each crop is resized into its slot of a reused uint8 buffer; the
+        whole batch is then normalized with one LUT gather per channel.
+        The returned array is a view overwritten on the next call.
+        
+        Args:
+            crops: List of RGB crops [h, w, 3] uint8
+            
+        Returns:
+            Batch [B, 3, 256, 128] float32
+        """
+        n = len(crops)
+        h, w = self._input_size
+        resized = self._resize_buf[:n]
+        out = self._pre_buf[:n]
+        
+        for i, crop in enumerate(crops):
+            cv2.resize(crop, (w, h), dst=resized[i])
+        
+        for c in range(3):
+            np.take(self._norm_lut[c], resized[..., c], out=out[:, c])
+        
+        return out
+    
+    def extract(self, crops: List[np.ndarray], out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Extract L2-normalized embeddings for one batch (single forward pass).
+        
+        Args:
+            crops: Up to max_batch RGB crops
+            out: Optional float32 [B, 512] destination
+            
+        Returns:
+            embeddings: [B, 512] (`out` if given)
+        """
+        if not crops:
+            return np.zeros((0, self.embedding_dim), dtype=np.float32)
+        if self._backend is None:
+            raise RuntimeError("Model not loaded. Call load() first.")
+        
+        batch = self.preprocess(crops)
+        embeddings = self._backend.infer(batch).reshape(len(crops), -1)
+        
+        if out is None:
+            out = np.empty((len(crops), self.embedding_dim), dtype=np.float32)
+        np.copyto(out, embeddings)
+        
+        norms = np.sqrt(np.einsum('ij,ij->i', out, out))
+        out /= np.maximum(norms, 1e-8)[:, None]
+        return out
+    
+    def extract_batch(self, crops: List[np.ndarray], batch_size: int = 16) -> np.ndarray:
+        """
+        Extract embeddings for any number of crops, batch_size per forward pass.
+        
+        Each batch is written into a persistent pool, so no per-frame
+        allocation or vstack. The returned array is a view of that pool
+        and is overwritten on the next call; copy it to retain.
         
-        for i in range(0, len(crops), batch_size):
+        Args:
+            crops: RGB crops
+            batch_size: Crops per inference call (<= max_batch)
+            
+        Returns:
+            embeddings: [N, 512]
+        """
+        batch_size = min(batch_size, self.max_batch)
+        total = len(crops)
+        
+        if total > self._embed_pool.shape[0]:
+            self._embed_pool = np.empty(
+                (max(total, 2 * self._max_crops_seen), self.embedding_dim),
+                dtype=np.float32
+            )
+        self._max_crops_seen = max(self._max_crops_seen, total)
+        
+        for i in range(0, total, batch_size):
             batch = crops[i:i + batch_size]
-            embeddings = self.extract(batch)
-            all_embeddings.append(embeddings)
+            self.extract(batch, out=self._embed_pool[i:i + len(batch)])
         
-        if all_embeddings:
-            return np.vstack(all_embeddings)
-        return np.zeros((0, self.embedding_dim))
+        return self._embed_pool[:total]
     
-    def compute_similarity(self, query: np.ndarray, gallery: np.ndarray) -> np.ndarray:
+    def compute_similarity(
+        self,
+        query: np.ndarray,
+        gallery: np.ndarray,
+        gallery_version: Optional[int] = None
+    ) -> np.ndarray:
         """
         Compute cosine similarity between query and gallery.
         
+        When `gallery_version` is given, the normalized gallery is cached
+        and reused while (buffer, shape, version) are unchanged; the
+        caller must bump the version whenever it modifies the gallery
+        in place (e.g. BotSORT.features_version on EMA updates).
+        
         Args:
-            query: [Q, 512] query embeddings
-            gallery: [G, 512] gallery embeddings
+            query: [Q, 512] query embeddings (float, or int8 quantized)
+            gallery: [G, 512] gallery embeddings (float, or int8 quantized)
+            gallery_version: Caller's modification counter for `gallery`
             
         Returns:
             similarity: [Q, G] similarity matrix
         """
-        # Normalize
-        query_norm = query / (np.linalg.norm(query, axis=1, keepdims=True) + 1e-8)
-        gallery_norm = gallery / (np.linalg.norm(gallery, axis=1, keepdims=True) + 1e-8)
+        quantized = getattr(query, 'dtype', None) == np.int8 and getattr(gallery, 'dtype', None) == np.int8
+        query = np.asarray(query, dtype=np.float32)
+        
+        if quantized:
+            # Pre-normalized int8 embeddings (exact integer dots in float32)
+            similarity = query @ np.asarray(gallery, dtype=np.float32).T
+            similarity *= EMBEDDING_Q_SCALE * EMBEDDING_Q_SCALE
+            return similarity
+        
+        similarity = query @ self._normalized_gallery(gallery, gallery_version).T
+        
+        # Query norms from squared sums, applied to the [Q, G] product
+        sq_q = np.einsum('ij,ij->i', query, query)
+        similarity /= np.sqrt(sq_q + 1e-16)[:, None]
+        return similarity
+    
+    def _normalized_gallery(self, gallery: np.ndarray, version: Optional[int]) -> np.ndarray:
+        """L2-normalized float32 gallery, cached when versioned."""
+        gallery = np.asarray(gallery)
+        key = None
+        if version is not None:
+            key = (gallery.__array_interface__['data'][0], gallery.shape, version)
+            cached = self._gallery_cache.get(key)
+            if cached is not None:
+                return cached
+        
+        normalized = gallery.astype(np.float32)
+        normalized /= np.sqrt(np.einsum('ij,ij->i', normalized, normalized) + 1e-16)[:, None]
         
-        # Cosine similarity
-        return np.dot(query_norm, gallery_norm.T)
+        if key is not None:
+            self._gallery_cache = {key: normalized}
+        return normalized
@@ -1,51 +1,115 @@
 # Engine 2: Detection-to-Track Association
 # Hungarian algorithm for optimal matching
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import numpy as np
 
+from scipy.optimize import linear_sum_assignment
 
-def compute_iou_matrix(bboxes_a: List, bboxes_b: List) -> np.ndarray:
+try:
+    import lap  # lapjv: faster than scipy on dense 30x50 costs
+except ImportError:
+    lap = None
+
+from ..interfaces import EMBEDDING_Q_SCALE
+from ..kernels import filter_matches, iou_matrix, _iou_matrix_np
+
+# Pair count above which the JIT IoU kernel beats broadcasting
+_IOU_JIT_MIN = 10_000
+
+# Shared zero-size result for empty inputs (reshaped views, no allocation)
+_EMPTY_F32 = np.empty((0, 0), dtype=np.float32)
+_EMPTY_F32.setflags(write=False)
+
+
+def compute_iou_matrix(
+    bboxes_a: List,
+    bboxes_b: List,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
     """
     Compute IoU matrix between two sets of bounding boxes.
     
+    Broadcast over [N, 1] x [1, M] with per-box areas computed once;
+    above _IOU_JIT_MIN pairs the Numba kernel (if installed) writes
+    straight into `out` without [N, M] temporaries.
+    
     Args:
-        bboxes_a: First set of bboxes [N, 4]
-        bboxes_b: Second set of bboxes [M, 4]
+        bboxes_a: First set of bboxes [N, 4] (x1, y1, x2, y2)
+        bboxes_b: Second set of bboxes [M, 4] (x1, y1, x2, y2)
+        out: Optional float32 [N, M] buffer for the result
         
     Returns:
         IoU matrix [N, M]
     """
     if len(bboxes_a) == 0 or len(bboxes_b) == 0:
-        return np.zeros((len(bboxes_a), len(bboxes_b)))
+        return _EMPTY_F32.reshape(len(bboxes_a), len(bboxes_b))
+    
+    a = np.ascontiguousarray(bboxes_a, dtype=np.float32)
+    b = np.ascontiguousarray(bboxes_b, dtype=np.float32)
+    
+    if out is None:
+        out = np.empty((a.shape[0], b.shape[0]), dtype=np.float32)
+    
+    if out.size > _IOU_JIT_MIN:
+        iou_matrix(a, b, out)
+    else:
+        _iou_matrix_np(a, b, out)
     
-    # TODO: Implement actual IoU computation
-    return np.random.rand(len(bboxes_a), len(bboxes_b))
+    return out
 
 
-def compute_cosine_distance(features_a: np.ndarray, features_b: np.ndarray) -> np.ndarray:
+def compute_cosine_distance(
+    features_a: np.ndarray,
+    features_b: np.ndarray,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
     """
     Compute cosine distance matrix between feature sets.
     
+    Row norms come from squared sums (einsum) and are applied to the
+    [N, M] product, so the [N, D] / [M, D] inputs are never rescaled
+    into temporaries. If both sets are int8 (quantized, pre-normalized)
+    the product is only rescaled by EMBEDDING_Q_SCALE^2.
+    
     Args:
-        features_a: [N, D] feature matrix
-        features_b: [M, D] feature matrix
+        features_a: [N, D] feature matrix (float or int8)
+        features_b: [M, D] feature matrix (float or int8)
+        out: Optional float32 [N, M] buffer for the result
         
     Returns:
         Distance matrix [N, M] where 0=identical, 1=orthogonal
     """
     if len(features_a) == 0 or len(features_b) == 0:
-        return np.zeros((len(features_a), len(features_b)))
+        return _EMPTY_F32.reshape(len(features_a), len(features_b))
+    
+    quantized = _is_int8(features_a) and _is_int8(features_b)
+    
+    # FP16 embeddings are upcast once (FP16 GEMM is slow on CPU)
+    a = np.asarray(features_a, dtype=np.float32)
+    b = np.asarray(features_b, dtype=np.float32)
     
-    # Normalize features
-    a_norm = features_a / (np.linalg.norm(features_a, axis=1, keepdims=True) + 1e-8)
-    b_norm = features_b / (np.linalg.norm(features_b, axis=1, keepdims=True) + 1e-8)
+    if out is None:
+        out = np.empty((a.shape[0], b.shape[0]), dtype=np.float32)
+    np.matmul(a, b.T, out=out)
     
-    # Cosine similarity -> distance
-    similarity = np.dot(a_norm, b_norm.T)
-    distance = 1.0 - similarity
+    if quantized:
+        # Pre-normalized int8 (see EMBEDDING_Q_SCALE): integer dot products
+        # are exact in float32 (512 * 127^2 < 2^24), no row norms needed
+        out *= EMBEDDING_Q_SCALE * EMBEDDING_Q_SCALE
+    else:
+        sq_a = np.einsum('ij,ij->i', a, a)
+        sq_b = np.einsum('ij,ij->i', b, b)
+        out /= np.sqrt(np.outer(sq_a, sq_b) + 1e-16)
     
-    return distance
+    # Cosine similarity -> distance, in place
+    np.subtract(1.0, out, out=out)
+    
+    return out
+
+
+def _is_int8(features) -> bool:
+    return getattr(features, 'dtype', None) == np.int8
 
 
 def hungarian_matching(cost_matrix: np.ndarray, threshold: float) -> Tuple[Dict, List, List]:
@@ -61,10 +125,28 @@ def hungarian_matching(cost_matrix: np.ndarray, threshold: float) -> Tuple[Dict,
         unmatched_dets: List of unmatched detection indices
         unmatched_tracks: List of unmatched track indices
     """
-    # TODO: Implement using scipy.optimize.linear_sum_assignment
-    matched = {}
-    unmatched_dets = list(range(cost_matrix.shape[0]))
-    unmatched_tracks = list(range(cost_matrix.shape[1]))
+    n_dets, n_tracks = cost_matrix.shape
+    if n_dets == 0 or n_tracks == 0:
+        return {}, list(range(n_dets)), list(range(n_tracks))
+    
+    # Both backends assign first and gate afterwards (no lapjv cost_limit,
+    # which gates before assignment and can yield a different matching)
+    if lap is not None:
+        _, x, _ = lap.lapjv(cost_matrix, extend_cost=True)
+        rows = np.flatnonzero(x >= 0)
+        cols = x[rows]
+    else:
+        rows, cols = linear_sum_assignment(cost_matrix)
+    
+    # Reject assignments above threshold and mark leftovers in one pass
+    rows, cols, free_dets, free_tracks = filter_matches(
+        rows.astype(np.int64), cols.astype(np.int64),
+        cost_matrix, threshold, n_dets, n_tracks
+    )
+    
+    matched = dict(zip(rows.tolist(), cols.tolist()))
+    unmatched_dets = np.flatnonzero(free_dets).tolist()
+    unmatched_tracks = np.flatnonzero(free_tracks).tolist()
     
     return matched, unmatched_dets, unmatched_tracks
 
@@ -81,8 +163,8 @@ def associate_detections(
     Two-stage association: IoU then ReID.
     
     Args:
-        detections: Current frame detections
-        tracks: Existing tracks
+        detections: Current frame detection boxes [N, 4] (x1, y1, x2, y2)
+        tracks: Existing track boxes [M, 4] (x1, y1, x2, y2)
         features_det: Detection embeddings
         features_track: Track embeddings
         iou_threshold: IoU matching threshold
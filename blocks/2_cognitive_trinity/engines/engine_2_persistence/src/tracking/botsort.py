@@ -4,7 +4,10 @@
 from typing import List, Dict, Tuple
 import numpy as np
 
-from ..interfaces import Track, TrackState
+from ..interfaces import EMBEDDING_DTYPE, Track, TrackState
+from ..kalman.filter import AdaptiveKalman
+from ..kernels import age_tracks, ema_normalize, kalman_predict
+from ..reid.ema import quantize_embeddings
 
 
 class BotSORT:
@@ -20,18 +23,53 @@ class BotSORT:
     Reference: https://github.com/NirAharon/BoT-SORT
     """
     
-    def __init__(self, iou_threshold: float = 0.3, max_age: int = 30):
+    def __init__(
+        self,
+        iou_threshold: float = 0.3,
+        max_age: int = 30,
+        capacity: int = 256,
+        embedding_dim: int = 512
+    ):
         self.iou_threshold = iou_threshold
         self.max_age = max_age
-        self.tracks: Dict[int, Track] = {}
+        self.capacity = capacity
         self.next_id = 0
+        
+        # Track state as SoA, one row per slot
+        self._features = np.zeros((capacity, embedding_dim), dtype=np.float32)
+        self._features_q = np.zeros((capacity, embedding_dim), dtype=np.int8)
+        self._bboxes = np.zeros((capacity, 4), dtype=np.float32)  # x1, y1, x2, y2
+        self._ages = np.zeros(capacity, dtype=np.int32)  # int16 would wrap after ~9 min at 60 fps
+        self._tsu = np.zeros(capacity, dtype=np.int16)
+        self._states = np.zeros(capacity, dtype=np.int8)
+        self._valid = np.zeros(capacity, dtype=bool)
+        self._row_ids = np.full(capacity, -1, dtype=np.int64)
+        self._id_to_row: Dict[int, int] = {}
+        self._free = list(range(capacity - 1, -1, -1))
+        
+        # Kalman state per row, same model as AdaptiveKalman
+        model = AdaptiveKalman()
+        self._F = model.F
+        self._Q = model.Q_base
+        self._R = model.R
+        self._z_idx = model._z_idx
+        self._P0 = model.P
+        self._kf_state = np.zeros((capacity, model.dim_x))
+        self._kf_cov = np.tile(self._P0, (capacity, 1, 1))
+        self._kf_conf = np.ones(capacity)
+        
+        # Bumped whenever feature rows change (OSNetReID gallery cache key)
+        self.features_version = 0
+        
+        # Track views, rebuilt at update() return
+        self.tracks: Dict[int, Track] = {}
     
     def update(self, detections: List, features: List[np.ndarray]) -> List[Track]:
         """
         Update tracks with new detections.
         
         Args:
-            detections: List of bbox detections
+            detections: List of bbox detections [N, 4] (x1, y1, x2, y2)
             features: List of ReID embeddings
             
         Returns:
@@ -50,67 +88,180 @@ class BotSORT:
             detections, features, unmatched_dets_1, unmatched_tracks_1
         )
         
-        # Update matched tracks
-        for det_idx, track_id in {**matched_1, **matched_2}.items():
-            self._update_track(track_id, detections[det_idx], features[det_idx])
+        # Update matched tracks (stage 2 merged into stage 1's dict in place)
+        matched_1.update(matched_2)
+        if matched_1:
+            det_idx = list(matched_1.keys())
+            rows = np.array([self._id_to_row[t] for t in matched_1.values()], dtype=np.int64)
+            self._update_tracks(
+                rows,
+                np.asarray([detections[i] for i in det_idx], dtype=np.float32),
+                np.asarray([features[i] for i in det_idx], dtype=np.float32)
+            )
         
         # Create new tracks
         for det_idx in unmatched_dets_2:
             self._create_track(detections[det_idx], features[det_idx])
         
         # Age unmatched tracks
-        for track_id in unmatched_tracks_2:
-            self._age_track(track_id)
+        self._age_tracks(
+            np.array([self._id_to_row[t] for t in unmatched_tracks_2], dtype=np.int64)
+        )
         
-        return list(self.tracks.values())
+        return self._export_tracks()
     
     def _predict_all(self):
-        """Predict all track positions via Kalman."""
-        for track in self.tracks.values():
-            # TODO: Kalman predict
-            pass
+        """
+        Predict all track positions via Kalman (one batched pass).
+        
+        X @ F^T and F P F^T + Q over every row at once; free rows are
+        predicted too (cheaper than masking) and re-initialized on create.
+        """
+        kalman_predict(self._F, self._Q, self._kf_state, self._kf_cov, self._kf_conf)
+        _state_to_xyxy(self._kf_state, out=self._bboxes)
     
     def _iou_matching(self, detections, features) -> Tuple[Dict, List, List]:
         """Stage 1: IoU-based matching."""
         # TODO: Implement IoU matching with Hungarian algorithm
-        return {}, list(range(len(detections))), list(self.tracks.keys())
+        return {}, list(range(len(detections))), list(self._id_to_row.keys())
     
     def _reid_matching(self, detections, features, unmatched_dets, unmatched_tracks) -> Tuple[Dict, List, List]:
         """Stage 2: ReID-based matching."""
         # TODO: Implement ReID matching
         return {}, unmatched_dets, unmatched_tracks
     
-    def _update_track(self, track_id: int, detection, embedding: np.ndarray):
-        """Update track with new observation."""
-        if track_id in self.tracks:
-            track = self.tracks[track_id]
-            track.time_since_update = 0
-            track.age += 1
-            track.state = TrackState.ACTIVE
-            # EMA update for embedding
-            alpha = 0.7
-            track.features = alpha * track.features + (1 - alpha) * embedding
+    def _update_tracks(self, rows: np.ndarray, boxes: np.ndarray, embeddings: np.ndarray, alpha: float = 0.7):
+        """Update matched rows with new observations (one batched EMA)."""
+        self._tsu[rows] = 0
+        self._ages[rows] += 1
+        self._states[rows] = TrackState.ACTIVE.value
+        self._bboxes[rows] = boxes.reshape(-1, 4)
+        self._kalman_update(rows, _xyxy_to_z(boxes.reshape(-1, 4)))
+        
+        # EMA update for embeddings (gathered, blended in place, scattered back)
+        features = self._features[rows]
+        ema_normalize(features, embeddings, alpha)
+        self._features[rows] = features
+        self._features_q[rows] = quantize_embeddings(features)
+        self.features_version += 1
     
-    def _create_track(self, detection, embedding: np.ndarray) -> Track:
-        """Create new track from detection."""
-        track = Track(
-            track_id=self.next_id,
-            state=TrackState.TENTATIVE,
-            features=embedding
-        )
-        self.tracks[self.next_id] = track
+    def _create_track(self, detection, embedding: np.ndarray) -> int:
+        """Create new track from detection; returns its track ID."""
+        if not self._free:
+            self._grow()
+        row = self._free.pop()
+        
+        track_id = self.next_id
         self.next_id += 1
-        return track
+        
+        self._features[row] = embedding
+        self._features_q[row] = quantize_embeddings(self._features[row])
+        self.features_version += 1
+        self._bboxes[row] = np.asarray(detection, dtype=np.float32).reshape(4)
+        self._kf_state[row] = 0.0
+        self._kf_state[row, self._z_idx] = _xyxy_to_z(self._bboxes[row:row + 1])[0]
+        self._kf_cov[row] = self._P0
+        self._kf_conf[row] = 1.0
+        self._ages[row] = 0
+        self._tsu[row] = 0
+        self._states[row] = TrackState.TENTATIVE.value
+        self._valid[row] = True
+        self._row_ids[row] = track_id
+        self._id_to_row[track_id] = row
+        return track_id
     
-    def _age_track(self, track_id: int):
-        """Age track and transition to ghost/deleted."""
-        if track_id in self.tracks:
-            track = self.tracks[track_id]
-            track.time_since_update += 1
-            
-            if track.time_since_update > 0:
-                track.state = TrackState.GHOST
-            
-            if track.time_since_update > self.max_age:
-                track.state = TrackState.DELETED
-                del self.tracks[track_id]
+    def _kalman_update(self, rows: np.ndarray, z: np.ndarray):
+        """Batched Kalman update of `rows` with measurements z [n, 5]."""
+        idx = self._z_idx
+        P = self._kf_cov[rows]
+        
+        HP = P[:, idx]
+        S = HP[:, :, idx] + self._R
+        K = np.linalg.solve(S, HP).transpose(0, 2, 1)
+        
+        y = z - self._kf_state[rows][:, idx]
+        self._kf_state[rows] += np.einsum('nij,nj->ni', K, y)
+        self._kf_cov[rows] = P - K @ HP
+    
+    def _age_tracks(self, rows: np.ndarray):
+        """Age unmatched rows and transition to ghost/deleted."""
+        live = np.zeros(self.capacity, dtype=bool)
+        live[rows] = True
+        dead = age_tracks(self._states, self._tsu, live, self.max_age)
+        
+        # Any unmatched track is lost, TENTATIVE included (the shared kernel
+        # only demotes ACTIVE)
+        self._states[live & ~dead] = TrackState.GHOST.value
+        
+        for row in np.flatnonzero(dead).tolist():
+            del self._id_to_row[int(self._row_ids[row])]
+            self._valid[row] = False
+            self._row_ids[row] = -1
+            self._free.append(row)
+    
+    def _grow(self):
+        """Double slot capacity (rare; amortized O(1) per track)."""
+        old = self.capacity
+        self.capacity = old * 2
+        for name in (
+            '_features', '_features_q', '_bboxes', '_ages', '_tsu', '_states',
+            '_valid', '_row_ids', '_kf_state', '_kf_cov', '_kf_conf'
+        ):
+            arr = getattr(self, name)
+            grown = np.zeros((self.capacity,) + arr.shape[1:], dtype=arr.dtype)
+            grown[:old] = arr
+            setattr(self, name, grown)
+        self._row_ids[old:] = -1
+        self._free.extend(range(self.capacity - 1, old - 1, -1))
+        self.features_version += 1
+    
+    def _export_tracks(self) -> List[Track]:
+        """Materialize Track views for live rows."""
+        rows = np.flatnonzero(self._valid)
+        features = self._features[rows].astype(EMBEDDING_DTYPE)
+        
+        self.tracks = {
+            int(tid): Track(
+                track_id=int(tid),
+                state=_STATES[state],
+                age=age,
+                time_since_update=tsu,
+                features=feat,
+                features_q=feat_q,
+                slot=row
+            )
+            for row, tid, state, age, tsu, feat, feat_q in zip(
+                rows.tolist(),
+                self._row_ids[rows].tolist(),
+                self._states[rows].tolist(),
+                self._ages[rows].tolist(),
+                self._tsu[rows].tolist(),
+                features,
+                self._features_q[rows]
+            )
+        }
+        return list(self.tracks.values())
+
+
+_STATES = {s.value: s for s in TrackState}
+
+
+def _xyxy_to_z(boxes: np.ndarray) -> np.ndarray:
+    """[N, 4] (x1, y1, x2, y2) -> Kalman measurements [N, 5] (cx, cy, 0, w, h)."""
+    z = np.zeros((len(boxes), 5))
+    z[:, 3] = boxes[:, 2] - boxes[:, 0]
+    z[:, 4] = boxes[:, 3] - boxes[:, 1]
+    z[:, 0] = boxes[:, 0] + 0.5 * z[:, 3]
+    z[:, 1] = boxes[:, 1] + 0.5 * z[:, 4]
+    return z
+
+
+def _state_to_xyxy(X: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Kalman states [N, 8] -> boxes [N, 4] (x1, y1, x2, y2) written into out."""
+    half_w = 0.5 * X[:, 6]
+    half_h = 0.5 * X[:, 7]
+    out[:, 0] = X[:, 0] - half_w
+    out[:, 1] = X[:, 1] - half_h
+    out[:, 2] = X[:, 0] + half_w
+    out[:, 3] = X[:, 1] + half_h
+    return out
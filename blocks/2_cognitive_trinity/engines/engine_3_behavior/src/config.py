@@ -1,6 +1,8 @@
 # Engine 3: Behavior - Configuration
 # System parameters and thresholds
 
+import numpy as np
+
 ENGINE3_PARAMS = {
     # Prediction horizons
     'horizons': [1.0, 2.0, 3.0, 4.0, 5.0],  # seconds
@@ -55,6 +57,23 @@ INTENT_WEIGHTS = {
     'CROSSING': 1.0
 }
 
+# Integer-coded lookups for vectorized scoring (weights[ids] gathers).
+# The extra last slot holds the fallback for unrecognized labels.
+INTENT_ID = {state: i for i, state in enumerate(ENGINE3_PARAMS['intent_states'])}
+INTENT_UNKNOWN_ID = len(INTENT_ID)
+INTENT_WEIGHTS_ARR = np.array(
+    [INTENT_WEIGHTS[s] for s in INTENT_ID] + [0.5], dtype=np.float64
+)
+MARGIN_MULT_ARR = np.array(
+    [ENGINE3_PARAMS['margin_multipliers'][s] for s in INTENT_ID] + [1.0], dtype=np.float64
+)
+
+CATEGORY_ID = {category: i for i, category in enumerate(CATEGORY_WEIGHTS)}
+CATEGORY_UNKNOWN_ID = len(CATEGORY_ID)
+CATEGORY_WEIGHTS_ARR = np.array(
+    list(CATEGORY_WEIGHTS.values()) + [0.5], dtype=np.float64
+)
+
 # Timing budget (ms)
 TIMING = {
     'kinematic_prediction': 1,
@@ -1,12 +1,23 @@
 # Engine 3: Behavior - Entry Point
 # Prediction and risk assessment engine
 
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from functools import partial
+from typing import Deque, List, Dict, Optional
 import numpy as np
 
 from .interfaces import Prediction, Trajectory, Intent, TTCResult
-from .config import ENGINE3_PARAMS
+from .config import ENGINE3_PARAMS, MARGIN_MULT_ARR
+from .kinematic.predictor import predict_kinematic_v2
+from .kinematic.predictor_numba import (
+    predict_kinematic_batch, track_state_arrays, trajectories_from_batch
+)
+from .pose.smpl_predictor import predict_from_pose_v2
+from .tom.intent import infer_intent_v2
+from .validation.optical_flow import cross_validate_trajectory
+from .ttc.calculator import compute_ttc_v2
+from .risk.scorer import compute_risk_score_v2, compute_risk_scores_v2
 
 
 class Engine3Behavior:
@@ -22,8 +33,11 @@ class Engine3Behavior:
     
     def __init__(self):
         self.params = ENGINE3_PARAMS
-        self.prev_intents: Dict[int, List[Intent]] = {}
+        self.prev_intents: Dict[int, Deque[Intent]] = {}
         self.prev_risks: Dict[int, float] = {}
+        
+        # TTC bound to its fixed track limit once (no per-frame params lookup)
+        self._compute_ttc_fn = partial(compute_ttc_v2, max_tracks=self.params['max_tracks_ttc'])
     
     def process(
         self,
@@ -49,10 +63,10 @@ class Engine3Behavior:
         predictions = []
         risk_scores = {}
         
-        for track in tracks:
-            # 1. Kinematic prediction (1 ms total)
-            trajectories = self._predict_kinematic(track)
-            
+        # 1. Kinematic prediction, all tracks in one batch (1 ms total)
+        all_trajectories = self._predict_kinematic_all(tracks)
+        
+        for track, trajectories in zip(tracks, all_trajectories):
             # 2. Pose prediction (for persons)
             pose_pred = None
             if track.category == 'PERSON' and hasattr(track, 'smpl_params'):
@@ -83,18 +97,20 @@ class Engine3Behavior:
         # 6. Compute TTC with confidence intervals
         ttc_result = self._compute_ttc(train_state, predictions)
         
-        # 7. Calculate risk scores
-        for pred in predictions:
-            risk = self._compute_risk(
-                tracks[0] if tracks else None,
-                pred.intent,
-                ttc_result,
-                self.prev_risks.get(pred.track_id)
-            )
+        # 7. Calculate risk scores (one vectorized pass)
+        risks = self._compute_risks(
+            tracks[0] if tracks else None,
+            predictions,
+            ttc_result
+        )
+        for pred, risk in zip(predictions, risks):
             risk_scores[pred.track_id] = risk
             pred.risk_score = risk
             self.prev_risks[pred.track_id] = risk
         
+        # Drop history of tracks no longer reported by Engine 2
+        self._prune_history(tracks)
+        
         # 8. Determine validation status
         validation_status = self._determine_validation(predictions)
         
@@ -109,14 +125,20 @@ class Engine3Behavior:
             'validation_status': validation_status
         }
     
-    def _predict_kinematic(self, track) -> Dict[str, List]:
+    def _predict_kinematic(self, track) -> Dict[str, Dict]:
         """Constant acceleration trajectory prediction. (1 ms)"""
-        from .kinematic.predictor import predict_kinematic_v2
         return predict_kinematic_v2(track, self.params['horizons'])
     
+    def _predict_kinematic_all(self, tracks: List) -> List[Dict[str, Dict]]:
+        """Batched `_predict_kinematic` (SoA gather, one kernel call)."""
+        horizons = self.params['horizons']
+        pos, vel, acc = track_state_arrays(tracks)
+        return trajectories_from_batch(
+            predict_kinematic_batch(pos, vel, acc, horizons), horizons
+        )
+    
     def _predict_pose(self, track) -> Optional[Dict]:
         """SMPL pose-based prediction."""
-        from .pose.smpl_predictor import predict_from_pose_v2
         if hasattr(track, 'smpl_params') and hasattr(track, 'smpl_history'):
             return predict_from_pose_v2(
                 track.smpl_params,
@@ -127,34 +149,45 @@ class Engine3Behavior:
     
     def _infer_intent(self, track, context: str, train_state) -> Intent:
         """Theory of Mind intent inference."""
-        from .tom.intent import infer_intent_v2
-        intent_history = self.prev_intents.get(track.track_id, [])
+        intent_history = self.prev_intents.setdefault(track.track_id, deque(maxlen=5))
         intent = infer_intent_v2(track, None, context, intent_history, train_state)
         
-        # Update history
-        if track.track_id not in self.prev_intents:
-            self.prev_intents[track.track_id] = []
-        self.prev_intents[track.track_id].append(intent)
-        self.prev_intents[track.track_id] = self.prev_intents[track.track_id][-5:]
+        # Update history (bounded, O(1))
+        intent_history.append(intent)
         
         return intent
     
+    def _prune_history(self, tracks: List):
+        """Forget intent/risk history of deleted tracks."""
+        if len(self.prev_intents) <= len(tracks) and len(self.prev_risks) <= len(tracks):
+            return
+        live = {track.track_id for track in tracks}
+        for history in (self.prev_intents, self.prev_risks):
+            for track_id in [t for t in history if t not in live]:
+                del history[track_id]
+    
     def _cross_validate(self, trajectories, optical_flow, track) -> bool:
         """Validate prediction with optical flow."""
-        from .validation.optical_flow import cross_validate_trajectory
         result = cross_validate_trajectory(trajectories, optical_flow, track)
         return result == 'VALIDATED'
     
     def _compute_ttc(self, train_state, predictions) -> TTCResult:
         """TTC calculation with confidence intervals."""
-        from .ttc.calculator import compute_ttc_v2
-        return compute_ttc_v2(train_state, predictions, self.params['max_tracks_ttc'])
+        return self._compute_ttc_fn(train_state, predictions)
     
     def _compute_risk(self, track, intent, ttc_result, prev_risk) -> float:
         """Risk score calculation."""
-        from .risk.scorer import compute_risk_score_v2
         return compute_risk_score_v2(track, intent, ttc_result, prev_risk)
     
+    def _compute_risks(self, track, predictions, ttc_result) -> List[float]:
+        """Risk scores for all predictions (batched `_compute_risk`)."""
+        return compute_risk_scores_v2(
+            track,
+            [p.intent for p in predictions],
+            ttc_result,
+            [self.prev_risks.get(p.track_id) for p in predictions]
+        )
+    
     def _determine_validation(self, predictions) -> str:
         """Determine overall validation status."""
         if not predictions:
@@ -169,21 +202,16 @@ class Engine3Behavior:
     def _compute_safety_margin(self, predictions) -> float:
         """Compute adjusted safety margin based on intents."""
         base = self.params['base_safety_margin']
-        max_multiplier = 1.0
+        n = len(predictions)
+        if n == 0:
+            return base
         
-        for pred in predictions:
-            if pred.intent.state == 'CROSSING':
-                multiplier = 2.0
-            elif pred.intent.state == 'APPROACHING':
-                multiplier = 1.5
-            elif pred.intent.state == 'LEAVING':
-                multiplier = 0.8
-            else:
-                multiplier = 1.0
-            
-            if pred.intent.distraction_prob > 0.5:
-                multiplier *= 1.25
-            
-            max_multiplier = max(max_multiplier, multiplier)
+        ids = np.fromiter((p.intent.state_id for p in predictions), dtype=np.int8, count=n)
+        distraction = np.fromiter(
+            (p.intent.distraction_prob for p in predictions), dtype=np.float32, count=n
+        )
         
-        return base * max_multiplier
+        multipliers = MARGIN_MULT_ARR[ids] * np.where(
+            distraction > 0.5, self.params['distraction_multiplier'], 1.0
+        )
+        return base * float(multipliers.max(initial=1.0))
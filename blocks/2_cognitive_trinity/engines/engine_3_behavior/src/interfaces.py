@@ -3,9 +3,17 @@
 
 from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional
+import numpy as np
 
+from .config import INTENT_ID, INTENT_UNKNOWN_ID
 
-@dataclass
+# Shared read-only default for a missing SMPL body_pose (72 axis-angle values)
+EMPTY_BODY_POSE = np.zeros(72)
+EMPTY_BODY_POSE.setflags(write=False)
+EMPTY_FACING = EMPTY_BODY_POSE[:3]
+
+
+@dataclass(slots=True)
 class Trajectory:
     """
     Multi-scenario trajectory prediction.
@@ -16,7 +24,7 @@ class Trajectory:
     acceleration_used: bool = True
 
 
-@dataclass  
+@dataclass(slots=True)
 class Intent:
     """
     Theory of Mind intent inference result.
@@ -26,10 +34,14 @@ class Intent:
     awareness_prob: float         # [0, 1] 
     action_confidence: float      # [0, 1]
     smoothed: bool = False
-    probs: Dict[str, float] = field(default_factory=dict)
+    probs: Tuple[float, ...] = ()  # Per state in INTENT_ID order; () if unknown
+    state_id: int = field(init=False)  # INTENT_ID code of `state`
+    
+    def __post_init__(self):
+        self.state_id = INTENT_ID.get(self.state, INTENT_UNKNOWN_ID)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TTCResult:
     """
     Time-To-Collision with confidence intervals.
@@ -40,13 +52,13 @@ class TTCResult:
     confidence: float       # [0.3, 1.0]
 
 
-@dataclass
+@dataclass(slots=True)
 class Prediction:
     """
     Complete prediction for a single track.
     """
     track_id: int
-    trajectories: Dict[str, List]  # optimistic/nominal/pessimistic
+    trajectories: Dict[str, Dict]  # optimistic/nominal/pessimistic -> positions [H, 3], timestamps, uncertainty
     intent: Intent
     collision_prob: float
     ttc: float
@@ -54,7 +66,7 @@ class Prediction:
     validated: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TrainState:
     """
     Current train dynamics.
@@ -64,9 +76,19 @@ class TrainState:
     acceleration: Tuple[float, float, float] = (0.0, 0.0, 0.0)
     heading: float = 0.0                   # Heading angle (radians)
     speed: float = 0.0                     # Scalar speed (m/s)
+    
+    # Read-only float64 copies of position/velocity, built once
+    position_array: np.ndarray = field(init=False, repr=False, compare=False)
+    velocity_array: np.ndarray = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        for name, value in (('position_array', self.position), ('velocity_array', self.velocity)):
+            arr = np.array(value, dtype=np.float64)
+            arr.setflags(write=False)
+            object.__setattr__(self, name, arr)
 
 
-@dataclass
+@dataclass(slots=True)
 class BehaviorInput:
     """Input to Engine 3."""
     tracks: List
@@ -76,7 +98,7 @@ class BehaviorInput:
     optical_flow: Optional[object] = None
 
 
-@dataclass 
+@dataclass(slots=True)
 class BehaviorOutput:
     """Output from Engine 3."""
     predictions: List[Prediction]
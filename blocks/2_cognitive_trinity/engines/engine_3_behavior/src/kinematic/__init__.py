@@ -1,4 +1,5 @@
 # Engine 3: Kinematic Prediction Module
 from .predictor import predict_kinematic_v2
+from .predictor_numba import predict_kinematic_batch
 
-__all__ = ['predict_kinematic_v2']
+__all__ = ['predict_kinematic_v2', 'predict_kinematic_batch']
@@ -1,14 +1,62 @@
 # Engine 3: Kinematic Trajectory Predictor
 # Constant acceleration model for trajectory forecasting
 
-from typing import List, Dict, Tuple
+from functools import lru_cache
+from typing import Dict, Sequence, Tuple
 import numpy as np
 
+DEFAULT_HORIZONS = (1.0, 2.0, 3.0, 4.0, 5.0)
+
+SCENARIOS = ('optimistic', 'nominal', 'pessimistic')
+
+# Per-scenario position scale (rows follow SCENARIOS)
+SCENARIO_SCALE = np.array([
+    [0.9, 0.9, 1.1],  # Optimistic: slower approach (object moving away)
+    [1.0, 1.0, 1.0],  # Nominal
+    [1.1, 1.1, 0.9],  # Pessimistic: faster approach (object moving towards)
+])
+
+
+@lru_cache(maxsize=8)
+def _horizon_tables(horizons: Tuple[float, ...]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Read-only per-horizon tables, computed once per horizons tuple and
+    shared by every trajectory built from them.
+    
+    Returns:
+        (t [H], uncertainty 0.1×t² [H], basis [H, 3] rows (1, t, 0.5×t²))
+    """
+    t = np.array(horizons, dtype=np.float64)
+    t2 = t * t
+    uncertainty = 0.1 * t2
+    basis = np.stack([np.ones_like(t), t, 0.5 * t2], axis=1)
+    for arr in (t, uncertainty, basis):
+        arr.flags.writeable = False
+    return t, uncertainty, basis
+
+
+def scenario_trajectories(positions: np.ndarray, horizons: Sequence[float]) -> Dict[str, Dict]:
+    """
+    Trajectory dict for one track from its scenario positions.
+    
+    Args:
+        positions: [3, H, 3] positions (SCENARIOS, horizon, xyz)
+        horizons: Time points of axis 1 (seconds)
+        
+    Returns:
+        {scenario: {'positions': [H, 3], 'timestamps': [H], 'uncertainty': [H]}}
+    """
+    t, uncertainty, _ = _horizon_tables(tuple(horizons))
+    return {
+        name: {'positions': scenario, 'timestamps': t, 'uncertainty': uncertainty}
+        for name, scenario in zip(SCENARIOS, positions)
+    }
+
 
 def predict_kinematic_v2(
     track,
-    horizons: List[float] = [1.0, 2.0, 3.0, 4.0, 5.0]
-) -> Dict[str, List]:
+    horizons: Sequence[float] = DEFAULT_HORIZONS
+) -> Dict[str, Dict]:
     """
     Constant ACCELERATION trajectory prediction.
     
@@ -19,7 +67,8 @@ def predict_kinematic_v2(
         horizons: Time points to predict (seconds)
         
     Returns:
-        Dict with 'optimistic', 'nominal', 'pessimistic' trajectories
+        Dict with 'optimistic', 'nominal', 'pessimistic' trajectories, each
+        {'positions': [H, 3], 'timestamps': [H], 'uncertainty': [H]}
     """
     # Extract current state
     if hasattr(track, 'bbox_3d') and track.bbox_3d:
@@ -35,43 +84,13 @@ def predict_kinematic_v2(
     else:
         ax, ay, az = 0.0, 0.0, 0.0
     
-    trajectories = {
-        'optimistic': [],
-        'nominal': [],
-        'pessimistic': []
-    }
-    
-    for t in horizons:
-        # Base prediction with constant acceleration
-        future_x = x + vx * t + 0.5 * ax * t**2
-        future_y = y + vy * t + 0.5 * ay * t**2
-        future_z = z + vz * t + 0.5 * az * t**2
-        
-        # Uncertainty grows with t²
-        uncertainty = 0.1 * t**2
-        
-        # Nominal trajectory
-        trajectories['nominal'].append({
-            'position': (future_x, future_y, future_z),
-            'timestamp': t,
-            'uncertainty': uncertainty
-        })
-        
-        # Optimistic: slower approach (object moving away)
-        trajectories['optimistic'].append({
-            'position': (future_x * 0.9, future_y * 0.9, future_z * 1.1),
-            'timestamp': t,
-            'uncertainty': uncertainty
-        })
-        
-        # Pessimistic: faster approach (object moving towards)
-        trajectories['pessimistic'].append({
-            'position': (future_x * 1.1, future_y * 1.1, future_z * 0.9),
-            'timestamp': t,
-            'uncertainty': uncertainty
-        })
+    # Base prediction with constant acceleration [H, 3]:
+    # rows (1, t, 0.5×t²) times state rows (x₀, v₀, a)
+    basis = _horizon_tables(tuple(horizons))[2]
+    future = basis @ np.array([(x, y, z), (vx, vy, vz), (ax, ay, az)], dtype=np.float64)
     
-    return trajectories
+    # Scenario spread [3, H, 3]
+    return scenario_trajectories(future * SCENARIO_SCALE[:, None, :], horizons)
 
 
 def extrapolate_position(
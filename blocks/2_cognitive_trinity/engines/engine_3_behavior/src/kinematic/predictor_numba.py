@@ -0,0 +1,109 @@
+# Engine 3: Batched Kinematic Predictor
+# Constant acceleration model over all tracks at once (SoA in, tensor out)
+#
+# predict_kinematic_batch(pos, vel, acc, horizons) -> [N, 3, H, 3]
+#   axis 1: scenario (optimistic, nominal, pessimistic)
+#   axis 2: horizon
+#   axis 3: (x, y, z)
+# JIT-compiled with Numba when available, NumPy broadcast otherwise.
+
+from typing import Dict, List, Sequence
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+from .predictor import SCENARIOS, SCENARIO_SCALE, _horizon_tables, scenario_trajectories
+
+
+def _kinematic_np(pos, vel, acc, horizons, scale, out):
+    t = horizons[None, :, None]
+    base = pos[:, None, :] + vel[:, None, :] * t + 0.5 * acc[:, None, :] * (t * t)
+    np.multiply(base[:, None], scale[None, :, None, :], out=out)
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _kinematic_nb(pos, vel, acc, horizons, scale, out):
+        for n in prange(pos.shape[0]):
+            for h in range(horizons.shape[0]):
+                t = horizons[h]
+                t2 = t * t
+                for k in range(3):
+                    base = pos[n, k] + vel[n, k] * t + 0.5 * acc[n, k] * t2
+                    for s in range(3):
+                        out[n, s, h, k] = base * scale[s, k]
+
+    _kinematic = _kinematic_nb
+else:
+    _kinematic = _kinematic_np
+
+
+def predict_kinematic_batch(
+    pos: np.ndarray,
+    vel: np.ndarray,
+    acc: np.ndarray,
+    horizons: Sequence[float]
+) -> np.ndarray:
+    """
+    Constant acceleration prediction for N tracks in one pass.
+    
+    Args:
+        pos: Positions [N, 3]
+        vel: Velocities [N, 3]
+        acc: Accelerations [N, 3]
+        horizons: Time points to predict (seconds)
+        
+    Returns:
+        Positions [N, 3, H, 3] (scenario, horizon, xyz)
+    """
+    H = _horizon_tables(tuple(horizons))[0]
+    out = np.empty((len(pos), 3, len(H), 3))
+    if len(pos):
+        _kinematic(
+            np.ascontiguousarray(pos, dtype=np.float64),
+            np.ascontiguousarray(vel, dtype=np.float64),
+            np.ascontiguousarray(acc, dtype=np.float64),
+            H, SCENARIO_SCALE, out
+        )
+    return out
+
+
+def track_state_arrays(tracks: List):
+    """
+    Gather track kinematics into SoA arrays (same defaults as
+    predict_kinematic_v2).
+    
+    Returns:
+        (pos [N, 3], vel [N, 3], acc [N, 3])
+    """
+    n = len(tracks)
+    pos = np.empty((n, 3))
+    vel = np.zeros((n, 3))
+    acc = np.zeros((n, 3))
+    
+    for i, track in enumerate(tracks):
+        if hasattr(track, 'bbox_3d') and track.bbox_3d:
+            pos[i] = (track.bbox_3d.x, track.bbox_3d.y, track.bbox_3d.z)
+        else:
+            pos[i] = (0.0, 0.0, 10.0)  # Default forward position
+        if hasattr(track, 'velocity'):
+            vel[i] = track.velocity
+        if hasattr(track, 'acceleration'):
+            acc[i] = track.acceleration
+    
+    return pos, vel, acc
+
+
+def trajectories_from_batch(
+    positions: np.ndarray,
+    horizons: Sequence[float]
+) -> List[Dict[str, Dict]]:
+    """
+    Per-track trajectory dicts (predict_kinematic_v2 format) from a
+    predict_kinematic_batch tensor; positions are views into it.
+    """
+    return [scenario_trajectories(track_positions, horizons) for track_positions in positions]
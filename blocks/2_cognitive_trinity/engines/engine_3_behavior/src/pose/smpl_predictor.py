@@ -1,9 +1,12 @@
 # Engine 3: SMPL Pose Predictor
 # Using pose history to predict movement intention
 
+import math
 from typing import Dict, List, Tuple, Optional
 import numpy as np
 
+from ..interfaces import EMPTY_BODY_POSE, EMPTY_FACING
+
 # Constants
 DT = 1.0 / 60  # 60 fps
 
@@ -32,22 +35,22 @@ def predict_from_pose_v2(
             'walk_direction': 'unknown'
         }
     
-    # Current body facing direction
-    body_pose = smpl_params.get('body_pose', np.zeros(72))
-    body_facing = body_pose[:3] if len(body_pose) >= 3 else np.zeros(3)
-    facing_track = compute_angle_to_track(body_facing)
+    # Current body facing direction (only the yaw enters the angle)
+    body_pose = smpl_params.get('body_pose', EMPTY_BODY_POSE)
+    body_facing = body_pose[:3] if len(body_pose) >= 3 else EMPTY_FACING
+    yaw = float(body_facing[1])
+    facing_track = _yaw_angle_to_track(yaw)
     
     # Pose velocity from history
     if smpl_history and len(smpl_history) >= 2:
-        prev_pose = smpl_history[-1].get('body_pose', np.zeros(72))
-        prev_facing = prev_pose[:3] if len(prev_pose) >= 3 else np.zeros(3)
+        prev_pose = smpl_history[-1].get('body_pose', EMPTY_BODY_POSE)
+        prev_facing = prev_pose[:3] if len(prev_pose) >= 3 else EMPTY_FACING
         
-        pose_delta = body_facing - prev_facing
-        pose_velocity = pose_delta / DT
+        pose_velocity = body_facing - prev_facing
+        pose_velocity /= DT
         
-        # Predict future pose (0.5s ahead)
-        predicted_pose = body_facing + pose_velocity * 0.5
-        will_face_track = compute_angle_to_track(predicted_pose)
+        # Predict future pose (0.5s ahead); yaw only, no pose vector
+        will_face_track = _yaw_angle_to_track(yaw + float(pose_velocity[1]) * 0.5)
     else:
         pose_velocity = np.zeros(3)
         will_face_track = facing_track
@@ -77,14 +80,15 @@ def compute_angle_to_track(body_facing: np.ndarray) -> float:
     Returns:
         Angle in radians (0 = facing track)
     """
-    # Simplified: track is at Z axis
-    facing_vector = np.array([np.sin(body_facing[1]), 0, np.cos(body_facing[1])])
-    track_vector = np.array([0, 0, 1])
-    
-    dot = np.dot(facing_vector, track_vector)
-    angle = np.arccos(np.clip(dot, -1.0, 1.0))
-    
-    return angle
+    return _yaw_angle_to_track(float(body_facing[1]))
+
+
+def _yaw_angle_to_track(yaw: float) -> float:
+    """compute_angle_to_track from the yaw alone (radians, [0, π])."""
+    # Simplified: track is at Z axis. facing = (sin θ, 0, cos θ), so the
+    # angle to (0, 0, 1) is arccos(cos θ) = |θ| wrapped to [0, π]; an IEEE
+    # remainder by 2π wraps θ to [-π, π] exactly, with no sin/cos/atan2
+    return abs(math.remainder(yaw, math.tau))
 
 
 def infer_walk_direction(velocity: Tuple[float, float, float]) -> str:
@@ -95,9 +99,9 @@ def infer_walk_direction(velocity: Tuple[float, float, float]) -> str:
         'towards_track' | 'away_from_track' | 'parallel' | 'stationary'
     """
     vx, vy, vz = velocity
-    speed = np.sqrt(vx**2 + vy**2 + vz**2)
+    speed2 = vx * vx + vy * vy + vz * vz
     
-    if speed < 0.1:  # Nearly stationary
+    if speed2 < 0.1 * 0.1:  # Nearly stationary (squared speed, no sqrt)
         return 'stationary'
     
     # Dominant direction
@@ -1,4 +1,4 @@
 # Engine 3: Risk Score Module
-from .scorer import compute_risk_score_v2
+from .scorer import compute_risk_score_v2, compute_risk_scores_v2
 
-__all__ = ['compute_risk_score_v2']
+__all__ = ['compute_risk_score_v2', 'compute_risk_scores_v2']
@@ -1,11 +1,26 @@
 # Engine 3: Risk Score Calculator
 # Multi-factor risk scoring with quality and temporal smoothing
 
-from typing import Optional
+from typing import List, Optional
 import numpy as np
 
+from ..config import (
+    CATEGORY_ID,
+    CATEGORY_UNKNOWN_ID,
+    CATEGORY_WEIGHTS_ARR,
+    INTENT_ID,
+    INTENT_WEIGHTS_ARR,
+)
 from ..interfaces import Intent, TTCResult
 
+# Python-float copies of the weight tables for the scalar path (indexing
+# the arrays would return NumPy scalars and make every op below a NumPy op)
+_INTENT_WEIGHTS = INTENT_WEIGHTS_ARR.tolist()
+_CATEGORY_WEIGHTS = CATEGORY_WEIGHTS_ARR.tolist()
+
+# Category value (enum member or string) -> CATEGORY_ID, filled on first use
+_category_ids = {}
+
 
 def compute_risk_score_v2(
     track,
@@ -32,52 +47,24 @@ def compute_risk_score_v2(
     Returns:
         Risk score [0.0, 1.0]
     """
-    # TTC factor (use conservative min)
-    ttc = ttc_result.min if ttc_result else float('inf')
-    if ttc == float('inf'):
-        ttc_factor = 0.0
-    else:
-        ttc_factor = 1.0 - min(ttc / 10.0, 1.0)
+    ttc_factor, track_factor, confidence = _shared_factors(track, ttc_result)
     
     # Intent factor
-    intent_weights = {
-        'STATIC': 0.1,
-        'LEAVING': 0.2,
-        'APPROACHING': 0.7,
-        'CROSSING': 1.0
-    }
-    intent_state = intent.state if intent else 'STATIC'
-    intent_factor = intent_weights.get(intent_state, 0.5)
+    intent_id = intent.state_id if intent else INTENT_ID['STATIC']
+    intent_factor = _INTENT_WEIGHTS[intent_id]
     
     # Distraction factor
     distraction_factor = intent.distraction_prob if intent else 0.0
     
-    # Category factor
-    category_weights = {
-        'PERSON': 1.0,
-        'KNOWN': 0.7,
-        'UNKNOWN': 0.3
-    }
-    category = track.category if hasattr(track, 'category') else 'UNKNOWN'
-    if hasattr(category, 'value'):
-        category = category.value
-    category_factor = category_weights.get(str(category), 0.5)
-    
-    # Quality factor (low quality = less certain = higher risk)
-    quality_score = track.quality_score if hasattr(track, 'quality_score') else 0.5
-    quality_factor = 1.0 - quality_score
-    
     # Weighted combination
     raw_risk = (
         0.35 * ttc_factor +
         0.25 * intent_factor +
         0.15 * distraction_factor +
-        0.10 * category_factor +
-        0.15 * quality_factor
+        track_factor
     )
     
     # Modulate by TTC confidence (low confidence = higher risk)
-    confidence = ttc_result.confidence if ttc_result else 1.0
     confidence_adjusted = raw_risk * (2.0 - confidence)
     
     # Temporal smoothing
@@ -86,4 +73,97 @@ def compute_risk_score_v2(
     else:
         final_risk = confidence_adjusted
     
-    return float(np.clip(final_risk, 0, 1))
+    return float(min(max(final_risk, 0.0), 1.0))
+
+
+def compute_risk_scores_v2(
+    track,
+    intents: List[Optional[Intent]],
+    ttc_result: TTCResult,
+    prev_risks: List[Optional[float]]
+) -> List[float]:
+    """
+    Vectorized `compute_risk_score_v2` over many intents.
+    
+    Intent weights are gathered by integer state id; the TTC, category
+    and quality factors are shared by all entries.
+    
+    Args:
+        track: Track with category, quality_score
+        intents: Inferred intent per prediction
+        ttc_result: TTC with confidence
+        prev_risks: Previous frame's risk per prediction (None if new)
+        
+    Returns:
+        Risk scores [0.0, 1.0], one per intent
+    """
+    n = len(intents)
+    if n == 0:
+        return []
+    
+    ttc_factor, track_factor, confidence = _shared_factors(track, ttc_result)
+    static_id = INTENT_ID['STATIC']
+    
+    ids = np.fromiter(
+        (i.state_id if i else static_id for i in intents), dtype=np.int8, count=n
+    )
+    distraction = np.fromiter(
+        (i.distraction_prob if i else 0.0 for i in intents), dtype=np.float64, count=n
+    )
+    prev = np.fromiter(
+        (np.nan if r is None else r for r in prev_risks), dtype=np.float64, count=n
+    )
+    
+    raw_risk = (
+        0.35 * ttc_factor +
+        0.25 * INTENT_WEIGHTS_ARR[ids] +
+        0.15 * distraction +
+        track_factor
+    )
+    risk = raw_risk * (2.0 - confidence)
+    
+    # Temporal smoothing where a previous score exists
+    has_prev = ~np.isnan(prev)
+    risk[has_prev] = 0.7 * risk[has_prev] + 0.3 * prev[has_prev]
+    
+    return np.clip(risk, 0, 1).tolist()
+
+
+def _shared_factors(track, ttc_result: TTCResult):
+    """TTC factor, weighted category+quality term, and TTC confidence."""
+    # TTC factor (use conservative min)
+    ttc = ttc_result.min if ttc_result else float('inf')
+    if ttc == float('inf'):
+        ttc_factor = 0.0
+    else:
+        ttc_factor = 1.0 - min(ttc / 10.0, 1.0)
+    
+    # Category factor
+    category = track.category if hasattr(track, 'category') else 'UNKNOWN'
+    category_factor = _CATEGORY_WEIGHTS[_category_id(category)]
+    
+    # Quality factor (low quality = less certain = higher risk)
+    quality_score = track.quality_score if hasattr(track, 'quality_score') else 0.5
+    quality_factor = 1.0 - quality_score
+    
+    confidence = ttc_result.confidence if ttc_result else 1.0
+    return ttc_factor, 0.10 * category_factor + 0.15 * quality_factor, confidence
+
+
+def _category_id(category) -> int:
+    """CATEGORY_ID of a category enum member or string (memoized per value)."""
+    try:
+        return _category_ids[category]
+    except KeyError:
+        pass
+    except TypeError:  # Unhashable; resolve without caching
+        return _resolve_category_id(category)
+    
+    category_id = _category_ids[category] = _resolve_category_id(category)
+    return category_id
+
+
+def _resolve_category_id(category) -> int:
+    if hasattr(category, 'value'):
+        category = category.value
+    return CATEGORY_ID.get(str(category), CATEGORY_UNKNOWN_ID)
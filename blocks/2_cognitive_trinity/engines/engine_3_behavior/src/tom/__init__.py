@@ -1,6 +1,6 @@
 # Engine 3: Theory of Mind Module
 from .intent import infer_intent_v2
-from .priors import get_context_priors
+from .priors import get_context_priors, get_context_prior_row
 from .smoothing import smooth_intent
 
-__all__ = ['infer_intent_v2', 'get_context_priors', 'smooth_intent']
+__all__ = ['infer_intent_v2', 'get_context_priors', 'get_context_prior_row', 'smooth_intent']
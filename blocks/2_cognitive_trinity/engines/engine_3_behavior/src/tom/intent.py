@@ -1,11 +1,12 @@
 # Engine 3: Theory of Mind - Intent Inference
 # Bayesian intent inference with context and smoothing
 
-from typing import Dict, List, Optional
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
 import numpy as np
 
-from ..interfaces import Intent
-from .priors import get_context_priors
+from ..interfaces import EMPTY_BODY_POSE, Intent
+from .priors import get_context_prior_row
 from .smoothing import smooth_intent
 
 INTENT_STATES = ['STATIC', 'LEAVING', 'APPROACHING', 'CROSSING']
@@ -31,12 +32,13 @@ def infer_intent_v2(
     Returns:
         Smoothed Intent
     """
-    # Get context-adaptive priors
-    priors = get_context_priors(context)
+    # Get context-adaptive priors (INTENT_STATES order)
+    priors = get_context_prior_row(context)
     
     # Observations
     velocity = track.velocity if hasattr(track, 'velocity') else (0, 0, 0)
-    velocity_mag = np.linalg.norm(velocity)
+    # Python float, so the evidence tests in update_bayesian stay scalar
+    velocity_mag = math.hypot(*velocity)
     
     facing_track = is_facing_track(smpl_params) if smpl_params else 0.5
     moving_towards = is_moving_towards_track(velocity)
@@ -44,8 +46,8 @@ def infer_intent_v2(
     # Distraction detection
     distraction_prob = compute_distraction(smpl_params, track)
     
-    # Awareness check
-    awareness_prob = compute_gaze_awareness(smpl_params, train_state)
+    # Awareness check (reuses the facing score computed above)
+    awareness_prob = compute_gaze_awareness(smpl_params, train_state, facing=facing_track)
     
     # Update posteriors with Bayesian inference
     posteriors = update_bayesian(priors, {
@@ -55,13 +57,13 @@ def infer_intent_v2(
         'distracted': distraction_prob
     })
     
-    # Create raw intent
-    state = max(posteriors, key=posteriors.get)
+    # Create raw intent (first maximum wins ties)
+    best = posteriors.index(max(posteriors))
     raw_intent = Intent(
-        state=state,
+        state=INTENT_STATES[best],
         distraction_prob=distraction_prob,
         awareness_prob=awareness_prob,
-        action_confidence=posteriors[state],
+        action_confidence=posteriors[best],
         probs=posteriors,
         smoothed=False
     )
@@ -75,12 +77,13 @@ def is_facing_track(smpl_params: Dict) -> float:
     if smpl_params is None:
         return 0.5
     
-    body_pose = smpl_params.get('body_pose', np.zeros(72))
+    body_pose = smpl_params.get('body_pose', EMPTY_BODY_POSE)
     # Simplified: check Y rotation
-    facing_angle = body_pose[1] if len(body_pose) > 1 else 0
+    facing_angle = float(body_pose[1]) if len(body_pose) > 1 else 0.0
     
-    # Near 0 or π means facing track
-    return 1.0 - abs(facing_angle % np.pi) / np.pi
+    # Near 0 or π means facing track (Python-float math, no NumPy scalars;
+    # % π is already non-negative)
+    return 1.0 - (facing_angle % math.pi) / math.pi
 
 
 def is_moving_towards_track(velocity) -> float:
@@ -119,7 +122,7 @@ def compute_distraction(smpl_params: Optional[Dict], track) -> float:
 
 def is_head_down(smpl_params: Dict) -> float:
     """Check if head is tilted down (looking at phone)."""
-    body_pose = smpl_params.get('body_pose', np.zeros(72))
+    body_pose = smpl_params.get('body_pose', EMPTY_BODY_POSE)
     # Head pose is typically indices 15-17 in body_pose
     if len(body_pose) > 15:
         head_tilt = body_pose[15]
@@ -129,32 +132,41 @@ def is_head_down(smpl_params: Dict) -> float:
 
 def has_arms_at_ears(smpl_params: Dict) -> float:
     """Check if arms are raised to ears (phone call)."""
-    body_pose = smpl_params.get('body_pose', np.zeros(72))
+    body_pose = smpl_params.get('body_pose', EMPTY_BODY_POSE)
     # Arm poses are indices 48-53 (left) and 54-59 (right)
     # Simplified check
     return 0.0
 
 
-def compute_gaze_awareness(smpl_params: Optional[Dict], train_state) -> float:
+def compute_gaze_awareness(
+    smpl_params: Optional[Dict],
+    train_state,
+    facing: Optional[float] = None
+) -> float:
     """
     Compute probability that person is aware of train.
+    
+    `facing` is is_facing_track(smpl_params) when the caller already has it.
     """
     if smpl_params is None:
         return 0.5
     
     # Check if head is facing train direction
-    facing = is_facing_track(smpl_params)
+    if facing is None:
+        facing = is_facing_track(smpl_params)
     head_down = is_head_down(smpl_params)
     
     awareness = facing * (1.0 - head_down)
     return awareness
 
 
-def update_bayesian(priors: Dict[str, float], observations: Dict) -> Dict[str, float]:
+def update_bayesian(priors: Sequence[float], observations: Dict) -> Tuple[float, ...]:
     """
     Update priors with observations using Bayesian inference.
+    
+    Priors and posteriors are positional, in INTENT_STATES order.
     """
-    posteriors = priors.copy()
+    static, leaving, approaching, crossing = priors
     
     velocity = observations.get('velocity', 0)
     facing = observations.get('facing', 0.5)
@@ -163,23 +175,23 @@ def update_bayesian(priors: Dict[str, float], observations: Dict) -> Dict[str, f
     
     # Static: low velocity
     if velocity < 0.1:
-        posteriors['STATIC'] *= 2.0
-        posteriors['CROSSING'] *= 0.5
+        static *= 2.0
+        crossing *= 0.5
     
     # Approaching: moving towards track
     if moving_towards > 0.7:
-        posteriors['APPROACHING'] *= 2.0
-        posteriors['LEAVING'] *= 0.3
+        approaching *= 2.0
+        leaving *= 0.3
     
     # Leaving: moving away
     if moving_towards < 0.3:
-        posteriors['LEAVING'] *= 2.0
-        posteriors['APPROACHING'] *= 0.3
+        leaving *= 2.0
+        approaching *= 0.3
     
     # Crossing: high velocity + facing track
     if velocity > 0.5 and facing > 0.7:
-        posteriors['CROSSING'] *= 2.0
+        crossing *= 2.0
     
     # Normalize
-    total = sum(posteriors.values())
-    return {k: v/total for k, v in posteriors.items()}
+    total = static + leaving + approaching + crossing
+    return (static / total, leaving / total, approaching / total, crossing / total)
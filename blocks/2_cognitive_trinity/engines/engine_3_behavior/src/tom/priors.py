@@ -1,8 +1,9 @@
 # Engine 3: Context-Adaptive Priors
 # Scene context affects intent priors
 
-from typing import Dict
+from typing import Dict, Tuple
 
+from ..config import INTENT_ID
 
 CONTEXT_PRIORS = {
     'LEVEL_CROSSING': {
@@ -31,6 +32,14 @@ CONTEXT_PRIORS = {
     }
 }
 
+# Positional form: one row per context, values in INTENT_ID order
+# (STATIC, LEAVING, APPROACHING, CROSSING)
+CONTEXT_ID = {context: i for i, context in enumerate(CONTEXT_PRIORS)}
+CONTEXT_PRIOR_ROWS = tuple(
+    tuple(float(priors[state]) for state in INTENT_ID)
+    for priors in CONTEXT_PRIORS.values()
+)
+
 
 def get_context_priors(scene_context: str) -> Dict[str, float]:
     """
@@ -43,3 +52,16 @@ def get_context_priors(scene_context: str) -> Dict[str, float]:
         Prior probabilities for each intent state
     """
     return CONTEXT_PRIORS.get(scene_context, CONTEXT_PRIORS['OPEN_TRACK'])
+
+
+def get_context_prior_row(scene_context: str) -> Tuple[float, ...]:
+    """
+    Positional form of get_context_priors (INTENT_ID order).
+    
+    Args:
+        scene_context: LEVEL_CROSSING | PLATFORM | OPEN_TRACK
+        
+    Returns:
+        Prior probabilities (STATIC, LEAVING, APPROACHING, CROSSING)
+    """
+    return CONTEXT_PRIOR_ROWS[CONTEXT_ID.get(scene_context, CONTEXT_ID['OPEN_TRACK'])]
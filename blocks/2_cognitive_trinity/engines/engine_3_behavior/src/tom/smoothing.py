@@ -5,6 +5,7 @@ from typing import List
 from ..interfaces import Intent
 
 INTENT_STATES = ['STATIC', 'LEAVING', 'APPROACHING', 'CROSSING']
+_NO_PROBS = (0.0,) * len(INTENT_STATES)
 
 
 def smooth_intent(
@@ -35,27 +36,31 @@ def smooth_intent(
     
     previous = intent_history[-1]
     
-    # Smooth probabilities
-    smoothed_probs = {}
-    for state in INTENT_STATES:
-        current_prob = current_intent.probs.get(state, 0)
-        prev_prob = previous.probs.get(state, 0)
-        smoothed_probs[state] = alpha * current_prob + (1 - alpha) * prev_prob
+    # Smooth probabilities (positional, INTENT_STATES order; missing = 0)
+    c0, c1, c2, c3 = current_intent.probs or _NO_PROBS
+    p0, p1, p2, p3 = previous.probs or _NO_PROBS
+    beta = 1 - alpha
+    smoothed_probs = (
+        alpha * c0 + beta * p0,
+        alpha * c1 + beta * p1,
+        alpha * c2 + beta * p2,
+        alpha * c3 + beta * p3
+    )
     
-    # Determine smoothed state
-    smoothed_state = max(smoothed_probs, key=smoothed_probs.get)
+    # Determine smoothed state (first maximum wins ties)
+    best = smoothed_probs.index(max(smoothed_probs))
     
     # Smooth distraction
     smoothed_distraction = (
         alpha * current_intent.distraction_prob +
-        (1 - alpha) * previous.distraction_prob
+        beta * previous.distraction_prob
     )
     
     return Intent(
-        state=smoothed_state,
+        state=INTENT_STATES[best],
         distraction_prob=smoothed_distraction,
         awareness_prob=current_intent.awareness_prob,
-        action_confidence=smoothed_probs[smoothed_state],
+        action_confidence=smoothed_probs[best],
         probs=smoothed_probs,
         smoothed=True
     )
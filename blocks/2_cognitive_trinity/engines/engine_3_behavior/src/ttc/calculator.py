@@ -1,13 +1,25 @@
 # Engine 3: TTC Calculator
 # Time-To-Collision with confidence intervals and early exit
 
-from typing import List, Dict
+import math
+from typing import List, Optional
 import numpy as np
 
-from ..interfaces import TTCResult, Prediction
+from ..config import ENGINE3_PARAMS, INTENT_ID, MARGIN_MULT_ARR
+from ..interfaces import TTCResult, Prediction, TrainState
 
 EMERGENCY_THRESHOLD = 1.0  # seconds
 
+SCENARIOS = ('optimistic', 'nominal', 'pessimistic')
+
+_NO_POSITION = np.full(3, np.inf)
+
+# Train defaults when no state is given: at origin, 10 m/s forward
+_TRAIN_ORIGIN = np.zeros(3)
+_TRAIN_FORWARD = np.array([0.0, 0.0, 10.0])
+for _arr in (_NO_POSITION, _TRAIN_ORIGIN, _TRAIN_FORWARD):
+    _arr.setflags(write=False)
+
 
 def compute_ttc_v2(
     train_state,
@@ -34,47 +46,61 @@ def compute_ttc_v2(
         )
     
     # Train state
-    train_pos = np.array(train_state.position) if train_state else np.zeros(3)
-    train_vel = np.array(train_state.velocity) if train_state else np.array([0, 0, 10])
+    train_pos, train_vel = _train_arrays(train_state)
+    
+    # Nearest max_tracks by proximity, in order, for early exit
+    # (squared distance of each first nominal point, one einsum)
+    offsets = np.array([_first_position(p) for p in predictions], dtype=np.float64)
+    offsets -= train_pos
+    nearest = _nearest_indices(np.einsum('ij,ij->i', offsets, offsets), max_tracks)
+    
+    selected = [predictions[i] for i in nearest.tolist()]
+    
+    # Every (track, scenario, horizon) point of the selected predictions,
+    # concatenated in track -> scenario -> horizon order
+    trajs = [
+        (k, traj)
+        for k, pred in enumerate(selected)
+        for traj in (pred.trajectories.get(scenario) for scenario in SCENARIOS)
+        if traj is not None and len(traj['timestamps'])
+    ]
+    if not trajs:
+        return TTCResult(
+            min=float('inf'),
+            mean=float('inf'),
+            max=float('inf'),
+            confidence=1.0
+        )
     
-    # Sort by proximity for early exit
-    sorted_preds = sorted(
-        predictions,
-        key=lambda p: distance_to_position(p.trajectories.get('nominal', [{}])[0], train_pos)
+    owner = np.repeat(
+        np.fromiter((k for k, _ in trajs), dtype=np.intp, count=len(trajs)),
+        [len(traj['timestamps']) for _, traj in trajs]
     )
+    times = np.concatenate([traj['timestamps'] for _, traj in trajs]).astype(np.float64, copy=False)
+    diff = np.concatenate([traj['positions'] for _, traj in trajs]).astype(np.float64)
     
-    ttc_samples = []
-    
-    for pred in sorted_preds[:max_tracks]:
-        for scenario in ['optimistic', 'nominal', 'pessimistic']:
-            traj = pred.trajectories.get(scenario, [])
-            
-            for point in traj:
-                t = point.get('timestamp', 0)
-                obj_pos = np.array(point.get('position', (0, 0, 10)))
-                
-                # Train position at time t
-                train_future = train_pos + train_vel * t
-                
-                # Distance at time t
-                distance = np.linalg.norm(obj_pos - train_future)
-                
-                # Safety margin
-                margin = get_safety_margin(pred.intent)
-                
-                if distance < margin:
-                    ttc_samples.append(t)
-                    
-                    # EARLY EXIT for emergency
-                    if t < EMERGENCY_THRESHOLD:
-                        return TTCResult(
-                            min=t,
-                            mean=t,
-                            max=t,
-                            confidence=0.99  # High confidence emergency
-                        )
-    
-    if not ttc_samples:
+    # Object minus train position at each t; squared distance vs margin²
+    diff -= train_pos
+    diff -= train_vel * times[:, None]
+    dist2 = np.einsum('ij,ij->i', diff, diff)
+    
+    margins = _safety_margins(selected)
+    hits = dist2 < (margins * margins)[owner]
+    
+    # EARLY EXIT for emergency (first colliding point in track order)
+    emergency = hits & (times < EMERGENCY_THRESHOLD)
+    if emergency.any():
+        t = times[np.argmax(emergency)].item()
+        return TTCResult(
+            min=t,
+            mean=t,
+            max=t,
+            confidence=0.99  # High confidence emergency
+        )
+    
+    ttc_samples = times[hits]
+    
+    if not ttc_samples.size:
         return TTCResult(
             min=float('inf'),
             mean=float('inf'),
@@ -89,7 +115,7 @@ def compute_ttc_v2(
     
     # Confidence based on spread
     spread = ttc_max - ttc_min
-    confidence = float(np.clip(1.0 - spread / 10.0, 0.3, 1.0))
+    confidence = min(max(1.0 - spread / 10.0, 0.3), 1.0)
     
     return TTCResult(
         min=ttc_min,
@@ -99,12 +125,59 @@ def compute_ttc_v2(
     )
 
 
-def distance_to_position(point: Dict, position: np.ndarray) -> float:
-    """Compute distance from trajectory point to position."""
-    if not point or 'position' not in point:
+def _nearest_indices(distances: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k smallest distances, ascending.
+    
+    Partial selection (argpartition, O(N)) then a sort of only the k
+    selected, instead of sorting all N.
+    """
+    if k < len(distances):
+        selected = np.argpartition(distances, k - 1)[:k]
+        return selected[np.argsort(distances[selected], kind='stable')]
+    return np.argsort(distances, kind='stable')
+
+
+def _train_arrays(train_state):
+    """Train (position [3], velocity [3]) arrays, without copying a TrainState."""
+    if not train_state:
+        return _TRAIN_ORIGIN, _TRAIN_FORWARD
+    if isinstance(train_state, TrainState):
+        return train_state.position_array, train_state.velocity_array
+    return np.array(train_state.position), np.array(train_state.velocity)
+
+
+def _first_position(prediction: Prediction) -> np.ndarray:
+    """First nominal trajectory position [3] (inf if there is none, sorts last)."""
+    nominal = prediction.trajectories.get('nominal')
+    if nominal is None or not len(nominal['positions']):
+        return _NO_POSITION
+    return nominal['positions'][0]
+
+
+def distance_to_position(point: Optional[np.ndarray], position: np.ndarray) -> float:
+    """Compute distance from trajectory point [3] (None = missing) to position."""
+    if point is None:
         return float('inf')
-    obj_pos = np.array(point['position'])
-    return float(np.linalg.norm(obj_pos - position))
+    return math.dist(point, position)
+
+
+def _safety_margins(predictions: List[Prediction]) -> np.ndarray:
+    """Vectorized get_safety_margin over predictions' intents [N]."""
+    static_id = INTENT_ID['STATIC']
+    ids = np.fromiter(
+        (p.intent.state_id if p.intent is not None else static_id for p in predictions),
+        dtype=np.intp,
+        count=len(predictions)
+    )
+    distracted = np.fromiter(
+        (p.intent is not None and p.intent.distraction_prob > 0.5 for p in predictions),
+        dtype=bool,
+        count=len(predictions)
+    )
+    margins = ENGINE3_PARAMS['base_safety_margin'] * MARGIN_MULT_ARR[ids]
+    margins[distracted] *= ENGINE3_PARAMS['distraction_multiplier']
+    return margins
 
 
 def get_safety_margin(intent) -> float:
@@ -16,7 +16,7 @@ def cross_validate_trajectory(
     Validate trajectory prediction with optical flow.
     
     Args:
-        kinematic_pred: Predicted trajectories (dict)
+        kinematic_pred: Predicted trajectories (predict_kinematic_v2 format)
         optical_flow: Optical flow tensor [H, W, 2]
         track: Track with bbox for ROI extraction
         
@@ -49,23 +49,22 @@ def cross_validate_trajectory(
     flow_velocity = flow_to_velocity(flow_vector, depth=roi['depth'])
     
     # Get kinematic velocity from first prediction point
-    nominal = kinematic_pred.get('nominal', [])
-    if not nominal or len(nominal) < 2:
+    nominal = kinematic_pred.get('nominal')
+    if nominal is None or len(nominal['positions']) < 2:
         return 'UNVALIDATED'
     
-    # Estimate velocity from first two points
-    p0 = np.array(nominal[0].get('position', (0, 0, 0)))
-    p1 = np.array(nominal[1].get('position', (0, 0, 0)))
-    t0 = nominal[0].get('timestamp', 0)
-    t1 = nominal[1].get('timestamp', 1)
+    # Estimate velocity from first two points (xy only, Python floats)
+    (x0, y0, _), (x1, y1, _) = nominal['positions'][:2].tolist()
+    t0, t1 = nominal['timestamps'][:2].tolist()
+    flow_vx, flow_vy, _ = flow_velocity.tolist()
     
     dt = t1 - t0 if t1 != t0 else 1.0
-    kinematic_velocity = (p1 - p0) / dt
     
-    # Compute divergence
-    divergence = np.linalg.norm(kinematic_velocity[:2] - flow_velocity[:2])
+    # Compute divergence (squared, against the squared threshold)
+    dvx = (x1 - x0) / dt - flow_vx
+    dvy = (y1 - y0) / dt - flow_vy
     
-    if divergence > VALIDATION_THRESHOLD:
+    if dvx * dvx + dvy * dvy > VALIDATION_THRESHOLD * VALIDATION_THRESHOLD:
         return 'UNCERTAIN'
     
     return 'VALIDATED'
@@ -3,6 +3,9 @@
 
 from .backend import InferenceBackend, BackendType
 from .pytorch_backend import PyTorchBackend
-from .tensorrt_backend import TensorRTBackend
+from .tensorrt_backend import TensorRTBackend, get_or_build_engine
 
-__all__ = ['InferenceBackend', 'BackendType', 'PyTorchBackend', 'TensorRTBackend']
+__all__ = [
+    'InferenceBackend', 'BackendType', 'PyTorchBackend', 'TensorRTBackend',
+    'get_or_build_engine'
+]
@@ -27,6 +27,28 @@ class BaseBackend(ABC):
         """Run inference on input."""
         pass
     
+    def infer_device(self, input_ptr: int) -> np.ndarray:
+        """Run inference on an input already resident in device memory."""
+        raise NotImplementedError(
+            f"{type(self).__name__} does not accept device inputs"
+        )
+    
+    def input_buffer(self) -> Optional[np.ndarray]:
+        """Host staging buffer callers may preprocess into (None if unsupported)."""
+        return None
+    
+    def infer_async(self, inputs: np.ndarray) -> Any:
+        """Start inference, returning a handle for `wait` (synchronous by default)."""
+        return self.infer(inputs)
+    
+    def wait(self, handle: Any) -> np.ndarray:
+        """Output of an `infer_async` call."""
+        return handle
+    
+    def specialize(self, input_shape: Tuple[int, ...], output_shape: Optional[Tuple[int, ...]] = None):
+        """Fixed-shape inference closure (None if unsupported)."""
+        return None
+    
     @abstractmethod
     def warmup(self, input_shape: Tuple[int, ...]) -> None:
         """Warmup inference for consistent timing."""
@@ -38,6 +60,50 @@ class BaseBackend(ABC):
         pass
 
 
+class LatencyWindow:
+    """
+    Latencies (ms) of the last `size` calls, in a fixed ring buffer.
+    
+    Recording overwrites the oldest slot in O(1) (no list shifting or
+    growth); stats reduce over a view of the filled part, without copying.
+    """
+    
+    __slots__ = ('_buf', '_index', '_count')
+    
+    def __init__(self, size: int = 100):
+        self._buf = np.empty(size, dtype=np.float64)
+        self._index = 0
+        self._count = 0
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def add_ns(self, elapsed_ns: int) -> None:
+        """Record one latency given in nanoseconds (perf_counter_ns delta)."""
+        size = len(self._buf)
+        self._buf[self._index] = elapsed_ns * 1e-6
+        self._index = (self._index + 1) % size
+        if self._count < size:
+            self._count += 1
+    
+    def clear(self) -> None:
+        self._index = 0
+        self._count = 0
+    
+    def stats(self) -> Dict[str, float]:
+        """min/max/mean/std in milliseconds (zeros when empty)."""
+        if not self._count:
+            return {'min': 0, 'max': 0, 'mean': 0, 'std': 0}
+        
+        arr = self._buf[:self._count]
+        return {
+            'min': float(arr.min()),
+            'max': float(arr.max()),
+            'mean': float(arr.mean()),
+            'std': float(arr.std())
+        }
+
+
 class InferenceBackend:
     """
     Unified inference backend supporting multiple engines.
@@ -78,7 +144,7 @@ class InferenceBackend:
         
         self.backend_type = BackendType(backend_type)
         self._backend: Optional[BaseBackend] = None
-        self._latencies = []
+        self._latencies = LatencyWindow()
         
     def _detect_backend(self, path: str) -> str:
         """Detect backend from file extension."""
@@ -107,31 +173,71 @@ class InferenceBackend:
         
         return self._backend.load(self.model_path)
     
-    def infer(self, inputs: np.ndarray) -> np.ndarray:
+    def infer(self, inputs: np.ndarray, **kwargs) -> np.ndarray:
         """
         Run inference with timing tracking.
         
         Args:
             inputs: Input tensor as numpy array
+            **kwargs: Backend-specific options (e.g. TensorRT `copy`)
             
         Returns:
-            Output tensor as numpy array
+            Output tensor as numpy array (TensorRT: a view of a pinned
+            buffer, valid until the second next call; see its `infer`)
         """
         import time
         
         if self._backend is None:
             self.load()
         
-        start = time.perf_counter()
-        output = self._backend.infer(inputs)
-        latency = (time.perf_counter() - start) * 1000  # ms
+        start = time.perf_counter_ns()
+        output = self._backend.infer(inputs, **kwargs)
+        self._latencies.add_ns(time.perf_counter_ns() - start)
+        
+        return output
+    
+    def infer_device(self, input_ptr: int, **kwargs) -> np.ndarray:
+        """
+        Run inference on a device-resident input (no H2D copy).
+        
+        Args:
+            input_ptr: Device pointer to a contiguous tensor matching the
+                engine input shape/dtype (e.g. torch `tensor.data_ptr()`)
+            **kwargs: Backend-specific options (e.g. TensorRT `copy`)
+            
+        Returns:
+            Output tensor as numpy array
+        """
+        import time
+        
+        if self._backend is None:
+            self.load()
         
-        self._latencies.append(latency)
-        if len(self._latencies) > 100:
-            self._latencies.pop(0)
+        start = time.perf_counter_ns()
+        output = self._backend.infer_device(input_ptr, **kwargs)
+        self._latencies.add_ns(time.perf_counter_ns() - start)
         
         return output
     
+    def infer_async(self, inputs: np.ndarray) -> Any:
+        """
+        Start inference without waiting for the result.
+        
+        TensorRT pipelines two frames on separate streams (see
+        `TensorRTBackend.infer_async`); other backends run synchronously.
+        Latency is tracked by the backend, not here.
+        
+        Returns:
+            Handle for `wait`
+        """
+        if self._backend is None:
+            self.load()
+        return self._backend.infer_async(inputs)
+    
+    def wait(self, handle: Any, **kwargs) -> np.ndarray:
+        """Output of an `infer_async` call (blocks until it is ready)."""
+        return self._backend.wait(handle, **kwargs)
+    
     def warmup(self, input_shape: Tuple[int, ...]) -> None:
         """Warmup model for consistent timing."""
         if self._backend is None:
@@ -143,18 +249,59 @@ class InferenceBackend:
         
         self._latencies.clear()
     
+    def input_buffer(self) -> Optional[np.ndarray]:
+        """
+        Backend host staging buffer for the model input, if any.
+        
+        Preprocessing straight into it (TensorRT: page-locked memory)
+        skips the staging copy in `infer`.
+        """
+        if self._backend is None:
+            return None
+        return self._backend.input_buffer()
+    
+    def specialize(
+        self,
+        input_shape: Tuple[int, ...],
+        output_shape: Optional[Tuple[int, ...]] = None
+    ):
+        """
+        Fixed-shape inference closure, bound once at load time.
+        
+        Skips per-call dispatch (shape checks, binding selection, output
+        allocation). Input is read from `input_buffer()`; latency is still
+        tracked.
+        
+        Returns:
+            Callable[[], np.ndarray], or None if the backend can't specialize
+        """
+        import time
+        
+        if self._backend is None:
+            self.load()
+        
+        run = self._backend.specialize(input_shape, output_shape)
+        if run is None:
+            return None
+        
+        add_latency = self._latencies.add_ns
+        perf_counter_ns = time.perf_counter_ns
+        
+        def timed_run() -> np.ndarray:
+            start = perf_counter_ns()
+            output = run()
+            add_latency(perf_counter_ns() - start)
+            return output
+        
+        return timed_run
+    
+    def reset_latency_stats(self) -> None:
+        """Drop recorded latencies (e.g. after an external warmup)."""
+        self._latencies.clear()
+    
     def get_latency_stats(self) -> Dict[str, float]:
         """Get latency statistics in milliseconds."""
-        if not self._latencies:
-            return {'min': 0, 'max': 0, 'mean': 0, 'std': 0}
-        
-        arr = np.array(self._latencies)
-        return {
-            'min': float(np.min(arr)),
-            'max': float(np.max(arr)),
-            'mean': float(np.mean(arr)),
-            'std': float(np.std(arr))
-        }
+        return self._latencies.stats()
     
     def __call__(self, inputs: np.ndarray) -> np.ndarray:
         """Allow calling backend directly."""
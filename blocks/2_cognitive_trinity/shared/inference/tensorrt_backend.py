@@ -1,10 +1,12 @@
 # TensorRT Backend
 # For production deployment with optimized inference
 
-from typing import Dict, Tuple, List, Optional
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Tuple, List, Optional
 import numpy as np
 
-from .backend import BaseBackend
+from .backend import BaseBackend, LatencyWindow
 
 
 class TensorRTBackend(BaseBackend):
@@ -26,18 +28,34 @@ class TensorRTBackend(BaseBackend):
         trtexec --onnx=model.onnx --saveEngine=model.trt --fp16
     """
     
-    def __init__(self, device: str = 'cuda:0', fp16: bool = True):
+    def __init__(
+        self,
+        device: str = 'cuda:0',
+        fp16: bool = True,
+        use_cuda_graph: bool = True
+    ):
         self.device = device
         self.fp16 = fp16
+        self.use_cuda_graph = use_cuda_graph
         self.engine = None
         self.context = None
-        self.bindings = None
         self.stream = None
+        self.inputs = []
+        self.outputs = []
         self._trt = None
         self._cuda = None
+        self._pinned_types = ()  # pycuda page-locked allocation classes
+        self._graph_exec = None  # Captured enqueue of the default tensor addresses
+        self._graph_io_execs = None  # Captured H2D + enqueue + D2H, per output buffer
+        self._out_slot = 0  # Pinned output buffer the next infer() writes
+        
+        # Double-buffered pipeline for infer_async/wait (created on first
+        # use): per slot its own context, stream, I/O buffers and event
+        self._slots = None
+        self._submitted = 0  # Handles issued; slot = handle % 2
         
         # Timing stats
-        self._latencies: List[float] = []
+        self._latencies = LatencyWindow()
     
     def load(self, model_path: str, **kwargs) -> bool:
         """
@@ -49,10 +67,16 @@ class TensorRTBackend(BaseBackend):
         try:
             import tensorrt as trt
             import pycuda.driver as cuda
-            import pycuda.autoinit  # noqa: F401
+            import pycuda.autoprimaryctx  # noqa: F401  (shared with torch)
             
             self._trt = trt
             self._cuda = cuda
+            self._pinned_types = tuple(
+                t for t in (
+                    getattr(cuda, 'PagelockedHostAllocation', None),
+                    getattr(cuda, 'RegisteredHostMemory', None)
+                ) if t is not None
+            )
             
             # Load engine
             logger = trt.Logger(trt.Logger.WARNING)
@@ -63,7 +87,8 @@ class TensorRTBackend(BaseBackend):
             self.engine = runtime.deserialize_cuda_engine(engine_data)
             self.context = self.engine.create_execution_context()
             
-            # Create CUDA stream
+            # Own CUDA stream per engine, so copies of one model can
+            # overlap compute of another
             self.stream = cuda.Stream()
             
             # Allocate buffers
@@ -79,16 +104,33 @@ class TensorRTBackend(BaseBackend):
             return False
     
     def _allocate_buffers(self):
-        """Allocate GPU memory for input/output bindings."""
+        """Allocate GPU memory for input/output tensors."""
+        self.inputs, self.outputs = self._allocate_io(self.context)
+        self._slots = None  # Pipeline buffers follow the resolved shapes
+        self._graph_exec = None  # Graphs are bound to the previous buffers
+        self._graph_io_execs = None
+        
+        # Second pinned host buffer per output; infer() alternates them, so
+        # its (uncopied) result survives one further call
+        for out in self.outputs:
+            out['hosts'] = (out['host'], self._cuda.pagelocked_empty_like(out['host']))
+        self._out_slot = 0
+    
+    def _allocate_io(self, context) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Pinned host + device buffers for every I/O tensor of `context`.
+        
+        Each device buffer is bound to its tensor once here
+        (set_tensor_address), so enqueues take only the stream.
+        """
         cuda = self._cuda
         
-        self.bindings = []
-        self.inputs = []
-        self.outputs = []
+        inputs = []
+        outputs = []
         
         for i in range(self.engine.num_io_tensors):
             name = self.engine.get_tensor_name(i)
-            shape = self.engine.get_tensor_shape(name)
+            shape = tuple(context.get_tensor_shape(name))  # Resolved shape
             dtype = self.engine.get_tensor_dtype(name)
             
             # Calculate size
@@ -108,19 +150,65 @@ class TensorRTBackend(BaseBackend):
             host_mem = cuda.pagelocked_empty(size, np_dtype)
             device_mem = cuda.mem_alloc(host_mem.nbytes)
             
-            self.bindings.append(int(device_mem))
+            context.set_tensor_address(name, int(device_mem))
             
+            io = {'name': name, 'host': host_mem, 'device': device_mem, 'shape': shape}
             if self.engine.get_tensor_mode(name) == self._trt.TensorIOMode.INPUT:
-                self.inputs.append({'host': host_mem, 'device': device_mem, 'shape': shape})
+                inputs.append(io)
             else:
-                self.outputs.append({'host': host_mem, 'device': device_mem, 'shape': shape})
+                outputs.append(io)
+        
+        return inputs, outputs
     
-    def infer(self, inputs: np.ndarray) -> np.ndarray:
+    def input_buffer(self) -> Optional[np.ndarray]:
+        """Page-locked host input, shaped like the engine input."""
+        if not self.inputs:
+            return None
+        inp = self.inputs[0]
+        return inp['host'].reshape(tuple(abs(d) for d in inp['shape']))
+    
+    def _stage_input(self, inputs: np.ndarray, host: np.ndarray) -> np.ndarray:
+        """
+        Host array to copy to the device for `inputs`.
+        
+        Pageable inputs are staged through the pinned `host` buffer in one
+        strided copy (no ravel temporary); `host` itself, or inputs already
+        in page-locked memory with the engine's layout, are used directly.
+        """
+        if inputs.ctypes.data == host.ctypes.data:
+            return host
+        if (
+            inputs.dtype == host.dtype and inputs.size == host.size
+            and inputs.flags.c_contiguous and self._is_pinned(inputs)
+        ):
+            return inputs
+        np.copyto(host.reshape(inputs.shape), inputs)
+        return host
+    
+    def _is_pinned(self, array: np.ndarray) -> bool:
+        """True if `array` views page-locked host memory (pycuda allocation)."""
+        base = array
+        while isinstance(base, np.ndarray):
+            base = base.base
+        return isinstance(base, self._pinned_types)
+    
+    def infer(self, inputs: np.ndarray, copy: bool = False) -> np.ndarray:
         """
         Run TensorRT inference.
         
+        Once the CUDA graphs are captured (first call), inputs staged
+        through the pinned buffer replay copy-in, inference and copy-out
+        as a single graph launch; other page-locked inputs are copied
+        from directly and replay only the inference graph.
+        
         Args:
-            inputs: Input array [B, C, H, W]
+            inputs: Input array [B, C, H, W]; if it is `input_buffer()`,
+                or any page-locked C-contiguous array of the engine dtype,
+                the staging copy is skipped
+            copy: Return a copy of the output. By default the result is a
+                view of one of two alternating pinned output buffers: it
+                stays valid through the next call and is overwritten by the
+                one after, so consume (or copy) it before then
             
         Returns:
             Output array
@@ -131,41 +219,313 @@ class TensorRTBackend(BaseBackend):
         if self.engine is None:
             raise RuntimeError("Engine not loaded")
         
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         
-        # Copy input to device
-        np.copyto(self.inputs[0]['host'], inputs.ravel())
-        cuda.memcpy_htod_async(
-            self.inputs[0]['device'],
-            self.inputs[0]['host'],
-            self.stream
-        )
+        host = self.inputs[0]['host']
+        staged = self._stage_input(inputs, host)
         
-        # Run inference
-        self.context.execute_async_v2(
-            bindings=self.bindings,
-            stream_handle=self.stream.handle
-        )
+        slot = self._out_slot
+        host_out = self.outputs[0]['hosts'][slot]
         
-        # Copy output to host
-        cuda.memcpy_dtoh_async(
-            self.outputs[0]['host'],
-            self.outputs[0]['device'],
-            self.stream
-        )
+        if staged is host and self._graph_io_execs is not None:
+            # Copy in, inference and copy out as one graph launch
+            self._graph_io_execs[slot].launch(self.stream)
+        else:
+            # Copy input to device
+            cuda.memcpy_htod_async(self.inputs[0]['device'], staged, self.stream)
+            
+            # Run inference (graph replay once captured)
+            if self._graph_exec is not None:
+                self._graph_exec.launch(self.stream)
+            else:
+                self.context.execute_async_v3(self.stream.handle)
+            
+            # Copy output to host
+            cuda.memcpy_dtoh_async(host_out, self.outputs[0]['device'], self.stream)
         
         # Synchronize
         self.stream.synchronize()
+        self._out_slot = slot ^ 1
+        
+        # Capture after the first (initializing) enqueue has completed
+        if self.use_cuda_graph and self._graph_exec is None:
+            self._capture_graph()
         
         # Track latency
-        latency = (time.perf_counter() - start) * 1000
-        self._latencies.append(latency)
-        if len(self._latencies) > 100:
-            self._latencies.pop(0)
+        self._latencies.add_ns(time.perf_counter_ns() - start)
         
         # Reshape output
-        output = self.outputs[0]['host'].reshape(self.outputs[0]['shape'])
-        return output.copy()
+        output = host_out.reshape(self.outputs[0]['shape'])
+        return output.copy() if copy else output
+    
+    def infer_async(self, inputs: np.ndarray) -> int:
+        """
+        Enqueue inference without waiting for it (double-buffered).
+        
+        Two slots, each with its own execution context, stream and
+        pinned/device buffers, alternate between calls, so the D2H copy
+        of frame N overlaps the H2D copy and compute of frame N+1. A
+        slot is reused only after its previous work has completed, so at
+        most two results are in flight; `wait` for a handle before
+        submitting two more frames or its output is overwritten.
+        
+        Args:
+            inputs: Input array [B, C, H, W]; a page-locked array is read
+                by the copy in flight, so leave it untouched until `wait`
+            
+        Returns:
+            Handle for `wait`
+        """
+        import time
+        cuda = self._cuda
+        
+        if self.engine is None:
+            raise RuntimeError("Engine not loaded")
+        if self._slots is None:
+            self._slots = [self._create_slot() for _ in range(2)]
+        
+        handle = self._submitted
+        slot = self._slots[handle % 2]
+        
+        # Previous use of this slot must be done with its host buffers
+        slot['done'].synchronize()
+        
+        slot['start'] = time.perf_counter_ns()
+        stream = slot['stream']
+        cuda.memcpy_htod_async(
+            slot['inputs'][0]['device'],
+            self._stage_input(inputs, slot['inputs'][0]['host']),
+            stream
+        )
+        slot['context'].execute_async_v3(stream.handle)
+        cuda.memcpy_dtoh_async(
+            slot['outputs'][0]['host'],
+            slot['outputs'][0]['device'],
+            stream
+        )
+        slot['done'].record(stream)
+        
+        self._submitted += 1
+        slot['handle'] = handle
+        return handle
+    
+    def wait(self, handle: int, copy: bool = True) -> np.ndarray:
+        """
+        Block until the `infer_async` call for `handle` finishes.
+        
+        Args:
+            handle: Value returned by `infer_async`
+            copy: Return a copy of the output (see `infer`)
+            
+        Returns:
+            Output array
+        """
+        import time
+        
+        slot = self._slots[handle % 2] if self._slots else None
+        if slot is None or slot['handle'] != handle:
+            raise RuntimeError(f"Inference handle {handle} is no longer available")
+        
+        slot['done'].synchronize()
+        
+        # Track latency (submit to completion)
+        self._latencies.add_ns(time.perf_counter_ns() - slot['start'])
+        
+        output = slot['outputs'][0]['host'].reshape(slot['outputs'][0]['shape'])
+        return output.copy() if copy else output
+    
+    def _create_slot(self) -> Dict:
+        """Execution context, stream, buffers and event for one pipeline slot."""
+        cuda = self._cuda
+        context = self.engine.create_execution_context()
+        
+        # Same resolved input shapes as the main context
+        for i in range(self.engine.num_io_tensors):
+            name = self.engine.get_tensor_name(i)
+            if (
+                self.engine.get_tensor_mode(name) == self._trt.TensorIOMode.INPUT
+                and -1 in tuple(self.engine.get_tensor_shape(name))
+            ):
+                context.set_input_shape(name, tuple(self.context.get_tensor_shape(name)))
+        
+        inputs, outputs = self._allocate_io(context)
+        return {
+            'context': context,
+            'stream': cuda.Stream(),
+            'inputs': inputs,
+            'outputs': outputs,
+            'done': cuda.Event(),
+            'handle': None,
+            'start': 0
+        }
+    
+    def specialize(
+        self,
+        input_shape: Tuple[int, ...],
+        output_shape: Optional[Tuple[int, ...]] = None
+    ):
+        """
+        Specialize the engine for one fixed input shape.
+        
+        Resolves dynamic dimensions once (set_input_shape + buffer
+        reallocation), captures the CUDA graphs and returns a closure that
+        only does: one graph launch (H2D from the pinned input, inference,
+        D2H), sync. The
+        caller writes the input into `input_buffer()` beforehand; the
+        returned array is a view of the pinned output (overwritten per call).
+        
+        Args:
+            input_shape: Exact input shape, e.g. (1, 3, 518, 518)
+            output_shape: Shape to view the output as (default: engine's)
+            
+        Returns:
+            Callable[[], np.ndarray]
+        """
+        if self.engine is None:
+            raise RuntimeError("Engine not loaded")
+        
+        name = self.inputs[0]['name']
+        if tuple(self.context.get_tensor_shape(name)) != tuple(input_shape):
+            self.context.set_input_shape(name, input_shape)
+            self._allocate_buffers()
+        
+        # First run initializes the context and captures the graph
+        self.infer(self.input_buffer())
+        
+        cuda = self._cuda
+        stream = self.stream
+        htod, dtoh = cuda.memcpy_htod_async, cuda.memcpy_dtoh_async
+        d_in, h_in = self.inputs[0]['device'], self.inputs[0]['host']
+        d_out, h_out = self.outputs[0]['device'], self.outputs[0]['host']
+        out = h_out.reshape(output_shape or self.outputs[0]['shape'])
+        
+        if self._graph_io_execs is not None:
+            launch = self._graph_io_execs[0].launch
+            
+            def run() -> np.ndarray:
+                launch(stream)
+                stream.synchronize()
+                return out
+            
+            return run
+        
+        if self._graph_exec is not None:
+            graph_exec = self._graph_exec
+            
+            def enqueue():
+                graph_exec.launch(stream)
+        else:
+            execute, handle = self.context.execute_async_v3, stream.handle
+            
+            def enqueue():
+                execute(handle)
+        
+        def run() -> np.ndarray:
+            htod(d_in, h_in, stream)
+            enqueue()
+            dtoh(h_out, d_out, stream)
+            stream.synchronize()
+            return out
+        
+        return run
+    
+    def _capture_graph(self) -> None:
+        """
+        Capture the engine enqueue on the default tensor addresses as CUDA graphs.
+        
+        Replaying a graph replaces one kernel launch per layer with a
+        single launch. Captured are the enqueue alone and, per pinned
+        output buffer, the whole pinned-input H2D + enqueue + D2H sequence
+        that `infer` replays when the input is staged through the pinned
+        buffer (one launch instead of three). Only valid for static shapes and fixed
+        addresses, so `infer_device` (rebinds pointers) keeps the regular
+        enqueue. On failure graphs are disabled and inference continues
+        uncaptured.
+        """
+        cuda = self._cuda
+        try:
+            self.stream.begin_capture()
+            self.context.execute_async_v3(self.stream.handle)
+            graph = self.stream.end_capture()
+            self._graph_exec = graph.instantiate()
+            
+            io_execs = []
+            for host_out in self.outputs[0]['hosts']:
+                self.stream.begin_capture()
+                cuda.memcpy_htod_async(self.inputs[0]['device'], self.inputs[0]['host'], self.stream)
+                self.context.execute_async_v3(self.stream.handle)
+                cuda.memcpy_dtoh_async(host_out, self.outputs[0]['device'], self.stream)
+                graph = self.stream.end_capture()
+                io_execs.append(graph.instantiate())
+            self._graph_io_execs = tuple(io_execs)
+        except Exception as e:
+            try:
+                self.stream.end_capture()  # Leave capture mode if still in it
+            except Exception:
+                pass
+            print(f"CUDA graph capture failed, using regular enqueue: {e}")
+            self.use_cuda_graph = False
+            self._graph_exec = None
+            self._graph_io_execs = None
+    
+    def infer_device(
+        self,
+        input_ptr: int,
+        copy: bool = False,
+        output_ptr: Optional[int] = None
+    ) -> Optional[np.ndarray]:
+        """
+        Run TensorRT inference reading the input straight from device memory.
+        
+        The pointer is bound in place of the input buffer, so no H2D copy
+        is issued. The producer must have finished writing it (e.g. its
+        CUDA stream synchronized) before this call.
+        
+        Args:
+            input_ptr: Device pointer matching the engine input
+            copy: Return a copy of the output (see `infer`)
+            output_ptr: Optional device pointer the engine writes its output
+                to; the D2H copy is skipped and None is returned
+            
+        Returns:
+            Output array
+        """
+        import time
+        cuda = self._cuda
+        
+        if self.engine is None:
+            raise RuntimeError("Engine not loaded")
+        
+        start = time.perf_counter_ns()
+        
+        inp, out = self.inputs[0], self.outputs[0]
+        slot = self._out_slot
+        self.context.set_tensor_address(inp['name'], int(input_ptr))
+        if output_ptr is not None:
+            self.context.set_tensor_address(out['name'], int(output_ptr))
+        
+        try:
+            # Run inference
+            self.context.execute_async_v3(self.stream.handle)
+            
+            # Copy output to host (unless it stays on device)
+            if output_ptr is None:
+                cuda.memcpy_dtoh_async(out['hosts'][slot], out['device'], self.stream)
+            self.stream.synchronize()
+        finally:
+            # Rebind the own buffers for infer's uncaptured path
+            self.context.set_tensor_address(inp['name'], int(inp['device']))
+            self.context.set_tensor_address(out['name'], int(out['device']))
+        
+        # Track latency
+        self._latencies.add_ns(time.perf_counter_ns() - start)
+        
+        if output_ptr is not None:
+            return None
+        
+        self._out_slot = slot ^ 1
+        output = out['hosts'][slot].reshape(out['shape'])
+        return output.copy() if copy else output
     
     def warmup(self, input_shape: Tuple[int, ...]) -> None:
         """Warmup TensorRT engine for consistent timing."""
@@ -176,19 +536,16 @@ class TensorRTBackend(BaseBackend):
     
     def get_latency_stats(self) -> Dict[str, float]:
         """Get TensorRT inference latency statistics."""
-        if not self._latencies:
-            return {'min': 0, 'max': 0, 'mean': 0, 'std': 0}
-        
-        arr = np.array(self._latencies)
-        return {
-            'min': float(np.min(arr)),
-            'max': float(np.max(arr)),
-            'mean': float(np.mean(arr)),
-            'std': float(np.std(arr))
-        }
+        return self._latencies.stats()
     
     def __del__(self):
         """Cleanup GPU resources."""
+        if hasattr(self, '_graph_io_execs') and self._graph_io_execs:
+            del self._graph_io_execs
+        if hasattr(self, '_graph_exec') and self._graph_exec:
+            del self._graph_exec
+        if hasattr(self, '_slots') and self._slots:
+            del self._slots
         if hasattr(self, 'stream') and self.stream:
             del self.stream
         if hasattr(self, 'context') and self.context:
@@ -203,7 +560,10 @@ def build_engine_from_onnx(
     fp16: bool = True,
     int8: bool = False,
     max_batch_size: int = 1,
-    workspace_gb: int = 4
+    workspace_gb: int = 4,
+    input_shape: Optional[Tuple[int, ...]] = None,
+    calibrator=None,
+    obey_precision_constraints: bool = False
 ) -> bool:
     """
     Build TensorRT engine from ONNX model.
@@ -212,9 +572,17 @@ def build_engine_from_onnx(
         onnx_path: Path to ONNX model
         engine_path: Output path for TensorRT engine
         fp16: Enable FP16 precision
-        int8: Enable INT8 quantization (requires calibration)
+        int8: Enable INT8 quantization. Needs `calibrator`, or Q/DQ nodes
+            in the ONNX graph; without either the build fails instead of
+            silently producing FP16/FP32 kernels. With fp16 too, layers
+            lacking INT8 kernels fall back to FP16 (mixed precision)
         max_batch_size: Maximum batch size
         workspace_gb: GPU workspace in GB
+        input_shape: Freeze the input to this exact shape (min = opt = max
+            profile), avoiding dynamic-shape tactic stalls at runtime
+        calibrator: INT8 calibrator (see make_entropy_calibrator)
+        obey_precision_constraints: Fail instead of overriding layer
+            precisions set on the network
     
     Returns:
         True if successful
@@ -250,6 +618,20 @@ def build_engine_from_onnx(
             config.set_flag(trt.BuilderFlag.FP16)
         if int8:
             config.set_flag(trt.BuilderFlag.INT8)
+            if calibrator is not None:
+                config.int8_calibrator = calibrator
+            elif not _has_quantize_layers(network, trt):
+                print("INT8 build needs a calibrator or a Q/DQ-quantized ONNX model")
+                return False
+        if obey_precision_constraints:
+            config.set_flag(trt.BuilderFlag.OBEY_PRECISION_CONSTRAINTS)
+        
+        # Single static optimization profile
+        if input_shape is not None:
+            profile = builder.create_optimization_profile()
+            name = network.get_input(0).name
+            profile.set_shape(name, input_shape, input_shape, input_shape)
+            config.add_optimization_profile(profile)
         
         # Build engine
         engine = builder.build_serialized_network(network, config)
@@ -258,9 +640,12 @@ def build_engine_from_onnx(
             print("Failed to build engine")
             return False
         
-        # Save engine
-        with open(engine_path, 'wb') as f:
+        # Save engine (atomic, so an interrupted build never leaves a
+        # truncated plan in the cache)
+        tmp_path = f"{engine_path}.tmp"
+        with open(tmp_path, 'wb') as f:
             f.write(engine)
+        os.replace(tmp_path, engine_path)
         
         print(f"Engine saved to {engine_path}")
         return True
@@ -268,3 +653,177 @@ def build_engine_from_onnx(
     except Exception as e:
         print(f"Engine build failed: {e}")
         return False
+
+
+def _has_quantize_layers(network, trt) -> bool:
+    """True if the parsed network carries explicit Q/DQ (pre-quantized) layers."""
+    return any(
+        network.get_layer(i).type in (trt.LayerType.QUANTIZE, trt.LayerType.DEQUANTIZE)
+        for i in range(network.num_layers)
+    )
+
+
+def make_entropy_calibrator(
+    batches: Iterable[np.ndarray],
+    cache_path: str,
+    batch_size: Optional[int] = None
+):
+    """
+    INT8 entropy calibrator fed from preprocessed input batches.
+    
+    The calibration table is cached on disk; once `cache_path` exists
+    TensorRT reads it and `batches` is never consumed. Each batch is
+    staged through one page-locked buffer for the H2D copy.
+    
+    Args:
+        batches: Iterable of model-ready inputs [B, C, H, W] float32
+            (~500 representative frames), or one array of frames
+            [N, C, H, W] (e.g. np.load(..., mmap_mode='r') of recorded
+            camera frames) split into `batch_size` chunks
+        cache_path: Calibration cache file
+        batch_size: Frames per calibration batch (default: first batch's,
+            or 1 for a frame array); batches of any other shape are skipped
+    """
+    import tensorrt as trt
+    import pycuda.driver as cuda
+    import pycuda.autoprimaryctx  # noqa: F401
+    
+    if isinstance(batches, np.ndarray):
+        frames, step = batches, batch_size or 1
+        batches = (frames[i:i + step] for i in range(0, len(frames) - step + 1, step))
+    
+    class EntropyCalibrator(trt.IInt8EntropyCalibrator2):
+        def __init__(self):
+            super().__init__()
+            self._batches = iter(batches)
+            self._pending = None  # Batch read ahead by get_batch_size
+            self._host = None
+            self._device = None
+            self._batch_size = batch_size
+        
+        def get_batch_size(self):
+            # Queried before the first get_batch; peek it if not given
+            if self._batch_size is None:
+                self._pending = next(self._batches, None)
+                self._batch_size = 1 if self._pending is None else len(self._pending)
+            return self._batch_size
+        
+        def get_batch(self, names):
+            batch, self._pending = self._pending, None
+            if batch is None:
+                batch = next(self._batches, None)
+            # Ragged batches (e.g. a short final one) are skipped, not padded:
+            # zero frames would skew the activation histograms
+            while batch is not None and not self._fits(batch):
+                batch = next(self._batches, None)
+            if batch is None:
+                return None
+            if self._host is None:
+                self._host = cuda.pagelocked_empty(np.shape(batch), np.float32)
+                self._device = cuda.mem_alloc(self._host.nbytes)
+            np.copyto(self._host, batch)
+            cuda.memcpy_htod(self._device, self._host)
+            return [int(self._device)]
+        
+        def _fits(self, batch):
+            if self._host is not None:
+                return np.shape(batch) == self._host.shape
+            return len(batch) == self.get_batch_size()
+        
+        def read_calibration_cache(self):
+            if os.path.exists(cache_path):
+                with open(cache_path, 'rb') as f:
+                    return f.read()
+            return None
+        
+        def write_calibration_cache(self, cache):
+            with open(cache_path, 'wb') as f:
+                f.write(cache)
+    
+    return EntropyCalibrator()
+
+
+def engine_cache_path(
+    onnx_path: str,
+    device: str = 'cuda:0',
+    fp16: bool = True,
+    int8: bool = False,
+    tag: str = ''
+) -> str:
+    """
+    Cache location for a serialized engine built from `onnx_path`.
+    
+    Plans are only valid for the GPU model and TensorRT version that
+    built them, so both are part of the filename:
+        <onnx dir>/trt_engines/<stem>_<gpu>_trt<ver>_<precision>[_<tag>].engine
+    """
+    import tensorrt as trt
+    import pycuda.driver as cuda
+    
+    cuda.init()
+    index = int(device.split(':')[1]) if ':' in device else 0
+    gpu = cuda.Device(index).name().replace(' ', '_')
+    precision = 'int8' if int8 else ('fp16' if fp16 else 'fp32')
+    suffix = f"_{tag}" if tag else ''
+    
+    onnx = Path(onnx_path)
+    name = f"{onnx.stem}_{gpu}_trt{trt.__version__}_{precision}{suffix}.engine"
+    return str(onnx.parent / 'trt_engines' / name)
+
+
+def get_or_build_engine(
+    onnx_path: str,
+    device: str = 'cuda:0',
+    fp16: bool = True,
+    tag: str = '',
+    calibration_batches: Optional[Iterable[np.ndarray]] = None,
+    calibration_cache_path: Optional[str] = None,
+    calibration_batch_size: Optional[int] = None,
+    **build_kwargs
+) -> Optional[str]:
+    """
+    Return a cached TensorRT engine for `onnx_path`, building it once.
+    
+    Building takes minutes; subsequent startups only deserialize.
+    
+    Args:
+        onnx_path: Source ONNX model
+        device: CUDA device the engine targets
+        fp16: Enable FP16 precision
+        tag: Extra cache key (e.g. input resolution)
+        calibration_batches: INT8 calibration inputs (with int8=True);
+            only consumed if neither the engine nor its calibration
+            cache exists yet (see make_entropy_calibrator)
+        calibration_cache_path: Calibration cache file (default: next to
+            the engine, *.calib.cache); reusable across rebuilds
+        calibration_batch_size: Frames per calibration batch
+        **build_kwargs: Forwarded to build_engine_from_onnx
+        
+    Returns:
+        Path to the engine, or None if TensorRT is unavailable / build failed
+    """
+    try:
+        engine_path = engine_cache_path(
+            onnx_path, device, fp16, build_kwargs.get('int8', False), tag
+        )
+    except ImportError as e:
+        print(f"TensorRT not available: {e}")
+        return None
+    
+    if os.path.exists(engine_path):
+        return engine_path
+    
+    os.makedirs(os.path.dirname(engine_path), exist_ok=True)
+    if build_kwargs.get('int8') and 'calibrator' not in build_kwargs:
+        cache_path = calibration_cache_path or str(Path(engine_path).with_suffix('.calib.cache'))
+        # Without data or a cached table, leave the calibrator unset so the
+        # build fails loudly (unless the model is Q/DQ-quantized)
+        if calibration_batches is not None or os.path.exists(cache_path):
+            build_kwargs['calibrator'] = make_entropy_calibrator(
+                calibration_batches if calibration_batches is not None else (),
+                cache_path,
+                calibration_batch_size
+            )
+    if build_engine_from_onnx(onnx_path, engine_path, fp16=fp16, **build_kwargs):
+        return engine_path
+    return None
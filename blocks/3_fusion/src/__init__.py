@@ -1,4 +1,4 @@
 # Block 3: Fusion - 3D Scene Fusion
 from .fusion import FusionManager
-from .interfaces import Object3D, Scene3D
-__all__ = ['FusionManager', 'Object3D', 'Scene3D']
+from .interfaces import CATEGORIES, CATEGORY_ID, OBJECT3D_DTYPE, Object3D, Scene3D, category_id
+__all__ = ['FusionManager', 'CATEGORIES', 'CATEGORY_ID', 'OBJECT3D_DTYPE', 'Object3D', 'Scene3D', 'category_id']
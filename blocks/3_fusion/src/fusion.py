@@ -1,8 +1,9 @@
 # Block 3: Fusion - Entry Point
-from typing import List, Dict
+from typing import Dict
 import numpy as np
-from .interfaces import Object3D, Scene3D
+from .interfaces import Scene3D, category_id
 from .config import FUSION_PARAMS
+from .projection.depth_to_3d import project_bboxes_to_3d, sample_bbox_depths
 
 class FusionManager:
     """3D scene fusion combining depth, semantic, and tracking data. Timing: 3ms"""
@@ -10,14 +11,23 @@ class FusionManager:
         self.params = FUSION_PARAMS
     
     def fuse(self, depth_output, semantic_output, prev_tracks, calibration) -> Dict:
-        objects_3d = []
-        for det in semantic_output.get('detections', []):
-            bbox3d = self._project_to_3d(det, depth_output, calibration)
-            obj = Object3D(track_id=det.get('track_id', 0), position=bbox3d[:3], 
-                          bbox3D=bbox3d, category=det.get('category', 'UNKNOWN'))
-            objects_3d.append(obj)
-        return {'scene_3d': Scene3D(objects=objects_3d), 'objects_3d': objects_3d}
+        dets = semantic_output.get('detections', [])
+        bboxes = np.asarray([d.get('bbox2D', (0, 0, 100, 100)) for d in dets], dtype=np.float64).reshape(-1, 4)
+        bboxes3d = self._project_to_3d(bboxes, depth_output, calibration)
+        
+        # Rows written column-wise; Object3D views are only built on access
+        scene = Scene3D(max_objects=self.params['max_objects'])
+        rows = scene.add_rows(len(dets))
+        rows['track_id'] = [d.get('track_id', 0) for d in dets]
+        rows['pos'] = bboxes3d[:, :3]
+        rows['bbox'] = bboxes3d
+        rows['cat'] = [category_id(d.get('category', 'UNKNOWN')) for d in dets]
+        rows['conf'] = 1.0
+        return {'scene_3d': scene, 'objects_3d': scene}
     
-    def _project_to_3d(self, det, depth, calib):
-        from .projection.depth_to_3d import project_bbox_to_3d
-        return project_bbox_to_3d(det.get('bbox2D', (0,0,100,100)), depth, calib)
+    def _project_to_3d(self, bboxes, depth, calib):
+        """All bboxes [N, 4] -> 3D boxes [N, 6] in one vectorized pass."""
+        depths = sample_bbox_depths(
+            bboxes, depth, self.params['min_depth'], self.params['max_depth'], self.params['depth_samples']
+        )
+        return project_bboxes_to_3d(bboxes, depths, calib)
@@ -1,6 +1,27 @@
 # Block 3: Fusion - Interfaces
-from dataclasses import dataclass, field
-from typing import List, Tuple, Optional
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Tuple
+import numpy as np
+
+CATEGORIES = ('UNKNOWN', 'PERSON', 'KNOWN')  # Index = category id
+CATEGORY_ID = {c: i for i, c in enumerate(CATEGORIES)}
+CATEGORY_ALIASES = {'PERSONA': 'PERSON', 'CONOCIDO': 'KNOWN', 'DESCONOCIDO': 'UNKNOWN'}  # Engine 1B names
+REPRESENTATIONS = ('BBOX', 'SMPL', 'PLY')
+REPRESENTATION_ID = {r: i for i, r in enumerate(REPRESENTATIONS)}
+
+# One row per object (58 B), columns usable as arrays: scene.arr['pos'] etc.
+OBJECT3D_DTYPE = np.dtype([
+    ('track_id', 'i4'), ('pos', '3f4'), ('bbox', '6f4'), ('vel', '3f4'),
+    ('cat', 'u1'), ('rep', 'u1'), ('conf', 'f4')
+])
+
+def category_id(category) -> int:
+    """Category id from a name or an Engine 1B / Engine 2 Category member."""
+    name = getattr(category, 'name', category)
+    try:
+        return CATEGORY_ID[CATEGORY_ALIASES.get(name, name)]
+    except (KeyError, TypeError):
+        raise ValueError(f"Unknown category: {category!r}") from None
 
 @dataclass
 class Object3D:
@@ -12,7 +33,85 @@ class Object3D:
     representation: str = 'BBOX'  # SMPL | PLY | BBOX
     confidence: float = 1.0
 
-@dataclass
 class Scene3D:
-    objects: List[Object3D] = field(default_factory=list)
-    timestamp: float = 0.0
+    """Fused objects as one structured array (OBJECT3D_DTYPE rows, first n_valid live).
+    Object3D instances are built on access only (scene[i], iteration, .objects)."""
+    def __init__(self, objects: Iterable[Object3D] = (), timestamp: float = 0.0, max_objects: int = 50):
+        self.arr = np.zeros(max_objects, dtype=OBJECT3D_DTYPE)
+        self.n_valid = 0
+        self.timestamp = timestamp
+        for obj in objects:
+            self.append(obj)
+
+    def add_rows(self, n: int) -> np.ndarray:
+        """Claim n zeroed rows (growing the array if full); returns their view."""
+        start = self.n_valid
+        if start + n > len(self.arr):
+            grown = np.zeros(max(start + n, 2 * len(self.arr)), dtype=OBJECT3D_DTYPE)
+            grown[:start] = self.arr[:start]
+            self.arr = grown
+        self.n_valid = start + n
+        return self.arr[start:self.n_valid]
+
+    def append(self, obj: Object3D) -> None:
+        row = self.add_rows(1)[0]
+        row['track_id'] = obj.track_id
+        row['pos'] = obj.position
+        row['bbox'] = obj.bbox3D
+        row['vel'] = obj.velocity
+        row['cat'] = category_id(obj.category)
+        row['rep'] = REPRESENTATION_ID.get(obj.representation, 0)
+        row['conf'] = obj.confidence
+
+    @property
+    def rows(self) -> np.ndarray:
+        return self.arr[:self.n_valid]
+
+    @property
+    def positions(self) -> np.ndarray:
+        return self.rows['pos']
+
+    @property
+    def bbox3D(self) -> np.ndarray:
+        return self.rows['bbox']
+
+    @property
+    def velocities(self) -> np.ndarray:
+        return self.rows['vel']
+
+    @property
+    def track_ids(self) -> np.ndarray:
+        return self.rows['track_id']
+
+    @property
+    def categories(self) -> np.ndarray:
+        return self.rows['cat']
+
+    @property
+    def confidences(self) -> np.ndarray:
+        return self.rows['conf']
+
+    @property
+    def objects(self) -> list:
+        """Object3D views of all rows (debug / compatibility)."""
+        return list(self)
+
+    def __len__(self) -> int:
+        return self.n_valid
+
+    def __getitem__(self, i: int) -> Object3D:
+        if not -self.n_valid <= i < self.n_valid:
+            raise IndexError(i)
+        row = self.rows[i]
+        return Object3D(
+            track_id=int(row['track_id']), position=tuple(row['pos'].tolist()),
+            bbox3D=tuple(row['bbox'].tolist()), velocity=tuple(row['vel'].tolist()),
+            category=CATEGORIES[row['cat']], representation=REPRESENTATIONS[row['rep']],
+            confidence=float(row['conf'])
+        )
+
+    def __iter__(self) -> Iterator[Object3D]:
+        return (self[i] for i in range(self.n_valid))
+
+    def __repr__(self) -> str:
+        return f"Scene3D(objects={self.objects!r}, timestamp={self.timestamp!r})"
@@ -1,3 +1,3 @@
 # Block 3: Projection Module
-from .depth_to_3d import project_bbox_to_3d
-__all__ = ['project_bbox_to_3d']
+from .depth_to_3d import project_bbox_to_3d, project_bboxes_to_3d, sample_bbox_depths
+__all__ = ['project_bbox_to_3d', 'project_bboxes_to_3d', 'sample_bbox_depths']
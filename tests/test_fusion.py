@@ -0,0 +1,138 @@
+# Tests for 3D Fusion Block
+
+import numpy as np
+import pytest
+
+from blocks._3_fusion.src.fusion import FusionManager
+from blocks._3_fusion.src.projection.depth_to_3d import DEFAULT_DEPTH, _sample_offsets, sample_bbox_depths
+from blocks._1_calibration.src.interfaces import CalibrationResult
+from blocks._2_cognitive_trinity.engines.engine_1a_depth.src.interfaces import DepthOutput
+from blocks._2_cognitive_trinity.engines.engine_1b_semantic.src.interfaces import Category as SemanticCategory
+from blocks._2_cognitive_trinity.engines.engine_2_persistence.src.interfaces import Category as TrackCategory
+
+
+K = np.array([[1000.0, 0.0, 640.0], [0.0, 1000.0, 360.0], [0.0, 0.0, 1.0]])
+
+
+@pytest.fixture
+def fusion():
+    return FusionManager()
+
+
+@pytest.fixture
+def detections():
+    return {'detections': [
+        {'bbox2D': (540, 260, 740, 460), 'track_id': 1, 'category': 'PERSON'},
+        {'bbox2D': (100, 100, 200, 300), 'track_id': 2},
+    ]}
+
+
+def depth_output(value=20.0, shape=(720, 1280)):
+    h, w = shape
+    return DepthOutput(
+        depth_map=np.full(shape, value, dtype=np.float32),
+        point_cloud=np.zeros((h, w, 3), dtype=np.float32),
+        confidence=np.ones(shape, dtype=np.float32)
+    )
+
+
+class TestFuseInputs:
+    """fuse() with the container types the upstream blocks emit."""
+
+    def test_calibration_result_and_depth_output(self, fusion, detections):
+        calibration = CalibrationResult(
+            intrinsics=K, extrinsics=(np.eye(3), np.zeros(3)),
+            scale_factor=1.0, method='HARD_INIT', confidence=1.0
+        )
+        scene = fusion.fuse(depth_output(20.0), detections, [], calibration)['scene_3d']
+
+        assert len(scene) == 2
+        # Centered bbox projects onto the optical axis at the sampled depth
+        np.testing.assert_allclose(scene.bbox3D[0], [0.0, 0.0, 20.0, 4.0, 4.0, 1.0], atol=1e-5)
+        np.testing.assert_allclose(scene.positions[1], [-9.8, -3.2, 20.0], atol=1e-5)
+        assert scene[0].category == 'PERSON'
+        assert scene[1].track_id == 2
+
+    def test_bare_arrays(self, fusion, detections):
+        depth = depth_output(20.0).depth_map
+        scene = fusion.fuse(depth, detections, [], K)['scene_3d']
+        np.testing.assert_allclose(scene.bbox3D[0], [0.0, 0.0, 20.0, 4.0, 4.0, 1.0], atol=1e-5)
+
+    def test_unusable_inputs_fall_back_to_defaults(self, fusion, detections):
+        # Dict calibration / missing depth: placeholder K and 10 m depth
+        scene = fusion.fuse(None, detections, [], {'track_gauge_mm': 1435})['scene_3d']
+        np.testing.assert_allclose(scene.positions[:, 2], [10.0, 10.0])
+        np.testing.assert_allclose(scene.bbox3D[0], [-6.4, -3.6, 10.0, 4.0, 4.0, 1.0], atol=1e-5)
+
+    def test_no_detections(self, fusion):
+        scene = fusion.fuse(depth_output(), {}, [], None)['scene_3d']
+        assert len(scene) == 0
+        assert scene.positions.shape == (0, 3)
+
+
+class TestFuseCategories:
+    """Engine 1B / Engine 2 categories map onto the fused category ids."""
+
+    @pytest.mark.parametrize('category, expected', [
+        (SemanticCategory.PERSONA, 'PERSON'),
+        (SemanticCategory.CONOCIDO, 'KNOWN'),
+        (SemanticCategory.DESCONOCIDO, 'UNKNOWN'),
+        (TrackCategory.PERSON, 'PERSON'),
+        (TrackCategory.KNOWN, 'KNOWN'),
+        (TrackCategory.UNKNOWN, 'UNKNOWN'),
+        ('PERSON', 'PERSON'),
+    ])
+    def test_category_members(self, fusion, category, expected):
+        dets = {'detections': [{'bbox2D': (540, 260, 740, 460), 'category': category}]}
+        scene = fusion.fuse(depth_output(), dets, [], K)['scene_3d']
+        assert [obj.category for obj in scene] == [expected]
+
+    def test_unmapped_category_raises(self, fusion):
+        dets = {'detections': [{'bbox2D': (540, 260, 740, 460), 'category': 'VEHICLE'}]}
+        with pytest.raises(ValueError, match='VEHICLE'):
+            fusion.fuse(depth_output(), dets, [], K)
+
+
+class TestSampleBboxDepths:
+    """Median-of-samples depth per bbox."""
+
+    def test_constant_depth_map_is_exact(self):
+        depth = np.full((100, 200), 7.25, dtype=np.float32)
+        bboxes = np.array([[10, 10, 50, 60], [150, 20, 190, 90]], dtype=np.float64)
+        np.testing.assert_array_equal(sample_bbox_depths(bboxes, depth, samples=5), [7.25, 7.25])
+
+    def test_bbox_partly_outside_image(self):
+        # Samples past the edges are clamped onto the border pixels
+        depth = np.tile(np.arange(200, dtype=np.float32) * 0.5, (100, 1))
+        bboxes = np.array([[-40, -40, 20, 20], [180, 80, 260, 140]], dtype=np.float64)
+        result = sample_bbox_depths(bboxes, depth, min_depth=0.0, samples=5)
+        assert result.shape == (2,)
+        assert np.all(np.isfinite(result))
+        assert result[0] == 0.0          # Box centered off-image at x < 0
+        assert result[1] == 199 * 0.5    # Box centered past the right edge
+
+    def test_single_sample_reads_center_median_rejects_outlier(self):
+        depth = np.full((100, 100), 20.0, dtype=np.float32)
+        depth[50, 50] = 0.0              # Hole at the bbox center
+        bboxes = np.array([[30, 30, 70, 70]], dtype=np.float64)
+        assert sample_bbox_depths(bboxes, depth, samples=1)[0] == 0.5  # Clamped to min_depth
+        assert sample_bbox_depths(bboxes, depth, samples=5)[0] == 20.0
+
+    def test_even_count_takes_upper_median(self):
+        depth = np.tile(np.arange(100, dtype=np.float32), (100, 1))
+        bboxes = np.array([[10, 10, 90, 90]], dtype=np.float64)
+        xs = np.sort((50 + _sample_offsets(4)[:, 0] * 80).astype(np.intp))
+        assert sample_bbox_depths(bboxes, depth, min_depth=0.0, samples=4)[0] == xs[2]
+
+    def test_samples_are_reproducible(self):
+        rng = np.random.default_rng(3)
+        depth = rng.uniform(1.0, 50.0, (120, 160))
+        bboxes = np.array([[10, 10, 60, 80], [70, 30, 150, 110]], dtype=np.float64)
+        np.testing.assert_array_equal(
+            sample_bbox_depths(bboxes, depth, samples=5),
+            sample_bbox_depths(bboxes, depth, samples=5)
+        )
+
+    def test_no_depth_map_uses_placeholder(self):
+        bboxes = np.array([[0, 0, 10, 10], [5, 5, 20, 20]], dtype=np.float64)
+        np.testing.assert_array_equal(sample_bbox_depths(bboxes, None, samples=5), [DEFAULT_DEPTH] * 2)
@@ -0,0 +1,66 @@
+# Tests for Sensor Input Capture
+
+import threading
+
+import numpy as np
+import pytest
+
+from blocks._0_sensor_input.src.camera.primary import _CaptureThread
+
+
+class TestCaptureThread:
+    """Producer thread hand-off and failure reporting."""
+
+    def test_latest_returns_newest_frame(self):
+        frame = np.zeros((4, 4, 3), dtype=np.uint8)
+        thread = _CaptureThread(lambda: frame, name='test-capture')
+        thread.start()
+        try:
+            assert thread.latest(timeout=1.0) is frame
+        finally:
+            thread.stop(timeout=1.0)
+
+    def test_error_before_first_frame_is_raised(self):
+        def read_frame():
+            raise OSError('VIDIOC_DQBUF failed')
+
+        thread = _CaptureThread(read_frame, name='test-capture')
+        thread.start()
+        with pytest.raises(RuntimeError) as exc:
+            thread.latest(timeout=1.0)
+        assert isinstance(exc.value.__cause__, OSError)
+        thread.join(timeout=1.0)
+        assert not thread.is_alive()
+
+    def test_error_after_frames_stops_serving_stale_frame(self):
+        frames = iter([np.zeros((4, 4, 3), dtype=np.uint8)])
+        failed = threading.Event()
+
+        def read_frame():
+            try:
+                return next(frames)
+            except StopIteration:
+                failed.set()
+                raise OSError('device unplugged')
+
+        thread = _CaptureThread(read_frame, name='test-capture')
+        thread.start()
+        assert failed.wait(timeout=1.0)
+        thread.join(timeout=1.0)
+        with pytest.raises(RuntimeError):
+            thread.latest(timeout=0.0)
+
+    def test_timeout_without_frame_returns_none(self):
+        release = threading.Event()
+
+        def read_frame():
+            release.wait()
+            return np.zeros((4, 4, 3), dtype=np.uint8)
+
+        thread = _CaptureThread(read_frame, name='test-capture')
+        thread.start()
+        try:
+            assert thread.latest(timeout=0.05) is None
+        finally:
+            release.set()
+            thread.stop(timeout=1.0)
@@ -0,0 +1,231 @@
+# Tests for Engine 2 Tracking
+
+import numpy as np
+import pytest
+
+from blocks._2_cognitive_trinity.engines.engine_2_persistence.src.tracking.botsort import BotSORT
+from blocks._2_cognitive_trinity.engines.engine_2_persistence.src.interfaces import Track, TrackState
+from blocks._2_cognitive_trinity.engines.engine_2_persistence.src.memory import TrackMemory
+from blocks._2_cognitive_trinity.engines.engine_2_persistence.src.tracking import association
+from blocks._2_cognitive_trinity.engines.engine_2_persistence.src.tracking.association import (
+    associate_detections,
+    compute_cosine_distance,
+    compute_iou_matrix,
+    hungarian_matching
+)
+from blocks._2_cognitive_trinity.engines.engine_2_persistence.src.reid.ema import quantize_embeddings
+
+
+def unit_embedding(dim=8):
+    return np.full(dim, 1.0 / np.sqrt(dim), dtype=np.float32)
+
+
+class TestBotSORTLifecycle:
+    """Track state transitions of BotSORT."""
+
+    @pytest.fixture
+    def tracker(self):
+        return BotSORT(max_age=2, capacity=4, embedding_dim=8)
+
+    def test_unmatched_new_track_sequence(self, tracker):
+        """TENTATIVE -> GHOST on the first missed frame, DELETED past max_age."""
+        tracks = tracker.update([(0, 0, 10, 10)], [unit_embedding()])
+        assert [(t.state, t.time_since_update) for t in tracks] == [(TrackState.TENTATIVE, 0)]
+
+        history = [
+            [(t.state, t.time_since_update) for t in tracker.update([], [])]
+            for _ in range(3)
+        ]
+        assert history == [
+            [(TrackState.GHOST, 1)],
+            [(TrackState.GHOST, 2)],
+            [],
+        ]
+        assert tracker._id_to_row == {}
+
+    def test_deleted_slot_is_reused(self, tracker):
+        tracker.update([(0, 0, 10, 10)], [unit_embedding()])
+        for _ in range(3):
+            tracker.update([], [])
+        tracks = tracker.update([(5, 5, 20, 20)], [unit_embedding()])
+        assert [(t.track_id, t.state) for t in tracks] == [(1, TrackState.TENTATIVE)]
+
+    def test_age_does_not_wrap(self, tracker):
+        tracker.update([(0, 0, 10, 10)], [unit_embedding()])
+        rows = np.array([tracker._id_to_row[0]], dtype=np.int64)
+        tracker._ages[rows] = np.iinfo(np.int16).max
+        tracker._update_tracks(rows, np.array([[0, 0, 10, 10]], dtype=np.float32), unit_embedding()[None])
+        assert int(tracker._ages[rows[0]]) == np.iinfo(np.int16).max + 1
+
+
+def reference_evict_id(tracks):
+    """Baseline eviction: lowest quality among the oldest len // 2 + 1 (LRU order)."""
+    candidates = list(tracks.items())[:len(tracks) // 2 + 1]
+    return min(candidates, key=lambda item: item[1].quality_score)[0]
+
+
+class TestTrackMemory:
+    """LRU eviction and active-track filtering."""
+
+    def test_eviction_restricted_to_lru_half(self):
+        memory = TrackMemory(max_size=4)
+        for tid, quality in enumerate([0.9, 0.5, 0.8, 0.1]):
+            memory.put(Track(track_id=tid, quality_score=quality))
+        memory.get(1)  # LRU order: 0, 2, 3, 1
+
+        memory.put(Track(track_id=4, quality_score=0.0))
+        assert list(memory.tracks) == [0, 2, 1, 4]
+        # New low-quality tracks are not evicted by the next insert
+        memory.put(Track(track_id=5, quality_score=0.0))
+        assert list(memory.tracks) == [0, 2, 4, 5]
+
+    def test_eviction_matches_reference(self):
+        rng = np.random.default_rng(11)
+        memory = TrackMemory(max_size=8)
+        for tid in range(200):
+            if memory.count() and rng.random() < 0.3:
+                memory.get(int(rng.choice(list(memory.tracks))))
+            if memory.count() and rng.random() < 0.2:
+                memory.update_quality(int(rng.choice(list(memory.tracks))), float(rng.random()))
+            expected = reference_evict_id(memory.tracks) if memory.count() == memory.max_size else None
+            memory.put(Track(track_id=tid, quality_score=float(rng.random())))
+            if expected is not None:
+                assert expected not in memory.tracks
+            assert memory.count() == min(tid + 1, memory.max_size)
+
+    def test_get_active_sees_direct_state_changes(self):
+        memory = TrackMemory()
+        for tid in range(3):
+            memory.put(Track(track_id=tid, state=TrackState.ACTIVE))
+        memory.put(Track(track_id=3, state=TrackState.DELETED))
+        memory.get(1).state = TrackState.DELETED
+        assert [t.track_id for t in memory.get_active()] == [0, 2]
+        memory.get(3).state = TrackState.GHOST
+        assert [t.track_id for t in memory.get_active()] == [0, 2, 3]
+
+
+def reference_cosine_distance(features_a, features_b):
+    """Baseline compute_cosine_distance (normalize rows, then 1 - dot)."""
+    a_norm = features_a / (np.linalg.norm(features_a, axis=1, keepdims=True) + 1e-8)
+    b_norm = features_b / (np.linalg.norm(features_b, axis=1, keepdims=True) + 1e-8)
+    return 1.0 - np.dot(a_norm, b_norm.T)
+
+
+def reference_iou(a, b):
+    """Pairwise IoU, one box pair at a time."""
+    out = np.zeros((len(a), len(b)))
+    for i, (ax1, ay1, ax2, ay2) in enumerate(a):
+        for j, (bx1, by1, bx2, by2) in enumerate(b):
+            iw = max(0.0, min(ax2, bx2) - max(ax1, bx1))
+            ih = max(0.0, min(ay2, by2) - max(ay1, by1))
+            inter = iw * ih
+            out[i, j] = inter / ((ax2 - ax1) * (ay2 - ay1) + (bx2 - bx1) * (by2 - by1) - inter)
+    return out
+
+
+def reference_hungarian(cost, threshold):
+    """Plain linear_sum_assignment + per-pair threshold gate."""
+    from scipy.optimize import linear_sum_assignment
+    rows, cols = linear_sum_assignment(cost)
+    matched = {int(r): int(c) for r, c in zip(rows, cols) if cost[r, c] <= threshold}
+    unmatched_dets = [i for i in range(cost.shape[0]) if i not in matched]
+    unmatched_tracks = [j for j in range(cost.shape[1]) if j not in matched.values()]
+    return matched, unmatched_dets, unmatched_tracks
+
+
+def basis(dim, *weights):
+    """Unit vector with the given leading components."""
+    v = np.zeros(dim, dtype=np.float32)
+    v[:len(weights)] = weights
+    return v / np.linalg.norm(v)
+
+
+class TestAssociation:
+    """Matching and gating against fixed IoU / cosine matrices."""
+
+    TRACKS = [(0, 0, 10, 10), (100, 100, 120, 140), (50, 0, 60, 10)]
+    DETECTIONS = [(1, 1, 11, 11), (300, 300, 310, 310), (400, 0, 410, 10)]
+
+    @pytest.fixture(params=['scipy', 'lap'], autouse=True)
+    def backend(self, request, monkeypatch):
+        """Run every test against both assignment backends."""
+        lap = pytest.importorskip('lap') if request.param == 'lap' else None
+        monkeypatch.setattr(association, 'lap', lap)
+        return request.param
+
+    @pytest.fixture
+    def features(self):
+        tracks = np.stack([basis(8, 1), basis(8, 0, 1), basis(8, 0, 0, 1)])
+        dets = np.stack([
+            basis(8, 1),                     # Same as track 0 (also IoU match)
+            basis(8, 0, 0, 0.9, 0.1),        # Close to track 2
+            basis(8, 0, 0, 0, 0, 0, 1),      # Orthogonal to every track
+        ])
+        return dets, tracks
+
+    def test_iou_matrix_matches_reference(self):
+        np.testing.assert_allclose(
+            compute_iou_matrix(self.DETECTIONS, self.TRACKS),
+            reference_iou(self.DETECTIONS, self.TRACKS),
+            atol=1e-6
+        )
+
+    def test_cosine_distance_matches_baseline(self, features):
+        dets, tracks = features
+        expected = reference_cosine_distance(dets, tracks)
+        np.testing.assert_allclose(compute_cosine_distance(dets, tracks), expected, atol=1e-6)
+        # int8 path: within quantization error of the float result
+        np.testing.assert_allclose(
+            compute_cosine_distance(quantize_embeddings(dets), quantize_embeddings(tracks)),
+            expected, atol=2e-2
+        )
+
+    def test_hungarian_rejects_rows_above_threshold(self):
+        cost = np.array([
+            [0.10, 0.90, 0.80],
+            [0.95, 0.97, 0.99],   # Every entry above threshold
+            [0.60, 0.20, 0.90],
+            [0.85, 0.75, 0.50],
+        ], dtype=np.float32)
+        assert hungarian_matching(cost, 0.7) == ({0: 0, 2: 1, 3: 2}, [1], [])
+
+    def test_hungarian_drops_assigned_pair_above_threshold(self):
+        cost = np.array([[0.10, 0.95], [0.96, 0.99]], dtype=np.float32)
+        assert hungarian_matching(cost, 0.5) == ({0: 0}, [1], [1])
+
+    def test_hungarian_all_above_threshold(self):
+        cost = np.full((2, 3), 0.9, dtype=np.float32)
+        assert hungarian_matching(cost, 0.5) == ({}, [0, 1], [0, 1, 2])
+
+    @pytest.mark.parametrize('shape', [(6, 4), (4, 6), (5, 5)])
+    def test_hungarian_matches_reference(self, shape):
+        cost = np.random.default_rng(7).uniform(0.0, 1.0, shape).astype(np.float32)
+        cost[1] = 0.95  # One row entirely above threshold
+        assert hungarian_matching(cost, 0.6) == reference_hungarian(cost, 0.6)
+
+    def test_hungarian_assigns_before_gating(self):
+        # Gating first would leave only {0: 0}; the optimal assignment
+        # pairs 0-1 and 1-0, both within threshold
+        cost = np.array([[0.0, 0.95], [0.95, 5.0]], dtype=np.float32)
+        assert hungarian_matching(cost, 1.0) == ({0: 1, 1: 0}, [], [])
+
+    def test_hungarian_empty(self):
+        assert hungarian_matching(np.zeros((0, 2), dtype=np.float32), 0.5) == ({}, [], [0, 1])
+
+    @pytest.mark.parametrize('quantized', [False, True])
+    def test_associate_detections_two_stage(self, features, quantized):
+        dets, tracks = features
+        if quantized:
+            dets, tracks = quantize_embeddings(dets), quantize_embeddings(tracks)
+        matched, unmatched_dets, unmatched_tracks = associate_detections(
+            self.DETECTIONS, self.TRACKS, dets, tracks
+        )
+        # Det 0 by IoU, det 1 by ReID; det 2 is above both thresholds
+        assert matched == {0: 0, 1: 2}
+        assert unmatched_dets == [2]
+        assert unmatched_tracks == [1]
+
+    def test_associate_detections_empty_sides(self, features):
+        dets, tracks = features
+        assert associate_detections([], self.TRACKS, dets[:0], tracks) == ({}, [], [0, 1, 2])
+        assert associate_detections(self.DETECTIONS, [], dets, tracks[:0]) == ({}, [0, 1, 2], [])